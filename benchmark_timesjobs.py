@@ -0,0 +1,392 @@
+# benchmark_timesjobs.py
+# -*- coding: utf-8 -*-
+"""
+Offline benchmark for the TimesJobs scraper.
+- Starts a local stand-in for TimesJobs in a separate process: mobile fresher
+  search, desktop IT search and both detail layouts, with configurable latency,
+  jitter, error rate and a request rate above which it answers 429
+- Serves synthetic fixture pages, or pages recorded in an HTML cache (--recorded)
+- Runs fresher listing -> fresher details -> IT listing -> IT details -> finalize
+  end to end against it
+- Reports pages/sec, CPU time per page and peak RSS for every stage, so
+  performance changes can be compared on the same footing
+
+Example: python benchmark_timesjobs.py --fresher-pages 40 --it-pages 40 --latency 0.05 --json bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import re
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+import web_scrappig_timesjobs_ as scraper
+
+# --- Synthetic fixture pages (same markup the parsers read on the live site) ---
+COMPANIES = ["Acme Infotech", "Globex Services", "Initech Pvt Ltd", "Umbrella Analytics", "Stark Solutions",
+             "Wayne Enterprises", "Hooli India", "Cyberdyne Systems", "Soylent Foods", "Tyrell Labs"]
+LOCATIONS = ["Bengaluru", "Pune", "Hyderabad", "Chennai", "Noida", "Mumbai", "Kolkata"]
+EXPERIENCE = ["0 - 1 Yrs", "0 - 3 Yrs", "1 - 4 Yrs", "2 - 5 Yrs", "3 - 6 Yrs", "5 - 10 Yrs"]
+SALARY = ["Rs 2.50 - 4.00 Lacs p.a.", "Rs 3.00 - 6.00 Lacs p.a.", "Rs 6.00 - 12.00 Lacs p.a.",
+          "As per industry standards", "Not disclosed"]
+INDUSTRIES = ["IT-Software/Software Services", "BPO/ITES", "Banking/Financial Services", "Education/Training"]
+SKILLS = ["Python", "SQL", "Java", "JavaScript", "Excel", "Communication", "Tally", "AutoCAD", "React", "AWS"]
+WORDS = ["design", "develop", "maintain", "client", "reports", "testing", "support", "data", "team",
+         "modules", "APIs", "customers", "documentation", "sales", "targets", "quality", "process"]
+
+PAGE_HEAD = ('<!DOCTYPE html><html><head><title>{title}</title><meta charset="utf-8">'
+             '<link rel="stylesheet" href="/static/app.css"><script>window.dataLayer=[];</script></head><body>')
+PAGE_TAIL = '<footer><p>&copy; TimesJobs stand-in</p></footer></body></html>'
+
+def padding(rng, kb):
+    """Navigation / footer boilerplate so pages weigh about `kb` KB, like the real ones."""
+    parts, size = [], 0
+    while size < kb * 1024:
+        block = ('<div class="nav-col"><h4>Jobs by {0}</h4><ul class="menu">{1}</ul></div>'
+                 '<script>var cfg_{2}={{"k":"{3}","v":[{4}]}};</script>').format(
+            rng.choice(["City", "Skill", "Company", "Industry"]),
+            "".join(f'<li class="menu-item"><a href="/jobs/{w}-{i}">{w.title()} jobs {i}</a></li>'
+                    for i, w in enumerate(rng.sample(WORDS, 8))),
+            rng.randint(0, 10**6), rng.choice(WORDS), ",".join(str(rng.randint(0, 999)) for _ in range(20)))
+        parts.append(block)
+        size += len(block)
+    return "".join(parts)
+
+def sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+def fresher_listing_page(rng, page, jobs_per_page, pages, kb):
+    cards = []
+    if page <= pages:
+        for k in range(jobs_per_page):
+            job_id = (page - 1) * jobs_per_page + k
+            cards.append(f'<div class="srp-listing clearfix"><h3>{rng.choice(WORDS).title()} Trainee</h3>'
+                         f'<span class="srp-comp-name">{rng.choice(COMPANIES)}</span>'
+                         f'<a class="srp-apply-new" href="/mobile/jobs/jobdetail.html?jobid={job_id}&amp;source=srp">'
+                         f'Apply</a></div>')
+    return (PAGE_HEAD.format(title="Fresher jobs") + padding(rng, kb // 2) + "".join(cards)
+            + padding(rng, kb // 2) + PAGE_TAIL)
+
+def it_listing_page(rng, base, page, jobs_per_page, pages, kb):
+    cards = []
+    if page <= pages:
+        for k in range(jobs_per_page):
+            job_id = (page - 1) * jobs_per_page + k
+            cards.append(f'<li class="clearfix job-bx wht-shd-bx"><header><h2>'
+                         f'<a class="posoverlay_srp" href="{base}/job-detail/software-engineer-{job_id}.html'
+                         f'?jobid={job_id}&amp;source=srp">Software Engineer</a></h2>'
+                         f'<h3 class="joblist-comp-name">{rng.choice(COMPANIES)}</h3></header></li>')
+    return (PAGE_HEAD.format(title="IT jobs") + padding(rng, kb // 2) + '<ul class="new-joblist">'
+            + "".join(cards) + "</ul>" + padding(rng, kb // 2) + PAGE_TAIL)
+
+def fresher_detail_page(rng, job_id, kb):
+    return (PAGE_HEAD.format(title=f"Job {job_id}") + padding(rng, kb // 2)
+            + f'<h1 class="jd-job-title">{rng.choice(WORDS).title()} Trainee {job_id}</h1>'
+            f'<h2><span>{rng.choice(COMPANIES)}</span></h2>'
+            f'<span class="posting-time">Posted {rng.randint(1, 30)} days ago</span>'
+            f'<div class="srp-loc">Location: {rng.choice(LOCATIONS)}</div>'
+            f'<div class="srp-exp">\n {rng.choice(EXPERIENCE)}\n</div>'
+            f'<div class="srp-sal">{rng.choice(SALARY)}</div>'
+            f'<div id="JobDescription"><b>Job Responsibilities</b>\n{sentence(rng, rng.randint(30, 120))}\n'
+            f'<b>Education Requirement</b> B.Tech/B.E.\n'
+            f'<b>Skills &amp; Competencies</b> {", ".join(rng.sample(SKILLS, 4))}</div>'
+            f'<ul><li class="clearfix"><label>Industry</label><span class="jd-cont-bx">{rng.choice(INDUSTRIES)}</span></li>'
+            f'<li class="clearfix"><label>Qualification</label><span class="jd-cont-bx">B.Tech/B.E.</span></li>'
+            f'<li class="clearfix"><label>Employment Type</label><span class="jd-cont-bx">Full Time</span></li></ul>'
+            + padding(rng, kb // 2) + PAGE_TAIL)
+
+def it_detail_page(rng, job_id, kb):
+    skills = "".join(f'<span class="jd-skill-tag"><a title="{s} Jobs" href="/jobs/{s.lower()}">{s.lower()}</a></span>'
+                     for s in rng.sample(SKILLS, 5))
+    return (PAGE_HEAD.format(title=f"Job {job_id}") + padding(rng, kb // 2)
+            + f'<h1 class="jd-job-title">Software Engineer {job_id}</h1><h2>{rng.choice(COMPANIES)}</h2>'
+            f'<span class="posted-days">Posted {rng.randint(1, 30)} days ago</span><ul class="top-jd-dtl">'
+            f'<li><i class="location"></i> {rng.choice(LOCATIONS)},  {rng.choice(LOCATIONS)}</li>'
+            f'<li><i class="experience"></i>{rng.choice(EXPERIENCE)}</li>'
+            f'<li><i class="salary"></i>{rng.choice(SALARY)}</li></ul><ul>'
+            f'<li class="clearfix"><label>Industry:</label><span class="basic-info-dtl">{rng.choice(INDUSTRIES)}</span></li>'
+            f'<li class="clearfix"><label>Qualification:</label><span class="basic-info-dtl">B.E./B.Tech</span></li></ul>'
+            f'<span class="mt-4">Full Time</span>{skills}'
+            f'<div class="jd-desc"><p>{sentence(rng, rng.randint(30, 120))}</p><p>{sentence(rng, 20)}</p></div>'
+            + padding(rng, kb // 2) + PAGE_TAIL)
+
+# --- Stand-in server ---
+LIVE_PREFIXES = re.compile(r'https?://(?:m|www)\.timesjobs\.com')
+
+def load_recorded(cache_root, base):
+    """{page kind: [html]} from an HtmlCache folder, with links pointed at the stand-in server."""
+    pages = {}
+    for url, html in scraper.HtmlCache(cache_root).iter_pages():
+        parts = urlsplit(url)
+        html = LIVE_PREFIXES.sub(base, html).replace(f"{parts.scheme}://{parts.netloc}", base)
+        pages.setdefault(scraper.page_kind(url), []).append(html)
+    return pages
+
+def page_kind_for_path(path):
+    if "jobs-search-result" in path:
+        return "fresher_listing"
+    if "job-search" in path:
+        return "it_listing"
+    if path.startswith("/mobile/"):
+        return "fresher_detail"
+    return "it_detail"
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        state = self.server.state
+        parts = urlsplit(self.path)
+        if parts.path == "/__stats":
+            with state["lock"]:
+                self._send(200, json.dumps(state["served"]).encode("utf-8"), "application/json")
+            return
+        kind = page_kind_for_path(parts.path)
+        config = state["config"]
+        with state["lock"]:
+            throttled = self._over_rate(state, config.get("throttle_rate"))
+            failed = state["rng"].random() < config["error_rate"]
+            delay = config["latency"] + state["rng"].uniform(0, config["jitter"])
+        if throttled:
+            with state["lock"]:
+                state["served"]["throttled"] = state["served"].get("throttled", 0) + 1
+            self._send(429, b"Too Many Requests", "text/plain", {"Retry-After": "1"})
+            return
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            with state["lock"]:
+                state["served"]["errors"] = state["served"].get("errors", 0) + 1
+            self._send(503, b"Service Unavailable", "text/plain", {"Retry-After": "0"})
+            return
+        body = self._render(kind, parts).encode("utf-8")
+        with state["lock"]:
+            served = state["served"]
+            served[kind] = served.get(kind, 0) + 1
+            served["bytes"] = served.get("bytes", 0) + len(body)
+        self._send(200, body, "text/html; charset=utf-8")
+
+    @staticmethod
+    def _over_rate(state, limit):
+        """True if `limit` requests were already answered in the last second (call under the lock)."""
+        if not limit:
+            return False
+        now = time.monotonic()
+        recent = state["recent"]
+        while recent and now - recent[0] >= 1.0:
+            recent.popleft()
+        if len(recent) >= limit:
+            return True
+        recent.append(now)
+        return False
+
+    def _render(self, kind, parts):
+        state, config = self.server.state, self.server.state["config"]
+        query = dict(parse_qsl(parts.query))
+        number = int(query.get("sequence") or query.get("jobid") or (re.findall(r"\d+", parts.path) or [0])[-1])
+        recorded = state["recorded"].get(kind)
+        if recorded:
+            return recorded[number % len(recorded)]
+        # Seeded per URL, so the same page always has the same content.
+        rng = random.Random(f"{kind}:{number}")
+        kb = config["page_kb"]
+        if kind == "fresher_listing":
+            return fresher_listing_page(rng, number, config["jobs_per_page"], config["fresher_pages"], kb)
+        if kind == "it_listing":
+            return it_listing_page(rng, state["base"], number, config["jobs_per_page"], config["it_pages"], kb)
+        if kind == "fresher_detail":
+            return fresher_detail_page(rng, number, kb)
+        return it_detail_page(rng, number, kb)
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def serve_stand_in(config, ready):
+    """Process entry point: run the stand-in server until terminated; sends its base URL to `ready`."""
+    ThreadingHTTPServer.request_queue_size = 256
+    server = ThreadingHTTPServer(("127.0.0.1", config["port"]), StandInHandler)
+    server.daemon_threads = True
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    server.state = {
+        "config": config, "base": base, "lock": threading.Lock(), "served": {},
+        "rng": random.Random(config["seed"]), "recent": deque(),
+        "recorded": load_recorded(config["recorded"], base) if config["recorded"] else {},
+    }
+    ready.send(base)
+    server.serve_forever()
+
+class StandInServer:
+    """The stand-in TimesJobs server, running in its own process so its CPU is not measured."""
+
+    def __init__(self, **config):
+        self.config = config
+        self.process = None
+        self.base = None
+
+    def start(self):
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.get_context("spawn").Process(
+            target=serve_stand_in, args=(self.config, sender), daemon=True)
+        self.process.start()
+        sender.close()   # so recv() fails instead of hanging if the server process dies
+        self.base = receiver.recv()
+        return self.base
+
+    def stats(self):
+        with urllib.request.urlopen(f"{self.base}/__stats") as resp:
+            return json.loads(resp.read().decode("utf-8"))
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+
+# --- Harness ---
+def peak_rss_mb():
+    """Peak resident set size of this process and of its largest finished child, in MB."""
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024   # ru_maxrss is bytes on macOS, KB on Linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return round(own, 1), round(children, 1)
+
+def cpu_seconds():
+    """User + system CPU of this process plus its finished children (parse workers)."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+def measure(server, name, func):
+    """Run one stage and return (result, stats dict)."""
+    before = server.stats()
+    cpu0, start = cpu_seconds(), time.perf_counter()
+    with scraper.METRICS.run(name):
+        result = func()
+    wall, cpu = time.perf_counter() - start, cpu_seconds() - cpu0
+    after = server.stats()
+    pages = sum(after.get(k, 0) - before.get(k, 0)
+                for k in ("fresher_listing", "it_listing", "fresher_detail", "it_detail"))
+    rss, child_rss = peak_rss_mb()
+    stats = {
+        "stage": name, "pages": pages, "wall_seconds": round(wall, 3),
+        "pages_per_sec": round(pages / wall, 2) if wall and pages else None,
+        "cpu_seconds": round(cpu, 3),
+        "cpu_ms_per_page": round(cpu * 1000 / pages, 2) if pages else None,
+        "server_errors": after.get("errors", 0) - before.get("errors", 0),
+        "mb_downloaded": round((after.get("bytes", 0) - before.get("bytes", 0)) / 1e6, 2),
+        "peak_rss_mb": rss, "peak_child_rss_mb": child_rss,
+    }
+    print(f"[BENCH] {name}: {pages} pages in {wall:.2f}s ({stats['pages_per_sec']} pages/s), "
+          f"{stats['cpu_ms_per_page']} ms CPU/page, peak RSS {rss} MB")
+    return result, stats
+
+def configure_scraper(args, base, output_dir):
+    scraper.OUTPUT_DIR = output_dir
+    scraper.HTML_CACHE_DIR = scraper.HTML_CACHE_DIR if args.cache else None
+    scraper.FRESHER_SITE = base
+    scraper.FRESHER_SEARCH_URL = base + "/mobile/jobs-search-result.html?cboWorkExp1=0&sequence={}"
+    scraper.IT_SEARCH_URL = base + "/candidate/job-search.html?searchType=personalizedSearch&txtKeywords=software+engineer"
+    scraper.HOST_RATE = args.host_rate
+    scraper.HOST_RATE_MAX = max(scraper.HOST_RATE_MAX, args.host_rate)
+    scraper.HOST_BURST = max(scraper.HOST_BURST, args.concurrency)
+    scraper.FETCH_CONCURRENCY = args.concurrency
+    scraper.PARSER_BACKEND = args.parser
+    scraper.OUTPUT_FORMAT = args.output_format
+    if args.parse_workers is not None:
+        scraper.PARSE_WORKERS = args.parse_workers
+    scraper.RUN_HISTORY_FILE = None
+
+def run_benchmark(args):
+    server = StandInServer(port=args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           throttle_rate=args.throttle_rate, jobs_per_page=args.jobs_per_page, fresher_pages=args.fresher_pages,
+                           it_pages=args.it_pages, page_kb=args.page_kb, recorded=args.recorded, seed=args.seed)
+    base = server.start()
+    output_dir = args.output_dir or tempfile.mkdtemp(prefix="timesjobs-bench-")
+    os.makedirs(output_dir, exist_ok=True)
+    configure_scraper(args, base, output_dir)
+    print(f"[BENCH] Stand-in server at {base}, output in {output_dir}")
+    listing_csv = os.path.join(output_dir, "timesjobs_job_urls.csv")
+    it_listing_csv = os.path.join(output_dir, "timesjobs_ITjob_URL.csv")
+    stages = []
+    try:
+        _, stats = measure(server, "fresher_listing",
+                           lambda: scraper.scrape_fresher_listing_pages(args.fresher_pages))
+        stages.append(stats)
+        fresher_csv, stats = measure(server, "fresher_details",
+                                     lambda: scraper.scrape_fresher_details(listing_csv, limit=args.detail_limit))
+        stages.append(stats)
+        _, stats = measure(server, "it_listing",
+                           lambda: scraper.get_it_job_urls(scraper.IT_SEARCH_URL, num_pages=args.it_pages))
+        stages.append(stats)
+        it_csv, stats = measure(server, "it_details", lambda: scraper.scrape_it_job_details(it_listing_csv))
+        stages.append(stats)
+        _, stats = measure(server, "finalize", lambda: scraper.finalize_and_save(fresher_csv, it_csv))
+        stages.append(stats)
+    finally:
+        server.stop()
+        if not args.output_dir and not args.keep_output:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    pages = sum(s["pages"] for s in stages)
+    wall = sum(s["wall_seconds"] for s in stages)
+    cpu = sum(s["cpu_seconds"] for s in stages)
+    rss, child_rss = peak_rss_mb()
+    total = {"pages": pages, "wall_seconds": round(wall, 3), "pages_per_sec": round(pages / wall, 2),
+             "cpu_ms_per_page": round(cpu * 1000 / pages, 2) if pages else None,
+             "peak_rss_mb": rss, "peak_child_rss_mb": child_rss}
+    print(f"[BENCH] Total: {pages} pages in {wall:.2f}s ({total['pages_per_sec']} pages/s), "
+          f"{total['cpu_ms_per_page']} ms CPU/page, peak RSS {rss} MB (children {child_rss} MB)")
+    result = {"config": {k: v for k, v in vars(args).items() if k != "json"}, "stages": stages, "total": total,
+              "metrics": scraper.METRICS.report()}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, indent=2)
+        print(f"[BENCH] Results written to {args.json}")
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the TimesJobs scraper against a local stand-in server.")
+    parser.add_argument("--fresher-pages", type=int, default=20, help="fresher search pages with results")
+    parser.add_argument("--it-pages", type=int, default=20, help="IT search pages with results")
+    parser.add_argument("--jobs-per-page", type=int, default=25, help="job cards per search page")
+    parser.add_argument("--detail-limit", type=int, default=500, help="fresher detail pages to scrape")
+    parser.add_argument("--page-kb", type=int, default=40, help="approximate size of every synthetic page")
+    parser.add_argument("--latency", type=float, default=0.02, help="server response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="extra random delay, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0,
+                        help="answer 429 once more than this many requests arrive within a second (0 = never)")
+    parser.add_argument("--recorded", metavar="CACHE_DIR",
+                        help="serve pages recorded in this HTML cache folder instead of synthetic ones")
+    parser.add_argument("--host-rate", type=float, default=200.0, help="starting per-host request rate")
+    parser.add_argument("--concurrency", type=int, default=scraper.FETCH_CONCURRENCY, help="fetch threads")
+    parser.add_argument("--parse-workers", type=int, help="parse processes (default: scraper setting)")
+    parser.add_argument("--parser", choices=["auto", "lxml", "html.parser", "selectolax"],
+                        default=scraper.PARSER_BACKEND, help="HTML parser backend")
+    parser.add_argument("--output-format", choices=["parquet", "arrow", "excel"], default=scraper.OUTPUT_FORMAT,
+                        help="format of the final combined dataset")
+    parser.add_argument("--cache", action="store_true", help="keep the HTML cache on (off by default)")
+    parser.add_argument("--port", type=int, default=0, help="stand-in server port (default: any free port)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter and injected errors")
+    parser.add_argument("--output-dir", help="keep the scraper's output here instead of a temporary folder")
+    parser.add_argument("--keep-output", action="store_true", help="do not delete the temporary output folder")
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON to FILE")
+    run_benchmark(parser.parse_args())
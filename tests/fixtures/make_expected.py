@@ -0,0 +1,86 @@
+"""Regenerate expected.json: the records the original extractors produce for the fixture pages.
+
+The original script is loaded from git (the first commit, before any parser
+changes) and run as it was: html.parser over each full page, with
+postprocess_freshers filling Qualification and Job_Title from the same page.
+Requests are answered from the fixture files.
+
+    python tests/fixtures/make_expected.py [REV]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import types
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FRESHER_DETAILS = ["fresher_detail.html", "fresher_detail_sloppy.html", "fresher_detail_empty.html"]
+IT_DETAILS = ["it_detail.html", "it_detail_sloppy.html"]
+FRESHER_DETAIL_URL = "https://m.timesjobs.com/mobile/jobs/jobdetail.html?jobid={}"
+IT_DETAIL_URL = "https://www.timesjobs.com/job-detail/{}"
+
+def page(name):
+    with open(os.path.join(HERE, name), encoding="utf-8") as fh:
+        return fh.read()
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.pages[url])
+
+def load_original(rev):
+    root = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=HERE, capture_output=True,
+                          text=True, check=True).stdout.strip()
+    if rev is None:
+        rev = subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=root, capture_output=True,
+                             text=True, check=True).stdout.split()[0]
+    source = subprocess.run(["git", "show", f"{rev}:web_scrappig_timesjobs_.py"], cwd=root,
+                            capture_output=True, text=True, check=True).stdout
+    module = types.ModuleType("original_scraper")
+    exec(compile(source, "original_scraper.py", "exec"), module.__dict__)
+    module.time.sleep = lambda seconds: None
+    module.OUTPUT_DIR = tempfile.mkdtemp()
+    return module
+
+def records(df):
+    return [{key: (None if pd.isna(value) else value) for key, value in row.items()}
+            for row in df.astype(object).to_dict("records")]
+
+def main(rev=None):
+    original = load_original(rev)
+    expected = {}
+    listing_url = "https://m.timesjobs.com/mobile/jobs-search-result.html?cboWorkExp1=0&sequence=1"
+    original.new_session = lambda: FakeSession({listing_url: page("fresher_listing.html")})
+    expected["fresher_listing.html"] = original.scrape_fresher_listing_pages(pages=1)
+    search_url = "https://www.timesjobs.com/candidate/job-search.html?txtKeywords=software+engineer"
+    original.new_session = lambda: FakeSession({search_url + "&sequence=1": page("it_listing.html")})
+    expected["it_listing.html"] = original.get_it_job_urls(search_url, num_pages=1)
+
+    for names, url, key, scrape in [
+            (FRESHER_DETAILS, FRESHER_DETAIL_URL, "Job_URL",
+             lambda csv: original.postprocess_freshers(original.scrape_fresher_details(csv))),
+            (IT_DETAILS, IT_DETAIL_URL, "URL", original.scrape_it_job_details)]:
+        pages = {url.format(name): page(name) for name in names}
+        original.new_session = lambda pages=pages: FakeSession(pages)
+        urls_csv = os.path.join(original.OUTPUT_DIR, "urls.csv")
+        pd.DataFrame({key: list(pages)}).to_csv(urls_csv, index=False)
+        expected.update(zip(names, records(scrape(urls_csv))))
+
+    with open(os.path.join(HERE, "expected.json"), "w", encoding="utf-8") as fh:
+        json.dump(expected, fh, indent=2, ensure_ascii=False)
+        fh.write("\n")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,74 @@
+"""KeywordClassifier: whole-word, longest-keyword matches and the rule tables' priority order."""
+
+import re
+
+import pytest
+
+import web_scrappig_timesjobs_ as scraper
+
+TITLES = scraper.KeywordClassifier(scraper.TITLE_RULES)
+INDUSTRIES = scraper.KeywordClassifier(scraper.INDUSTRY_RULES)
+SKILLS = scraper.KeywordClassifier(scraper.SKILL_RULES)
+
+@pytest.mark.parametrize("title,group", [
+    ("Store Manager", "Operations / Logistics"),          # Operations is listed ahead of Management
+    ("Data Entry Operator", "HR / Admin"),                # "data entry" beats the higher-priority "data"
+    ("Data Analyst", "Data / Analytics"),
+    ("Database Administrator", "Other"),                  # "data" only matches as a whole word
+    ("Network Engineer", "Network / IT Support"),
+    ("Software Test Engineer", "QA / Testing"),           # QA is listed ahead of Software Development
+    ("Senior Java Developer - Pune", "Software Development"),
+    ("Javascript Developer", "Software Development"),
+    ("Team Leader - Voice Process", "Customer Service"),  # ahead of Management
+    ("Graduate Trainee", "Trainee / Intern"),
+    ("Chef", "Other"),
+    ("", None),
+    (None, None),
+])
+def test_title_groups(title, group):
+    assert TITLES.classify(title) == group
+
+@pytest.mark.parametrize("industry,group", [
+    ("IT-Software/Software Services", "IT / Software"),
+    ("BPO/ITES/CRM/Transcription", "BPO / ITES"),         # BPO is listed ahead of IT ("crm")
+    ("Networking", "IT / Software"),
+    ("Telecom/ Networking", "IT / Software"),             # IT is listed ahead of Telecom
+    ("Banking/ Financial Services/ Broking", "Banking / Finance"),
+    ("Pharma/Biotech/Clinical Research", "Healthcare / Pharma"),
+    ("Agriculture/Dairy", "Other"),
+])
+def test_industry_groups(industry, group):
+    assert INDUSTRIES.classify(industry) == group
+
+@pytest.mark.parametrize("skills,groups", [
+    ("Java, JavaScript, SQL", "Programming, Data / Analytics"),
+    ("c, c++, c#", "Programming"),
+    ("Data Analysis, Excel", "Data / Analytics, Office / Accounting"),
+    ("networking, ccna", "Networking / Security"),
+    ("driving", "Other"),
+    (None, None),
+])
+def test_skill_tags(skills, groups):
+    assert SKILLS.tags(skills) == groups
+
+@pytest.mark.parametrize("text,group", [
+    ("Network Engineer", "short"),
+    ("Networking Engineer", "long"),       # the longer keyword wins over a higher-priority prefix
+    ("Networks", "Other"),
+])
+def test_longest_keyword_wins_over_priority(text, group):
+    rules = [("short", ["network"]), ("long", ["networking"])]
+    assert scraper.KeywordClassifier(rules).classify(text) == group
+    assert scraper.KeywordClassifier(rules, trie=False).classify(text) == group
+
+def test_trie_pattern_matches_exactly_its_words():
+    words = ["data", "data entry", "database", "java", "javascript"]
+    pattern = re.compile(f"(?:{scraper.trie_pattern(words)})$")
+    assert all(pattern.match(word) for word in words)
+    assert not any(pattern.match(word) for word in ["dat", "data ", "javas", "datab"])
+
+def test_column_classifies_each_distinct_value_once():
+    classifier = scraper.KeywordClassifier(scraper.TITLE_RULES)
+    groups = classifier.column(["Store Manager", None, "Store Manager", "Chef"])
+    assert list(groups) == ["Operations / Logistics", None, "Operations / Logistics", "Other"]
+    assert set(classifier.cache[False]) == {"Store Manager", "Chef"}
@@ -0,0 +1,127 @@
+"""Refresh runs revalidate known postings against a server that sends ETag / Last-Modified."""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+import web_scrappig_timesjobs_ as scraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+with open(os.path.join(FIXTURES, "it_detail.html"), encoding="utf-8") as fh:
+    TEMPLATE = fh.read()
+
+def posting(title):
+    return TEMPLATE.replace("Software Engineer - Backend", title)
+
+class ValidatorHandler(BaseHTTPRequestHandler):
+    """Serves server.pages[path] = {"body", "etag", "last_modified"}; answers matching validators with 304."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        page = self.server.pages[self.path]
+        etag, last_modified = page.get("etag"), page.get("last_modified")
+        not_modified = ((etag and self.headers.get("If-None-Match") == etag)
+                        or (last_modified and not self.headers.get("If-None-Match")
+                            and self.headers.get("If-Modified-Since") == last_modified))
+        with self.server.lock:
+            self.server.log.append((self.path, 304 if not_modified else 200))
+        self.send_response(304 if not_modified else 200)
+        if etag:
+            self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", last_modified)
+        body = b"" if not_modified else page["body"].encode("utf-8")
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ValidatorHandler)
+    httpd.daemon_threads = True
+    httpd.pages, httpd.log, httpd.lock = {}, [], threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "HTML_CACHE_DIR", None)
+    monkeypatch.setattr(scraper, "REPLAY", False)
+    monkeypatch.setattr(scraper, "INCREMENTAL", False)
+    monkeypatch.setattr(scraper, "PARSE_WORKERS", 0)    # parse in this process, so parses can be counted
+    return tmp_path
+
+def scrape(server, paths, out_path, parsed, refresh=False):
+    def parse(url, html, backend=None):
+        parsed.append(url)
+        return scraper.parse_it_job_detail(url, html, backend)
+    engine = scraper.FetchEngine(concurrency=2, rate=1000, burst=1000, stage="test_details")
+    urls = [server.base + path for path in paths]
+    server.log.clear()
+    rows = scraper.run_detail_stage("test_details", "TEST", "it", urls, parse, engine, out_path,
+                                    incremental=refresh, refresh=refresh)
+    return rows, pd.read_csv(out_path)
+
+def test_refresh_revalidates_known_postings(server, settings):
+    server.pages.update({
+        "/etag": {"body": posting("ETag posting"), "etag": '"v1"'},
+        "/modified": {"body": posting("Last-Modified posting"), "last_modified": "Mon, 05 Oct 2026 10:00:00 GMT"},
+        "/same": {"body": posting("Unchanged posting")},
+        "/changed": {"body": posting("Posting before the edit")},
+        "/etag-changed": {"body": posting("ETag posting before the edit"), "etag": '"a1"'},
+    })
+    paths = list(server.pages)
+    out_path = os.path.join(settings, "details.csv")
+
+    parsed = []
+    rows, first = scrape(server, paths, out_path, parsed)
+    assert rows == 5 and sorted(parsed) == sorted(server.base + path for path in paths)
+    # Validators (and the body hash) are stored on the first run.
+    frontier = scraper.UrlFrontier()
+    try:
+        stored = {path: frontier.validators(server.base + path) for path in paths}
+    finally:
+        frontier.close()
+    assert stored["/etag"][0] == '"v1"'
+    assert stored["/modified"][1] == "Mon, 05 Oct 2026 10:00:00 GMT"
+    assert all(row is not None and len(row[2]) == 64 for row in stored.values())
+
+    server.pages["/changed"]["body"] = posting("Posting after the edit")
+    server.pages["/etag-changed"].update(body=posting("ETag posting after the edit"), etag='"a2"')
+    parsed = []
+    rows, second = scrape(server, paths, out_path, parsed, refresh=True)
+
+    statuses = dict(server.log)
+    # A matching validator gets a 304 and the old row is kept without parsing.
+    assert statuses["/etag"] == 304 and statuses["/modified"] == 304
+    # No validators and the same body: the hash matches, so the page is not parsed either.
+    assert statuses["/same"] == 200
+    # Changed bodies are parsed again.
+    assert sorted(parsed) == sorted([server.base + "/changed", server.base + "/etag-changed"])
+    assert rows == 5 and list(second["URL"]) == list(first["URL"])
+    titles = dict(zip(second["URL"], second["Job_Title"]))
+    assert titles[server.base + "/etag"] == "ETag posting"
+    assert titles[server.base + "/modified"] == "Last-Modified posting"
+    assert titles[server.base + "/same"] == "Unchanged posting"
+    assert titles[server.base + "/changed"] == "Posting after the edit"
+    assert titles[server.base + "/etag-changed"] == "ETag posting after the edit"
+
+def test_incremental_run_without_earlier_postings_removes_its_journal(server, settings):
+    server.pages["/first"] = {"body": posting("First posting")}
+    out_path = os.path.join(settings, "details.csv")
+    rows, _ = scrape(server, ["/first"], out_path, [], refresh=True)
+    assert rows == 1
+    assert not os.path.exists(os.path.join(settings, scraper.JOURNAL_DIR, "test_details.previous.jsonl"))
@@ -0,0 +1,41 @@
+"""finalize_and_save: Canonical_ID and the skills index line up with the rows actually saved."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import web_scrappig_timesjobs_ as scraper
+
+pytest.importorskip("pyarrow")
+
+def postings(company, urls, skills):
+    return pd.DataFrame({"Company": company, "Job_Title": "Java Developer",
+                         "Description": "Build and maintain REST services for the payments platform team",
+                         "Skills": skills, "URL": urls})
+
+@pytest.mark.parametrize("drop", [False, True])
+def test_canonical_ids_are_rows_of_the_saved_dataset(tmp_path, monkeypatch, drop):
+    monkeypatch.setattr(scraper, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "STREAM_CHUNK_ROWS", 2)
+    monkeypatch.setattr(scraper, "DROP_NEAR_DUPLICATES", drop)
+    unique = pd.DataFrame({"Company": ["Beta", "Gamma"], "Job_Title": ["Accountant", "Nurse"],
+                           "Description": ["Prepare monthly ledgers and tax filings for clients",
+                                           "Care for patients in the cardiology ward on night shifts"],
+                           "Skills": ["Excel", "Patient Care"], "URL": ["u2", "u3"]})
+    # Rows 0, 1 and 4 of the combined input are reposts of one posting.
+    fresher = pd.concat([postings("Acme", ["u0", "u1"], ["Java", "Java, SQL"]), unique], ignore_index=True)
+    it = postings("Acme", ["u4"], ["Java"])
+    out_path = scraper.finalize_and_save(fresher, it, output_format="parquet", export_to_excel=False)
+    saved = pd.read_parquet(out_path)
+    index = scraper.SkillsIndex.load(os.path.join(str(tmp_path), scraper.SKILLS_INDEX_FILE))
+    if drop:
+        assert list(saved["URL"]) == ["u0", "u2", "u3"]
+        assert list(saved["Canonical_ID"]) == [0, 1, 2]
+    else:
+        assert list(saved["Canonical_ID"]) == [0, 0, 2, 3, 0]
+    ids = saved["Canonical_ID"].to_numpy()
+    assert (ids[ids] == ids).all()      # every id names a saved row that is its own canonical row
+    assert index.n_postings == len(saved)
+    assert list(index.postings("excel")) == [int(np.flatnonzero(saved["URL"] == "u2")[0])]
@@ -0,0 +1,62 @@
+"""Salary (LPA) and Experience (years) parsing of the free-text fields."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import web_scrappig_timesjobs_ as scraper
+
+@pytest.mark.parametrize("text,expected", [
+    ("Rs 3.50 - 6.00 Lacs p.a.", (3.5, 6.0)),
+    ("₹ Rs 6.00 - 12.00 Lacs p.a.", (6.0, 12.0)),
+    ("Rs 2.5 LPA", (2.5, 2.5)),
+    ("3 - 5 L", (3.0, 5.0)),
+    ("Rs 1 - 1.5 Crore", (100.0, 150.0)),
+    ("1.2 cr+", (120.0, None)),
+    ("15K - 20K per month", (1.8, 2.4)),
+    ("Rs 15,000 - 20,000 per month", (1.8, 2.4)),
+    ("12000 pm", (1.44, 1.44)),
+    ("Rs. 25000/month", (3.0, 3.0)),
+    ("300000 - 500000", (3.0, 5.0)),
+    ("50K - 1 Lakh", (0.5, 1.0)),             # a unit per bound
+    ("5 Lacs & above", (5.0, None)),
+    ("Up to 4 Lacs p.a.", (None, 4.0)),
+    ("As per industry standards", (None, None)),
+    (None, (None, None)),
+])
+def test_parse_salary(text, expected):
+    assert scraper.parse_salary(text) == expected
+
+@pytest.mark.parametrize("text,expected", [
+    ("0 - 1 Yrs", (0.0, 1.0)),
+    ("card_travel 2 - 5 Yrs", (2.0, 5.0)),
+    ("10 - 15 yrs", (10.0, 15.0)),
+    ("3 - 6 Months", (0.25, 0.5)),
+    ("18 months", (1.5, 1.5)),
+    ("6 months - 1 year", (0.5, 1.0)),        # a unit per bound, converted before ordering
+    ("2 yrs - 6 months", (0.5, 2.0)),
+    ("5+ Yrs", (5.0, None)),
+    ("Up to 2 years", (None, 2.0)),
+    ("Fresher", (0.0, 0.0)),
+    ("Not mentioned", (None, None)),
+    (None, (None, None)),
+])
+def test_parse_experience(text, expected):
+    assert scraper.parse_experience(text) == expected
+
+@pytest.mark.parametrize("low,high,expected", [
+    (0.0, 0.0, "Fresher"), (0.5, 1.0, "Fresher"), (1.0, 3.0, "Junior"), (3.0, 5.0, "Mid-level"),
+    (6.0, None, "Senior"), (None, 2.0, "Junior"), (12.0, 15.0, "Lead"), (None, None, None),
+])
+def test_experience_category(low, high, expected):
+    assert scraper.experience_category(low, high) == expected
+
+def test_normalize_adds_columns_per_row():
+    df = pd.DataFrame({"Salary": ["Rs 3 - 4 Lacs p.a.", None, "Rs 3 - 4 Lacs p.a."],
+                       "Experience": ["0 - 1 Yrs", "7+ Yrs", None]})
+    out = scraper.normalize_salary_experience(df)
+    assert list(out.columns) == ["Salary", "Experience"] + scraper.NORMALIZED_COLUMNS
+    np.testing.assert_array_equal(out["Salary_Min_LPA"], [3.0, np.nan, 3.0])
+    np.testing.assert_array_equal(out["Experience_Max_Years"], [1.0, np.nan, np.nan])
+    assert list(out["Experience_Category"][:2]) == ["Fresher", "Senior"]
+    assert pd.isna(out["Experience_Category"][2])
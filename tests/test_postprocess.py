@@ -0,0 +1,66 @@
+"""postprocess only re-fetches fresher pages for details CSVs written before the fused extractor."""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+import web_scrappig_timesjobs_ as scraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves tests/fixtures/<name> at /<name> and logs every request."""
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.log.append(self.path)
+        with open(os.path.join(FIXTURES, os.path.basename(self.path)), "rb") as fh:
+            body = fh.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    httpd.daemon_threads = True
+    httpd.log, httpd.lock = [], threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "HTML_CACHE_DIR", None)
+    monkeypatch.setattr(scraper, "REPLAY", False)
+    return tmp_path
+
+def test_legacy_details_are_filled_from_the_page(server, settings):
+    details = settings / "timesjobs_job_details.csv"
+    pd.DataFrame({"URL": [server.base + "/fresher_detail.html"], "Company": ["Acme"],
+                  "Qualification": [None]}).to_csv(details, index=False)
+    out = pd.read_csv(scraper.postprocess_freshers(str(details)))
+    assert server.log == ["/fresher_detail.html"]
+    assert out.loc[0, "Qualification"] == "B.Tech/B.E., MCA"
+    assert out.loc[0, "Job_Title"] == "Graduate Trainee (Software)"
+
+def test_fused_details_are_not_refetched(server, settings):
+    details = settings / "timesjobs_job_details.csv"
+    pd.DataFrame({"URL": [server.base + "/fresher_detail_empty.html"], "Company": [None],
+                  "Qualification": [None], "Job_Title": [None]}).to_csv(details, index=False)
+    out_path = scraper.postprocess_freshers(str(details))
+    assert server.log == []
+    assert out_path == str(settings / "jobs_freshers.csv")
+    assert pd.read_csv(out_path)[["Qualification", "Job_Title"]].isna().all().all()
@@ -0,0 +1,116 @@
+"""AdaptiveRateLimiter on a fake clock, and FetchEngine against a stand-in server that throttles."""
+
+import pytest
+
+import benchmark_timesjobs as bench
+import web_scrappig_timesjobs_ as scraper
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(scraper.TokenBucket, "clock", staticmethod(fake))
+    monkeypatch.setattr(scraper.time, "sleep", fake.sleep)
+    return fake
+
+def limiter(rate=4.0, burst=1, min_rate=0.5, max_rate=8.0):
+    return scraper.AdaptiveRateLimiter(rate, burst, min_rate=min_rate, max_rate=max_rate)
+
+@pytest.mark.parametrize("status", [None, 429, 500, 502, 503, 504])
+def test_throttled_or_failed_response_cuts_the_rate(clock, status):
+    bucket = limiter(rate=4.0)
+    bucket.feedback(status, 0.1)
+    assert bucket.rate == pytest.approx(4.0 * scraper.AIMD_DECREASE)
+    assert bucket.decreases == 1
+
+def test_healthy_responses_add_rate(clock):
+    bucket = limiter(rate=2.0)
+    bucket.feedback(200, 0.1)
+    assert bucket.rate == pytest.approx(2.0 + scraper.AIMD_INCREASE / 2.0)
+
+def test_failures_within_the_cooldown_count_once(clock):
+    bucket = limiter(rate=4.0)
+    for _ in range(5):
+        bucket.feedback(429, 0.1)
+    assert bucket.decreases == 1
+    # The cooldown is max(1s, 1 / rate, recent latency); after it a new failure counts again.
+    clock.now += max(1.0, 1.0 / bucket.rate)
+    bucket.feedback(429, 0.1)
+    assert bucket.decreases == 2
+    assert bucket.rate == pytest.approx(4.0 * scraper.AIMD_DECREASE ** 2)
+
+def test_rate_is_clamped_to_min_and_max(clock):
+    bucket = limiter(rate=4.0, min_rate=0.5, max_rate=8.0)
+    for _ in range(20):
+        clock.now += 10
+        bucket.feedback(503)
+    assert bucket.rate == 0.5
+    for _ in range(2000):
+        bucket.feedback(200, 0.1)
+    assert bucket.rate == 8.0
+
+def test_retry_after_pauses_the_host(clock):
+    bucket = limiter(rate=4.0, burst=2)
+    bucket.feedback(429, 0.1, retry_after=5)
+    start = clock.now
+    bucket.acquire()
+    assert clock.now - start >= 5
+    # The pause is capped at RETRY_AFTER_MAX.
+    bucket.feedback(429, 0.1, retry_after=scraper.RETRY_AFTER_MAX * 10)
+    start = clock.now
+    bucket.acquire()
+    assert scraper.RETRY_AFTER_MAX <= clock.now - start < scraper.RETRY_AFTER_MAX + 5
+
+def test_acquire_paces_to_the_rate(clock):
+    bucket = limiter(rate=4.0, burst=1)
+    start = clock.now
+    for _ in range(9):
+        bucket.acquire()
+    assert clock.now - start == pytest.approx(2.0)
+
+def test_latency_rise_backs_off(clock):
+    bucket = limiter(rate=4.0, max_rate=4.0)
+    for _ in range(50):
+        clock.now += 1
+        bucket.feedback(200, 0.1)
+    assert bucket.decreases == 0
+    for _ in range(5):
+        clock.now += 1
+        bucket.feedback(200, 0.1 * scraper.LATENCY_BACKOFF * 3)
+    assert bucket.decreases >= 1
+    assert bucket.rate < 4.0
+
+def test_engine_settles_below_a_throttling_server(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "HTML_CACHE_DIR", None)
+    monkeypatch.setattr(scraper, "REPLAY", False)
+    monkeypatch.setattr(scraper, "HOST_BUDGET_DB", None)
+    monkeypatch.setattr(scraper, "HOST_RATE_MAX", 100.0)
+    server = bench.StandInServer(port=0, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=10,
+                                 jobs_per_page=5, fresher_pages=1, it_pages=1, page_kb=1,
+                                 recorded=None, seed=0)
+    base = server.start()
+    try:
+        engine = scraper.FetchEngine(concurrency=4, rate=40, burst=4, stage="test_throttle")
+        urls = [f"{base}/job-detail/software-engineer-{i}.html?jobid={i}" for i in range(40)]
+        results = list(engine.map(urls))
+        stats = server.stats()
+    finally:
+        server.stop()
+    bucket = scraper.host_bucket(scraper.urlsplit(base).netloc)
+    assert all(err is None and resp.status_code == 200 for _, resp, err in results)
+    assert stats.get("throttled", 0) > 0        # the server did push back ...
+    assert bucket.decreases >= 2                # ... and the limiter backed off from 40 req/s
+    assert bucket.rate <= 15
+    assert stats["throttled"] < len(urls) // 4  # Retry-After pauses and the lower rate keep 429s rare
@@ -0,0 +1,14 @@
+"""Stage commands report missing upstream output as a one-line error, not a traceback."""
+
+import os
+import subprocess
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web_scrappig_timesjobs_.py")
+
+def test_command_without_upstream_output_fails_cleanly(tmp_path):
+    result = subprocess.run([sys.executable, SCRIPT, "extract", "--output-dir", str(tmp_path)],
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 1
+    assert "Traceback" not in result.stderr
+    assert result.stderr.strip() == "[MAIN] stage postprocess has no output yet; run it (or the whole pipeline) first"
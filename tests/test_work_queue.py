@@ -0,0 +1,73 @@
+"""Queue mode: listing pages stop where the results end, and every run crawls afresh."""
+
+import os
+
+import pandas as pd
+
+import benchmark_timesjobs as bench
+import web_scrappig_timesjobs_ as scraper
+
+def stand_in(fresher_pages, it_pages):
+    return bench.StandInServer(port=0, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0, jobs_per_page=2,
+                               fresher_pages=fresher_pages, it_pages=it_pages, page_kb=1, recorded=None, seed=0)
+
+def point_at(monkeypatch, base):
+    monkeypatch.setattr(scraper, "FRESHER_SITE", base)
+    monkeypatch.setattr(scraper, "FRESHER_SEARCH_URL", base + "/mobile/jobs-search-result.html?sequence={}")
+    monkeypatch.setattr(scraper, "IT_SEARCH_URL", base + "/candidate/job-search.html?searchType=x")
+
+def test_queue_listing_stops_after_empty_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "HTML_CACHE_DIR", None)
+    monkeypatch.setattr(scraper, "REPLAY", False)
+    monkeypatch.setattr(scraper, "HOST_BUDGET_DB", None)
+    monkeypatch.setattr(scraper, "HOST_RATE", 200.0)
+    monkeypatch.setattr(scraper, "HOST_RATE_MAX", 200.0)
+    monkeypatch.setattr(scraper, "FRESHER_DETAIL_LIMIT", None)
+    monkeypatch.setattr(scraper, "QUEUE_LISTING_WINDOW", 4)
+    monkeypatch.setattr(scraper, "LISTING_STOP_AFTER", 2)
+    server = stand_in(fresher_pages=3, it_pages=2)
+    base = server.start()
+    try:
+        point_at(monkeypatch, base)
+        work_queue = scraper.WorkQueue(str(tmp_path / "queue.sqlite"))
+        scraper.seed_work_queue(work_queue, fresher_pages=40, it_pages=40)
+        scraper.run_queue_worker(work_queue.path, "test-worker")
+        stats = server.stats()
+        counts = work_queue.counts()
+        work_queue.close()
+    finally:
+        server.stop()
+    # fresher: pages 1-4 (4 is empty), then 5-8 make the empty streak; IT: 3 and 4 end it in the first window
+    assert stats["fresher_listing"] == 8
+    assert stats["it_listing"] == 4
+    assert counts["fresher_detail"] == {"done": 6}
+    assert counts["it_detail"] == {"done": 4}
+
+def test_a_second_queue_run_crawls_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper, "HTML_CACHE_DIR", None)
+    monkeypatch.setattr(scraper, "REPLAY", False)
+    monkeypatch.setattr(scraper, "HOST_RATE", 200.0)
+    monkeypatch.setattr(scraper, "HOST_RATE_MAX", 200.0)
+    monkeypatch.setattr(scraper, "FRESHER_DETAIL_LIMIT", None)
+    monkeypatch.setattr(scraper, "FRESHER_PAGES", 10)
+    monkeypatch.setattr(scraper, "IT_PAGES", 10)
+    queue_path = str(tmp_path / "queue.sqlite")
+    served = []
+    # The second site lists more postings, all under new URLs.
+    for fresher_pages, it_pages in [(1, 1), (3, 2)]:
+        server = stand_in(fresher_pages, it_pages)
+        base = server.start()
+        try:
+            point_at(monkeypatch, base)
+            scraper.run_queue_crawl(workers=1, queue_path=queue_path)
+            served.append(server.stats())
+        finally:
+            server.stop()
+        assert not os.path.exists(queue_path)     # merged, so the next run starts a new queue
+    details = pd.read_csv(tmp_path / "timesjobs_job_details.csv")
+    it_details = pd.read_csv(tmp_path / "timesjobs_ITjobs.csv")
+    assert served[1]["fresher_listing"] > 0 and served[1]["fresher_detail"] == 6
+    assert len(details) == 6 and details["URL"].str.startswith(base).all()
+    assert len(it_details) == 4 and it_details["URL"].str.startswith(base).all()
@@ -2,29 +2,85 @@
 # -*- coding: utf-8 -*-
 """
 Combined TimesJobs scraping script (local-machine friendly).
-- Scrapes fresher job listing pages (mobile site) for 500 pages by default
+- Scrapes fresher job listing pages (mobile site), up to 500 pages by default, stopping
+  where the results end (optionally probing for the last page first)
 - Saves listing URLs to timesjobs_job_urls.csv
 - Scrapes details for first 100 fresher URLs (mirrors your original)
-- Extracts qualification & job title (with helper functions)
+- Extracts qualification & job title in the same pass as the other detail fields
 - Extracts skills & description from job description text
 - Scrapes IT job listing pages (200 pages by default) and details
-- Concatenates fresher + IT datasets and saves final Excel
+- Concatenates fresher + IT datasets into a columnar (Parquet/Arrow) dataset, Excel optional
+- Normalizes Salary to min/max LPA and Experience to min/max years plus a category
+- Bins Industry, Job_Title and Skills into groups with keyword rule tables compiled
+  into one regex per table (Industry_Group, Title_Group, Skill_Groups)
+- Tags near-duplicate postings (MinHash + LSH over company, title and description)
+  with a Canonical_ID per cluster
+- Saves a skills index (CSR posting x skill matrix + inverted index) for demand queries
+- Detail pages are fetched concurrently, paced by a per-host token bucket whose
+  rate adapts to the server's responses (AIMD, Retry-After honoured)
+- Keeps every fetched page in a compressed on-disk cache; --replay re-parses offline
+- --workers N leases listing pages and detail URLs to N processes through a SQLite
+  work queue (leases time out and failed items are retried); machines sharing the
+  queue file join with --worker-only, all under one per-host rate budget
+- Stages stream their records through chunked CSV files (and the journal keeps
+  only offsets in memory), so peak memory does not grow with the crawl
+- Stages form a small graph: each reruns only when its inputs (by content hash),
+  settings or code changed, and the fresher and IT chains run in parallel
+- Commands run a single stage on the files already on disk (list-fresher,
+  details-fresher, postprocess, extract, list-it, details-it, finalize), e.g.
+  `python web_scrappig_timesjobs_.py extract --output-dir out`; with none, the whole
+  pipeline runs. requests/bs4/pandas/numpy are imported only once a stage needs them
+- Writes a JSON run report (latency histograms, status codes, bytes, parse/write/wait
+  time, records/sec per stage), optionally as Prometheus text or a /metrics endpoint
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import time
 import random
 import re
 import os
 import sys
-from requests.adapters import HTTPAdapter, Retry
+import threading
+import hashlib
+import json
+import gzip
+import zlib
+import argparse
+import importlib.util
+import inspect
+import email.utils
+import queue
+import multiprocessing
+import sqlite3
+import socket
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import importlib
 import warnings
 
-# Disable insecure request warnings when verify=False is used.
-from requests.packages.urllib3.exceptions import InsecureRequestWarning
-warnings.simplefilter('ignore', InsecureRequestWarning)
+# requests, bs4, pandas and numpy take most of a second to import. They are only
+# loaded when a stage first uses them, so --help, benchmarks of other parts and
+# single-stage runs that never touch them start quickly.
+class _LazyModule:
+    """Stand-in for a module, imported on first attribute access.
+
+    The import then replaces this object in the module globals, so later
+    lookups go straight to the real module.
+    """
+
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+requests = _LazyModule("requests", "requests")
+bs4 = _LazyModule("bs4", "bs4")
+pd = _LazyModule("pandas", "pd")
+np = _LazyModule("numpy", "np")
 
 # --- Configuration (keep these as original defaults; change if you want) ---
 FRESHER_PAGES = 500          # original code used range(1, 500)
@@ -32,173 +88,1656 @@ FRESHER_DETAIL_LIMIT = 100   # original: loop through first 100 job URLs for det
 IT_PAGES = 200               # original code scraped 200 pages
 OUTPUT_DIR = "."             # change to folder if desired
 
+# Where the two search listings live (point these at a stand-in server to benchmark offline).
+FRESHER_SITE = "https://m.timesjobs.com"    # also the prefix for relative fresher detail links
+FRESHER_SEARCH_URL = FRESHER_SITE + "/mobile/jobs-search-result.html?cboWorkExp1=0&sequence={}"
+IT_SEARCH_URL = ("https://www.timesjobs.com/candidate/job-search.html?"
+                 "searchType=personalizedSearch&from=submit&txtKeywords=software+engineer&txtLocation=")
+# FRESHER_PAGES / IT_PAGES are upper bounds: listing crawls stop where the results end.
+LISTING_STOP_AFTER = 2       # consecutive pages without new job URLs that end a listing crawl; 0 = walk all
+LISTING_PROBE = False        # find the last page by exponential + binary probing, then fetch the range concurrently
+
+# Detail-page fetching runs concurrently; politeness is enforced per host instead
+# of by sleeping after every page. Each host's rate adapts to how the server copes
+# (AIMD): it creeps up while responses are fast and healthy and is cut on 429/5xx
+# or rising latency; Retry-After pauses the host.
+FETCH_CONCURRENCY = 8        # detail requests in flight at once
+HOST_RATE = 0.5              # starting requests per second for any one host
+HOST_BURST = 2               # requests a host may receive back-to-back before pacing kicks in
+HOST_RATE_MIN = 0.1          # the rate is never cut below this
+HOST_RATE_MAX = 4.0          # ... nor raised above this
+AIMD_INCREASE = 0.05         # req/s added per second of healthy responses
+AIMD_DECREASE = 0.5          # rate multiplier on a throttled / failed / slow response
+LATENCY_BACKOFF = 2.0        # "slow" = recent latency above this multiple of the long-run latency
+FETCH_RETRIES = 3            # retries of a request that failed or got a RETRY_STATUSES response
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_AFTER_MAX = 300        # longest Retry-After (seconds) we are willing to honour
+HOST_BUDGET_DB = None        # SQLite file holding per-host limiter state shared by queue workers
+
+# Every fetched page is kept in an on-disk cache so parsers can be re-run offline.
+HTML_CACHE_DIR = "html_cache"  # folder under OUTPUT_DIR; set to None to disable caching
+REPLAY = False                 # serve every request from the cache, never touch the network
+
+# HTML parser used for every page: "html.parser" (the original parser, building only
+# the subtrees the extractors read), "lxml", "auto" (lxml when installed, else
+# html.parser) or "selectolax" (C parser, listing pages only; detail pages then use
+# lxml/html.parser). lxml and selectolax are faster but opt-in: they repair sloppy
+# markup differently (e.g. unclosed <li>), so a few fields can differ from html.parser;
+# run --check-parser-parity on the HTML cache before switching.
+PARSER_BACKEND = "html.parser"
+
+# Detail scraping is a fetch -> parse -> write pipeline; parsing runs in worker processes.
+PARSE_WORKERS = os.cpu_count() or 1   # parse processes; 0 or 1 parses in the main process
+PIPELINE_QUEUE_SIZE = 64              # fetched pages / parses allowed to wait between stages
+
+# Each scraping stage appends finished pages/URLs to a journal so a crash can resume.
+JOURNAL_DIR = "journal"      # folder under OUTPUT_DIR
+JOURNAL_FSYNC_EVERY = 20     # journal entries written between fsyncs
+
+# Every job URL ever listed is remembered in a SQLite frontier (under OUTPUT_DIR).
+FRONTIER_DB = "frontier.sqlite"
+INCREMENTAL = False          # re-run listings, but only fetch details for postings never scraped
+REFRESH = False              # incremental runs also revalidate known postings (conditional GET)
+
+# Stages pass records to each other through CSV files read and written in chunks,
+# so memory stays flat however large the crawl gets.
+STREAM_CHUNK_ROWS = 50000    # rows per chunk read or written by a stage
+RERUN_STAGES = []            # stages to redo even if up to date (see build_stage_graph for names)
+
+# Work-queue mode: listing pages and detail URLs are leased to several worker
+# processes (here or on other machines sharing the queue file), then merged.
+QUEUE_WORKERS = 0            # local worker processes; 0 runs the stages in this process as usual
+QUEUE_DB = "work_queue.sqlite"  # under OUTPUT_DIR unless a path is given with --queue
+QUEUE_BATCH = 32             # tasks leased at a time
+QUEUE_LISTING_WINDOW = 8     # listing pages queued at a time; the next window only if LISTING_STOP_AFTER allows
+QUEUE_LEASE_SECONDS = 600    # a lease not completed by then goes back to the queue
+QUEUE_MAX_ATTEMPTS = 4       # attempts (incl. expired leases) before a task is marked failed
+QUEUE_POLL_SECONDS = 2.0     # idle wait while other workers still hold leases
+QUEUE_PATH = None            # queue file shared with other machines (default OUTPUT_DIR/QUEUE_DB)
+
+# Final dataset sink. "parquet" / "arrow" write a folder of columnar part files
+# (Timesjobs_data.parquet / Timesjobs_data.arrow) and need pyarrow; "excel" is the
+# original single Timesjobs_data.xlsx. EXPORT_EXCEL additionally exports the
+# columnar dataset to Excel as a downstream step.
+OUTPUT_FORMAT = "parquet"
+EXPORT_EXCEL = False
+COLUMNAR_CHUNK_ROWS = 50000  # rows per part file
+CATEGORICAL_COLUMNS = ["Company", "Industry", "Location", "Experience",
+                       "Experience_Category", "Industry_Group", "Title_Group"]  # dictionary-encoded
+NUMERIC_COLUMNS = ["Salary_Min_LPA", "Salary_Max_LPA",
+                   "Experience_Min_Years", "Experience_Max_Years"]  # stored as float64
+INTEGER_COLUMNS = ["Canonical_ID"]                                  # stored as int64
+NORMALIZE_FIELDS = True      # add numeric Salary (LPA) / Experience (years) columns to the final dataset
+SKILLS_INDEX_FILE = "Timesjobs_skills.npz"  # skill vocabulary + CSR matrix saved next to the dataset; None = skip
+
+# Every stage records request latency, status codes, bytes, parse / write / wait time
+# and records/sec; main() writes them to a JSON run report (under OUTPUT_DIR).
+RUN_REPORT_FILE = "run_report.json"
+RUN_HISTORY_FILE = "run_history.jsonl"   # one report per line, appended every run; None to disable
+PROMETHEUS_FILE = None                   # e.g. "metrics.prom" to also write Prometheus text
+METRICS_PORT = None                      # serve Prometheus /metrics on this port while running
+METRICS_HOST = "127.0.0.1"               # interface for METRICS_PORT; "0.0.0.0" exposes it on every interface
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]   # seconds
+PARSE_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1]
+
 # Create a requests Session with retries
-def new_session():
+# (the FetchEngine retries bad statuses itself, so its sessions only retry connection errors)
+def new_session(retry_statuses=True):
+    from requests.adapters import HTTPAdapter, Retry
+    # Disable insecure request warnings when verify=False is used.
+    from urllib3.exceptions import InsecureRequestWarning
+    warnings.simplefilter('ignore', InsecureRequestWarning)
     s = requests.Session()
-    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    # (urllib3 would otherwise still retry 413/429/503 responses carrying Retry-After)
+    retries = Retry(total=3, backoff_factor=0.5,
+                    status_forcelist=list(RETRY_STATUSES) if retry_statuses else [],
+                    respect_retry_after_header=retry_statuses)
     s.mount("https://", HTTPAdapter(max_retries=retries))
     s.mount("http://", HTTPAdapter(max_retries=retries))
+    cache = get_html_cache()
+    if cache is not None:
+        return CachingSession(s, cache, replay=REPLAY)
     return s
 
-# --- Part 1: Scrape fresher job listing URLs (mobile site) ---
-def scrape_fresher_listing_pages(pages=FRESHER_PAGES):
-    base_url = "https://m.timesjobs.com/mobile/jobs-search-result.html?cboWorkExp1=0&sequence={}"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    session = new_session()
+# --- HTML cache: content-addressed response store with offline replay ---
+def normalize_url(url):
+    """Canonical form of a job URL: decoded &amp;, lower-case host, sorted query, no fragment."""
+    url = url.replace("&amp;", "&").strip()
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower() or "https", parts.netloc.lower(), parts.path or "/", query, ""))
+
+class CacheMiss(Exception):
+    """Raised in replay mode when a URL was never stored in the cache."""
+
+class HtmlCache:
+    """Gzip-compressed response store, sharded into two-character directories.
+
+    Bodies live under objects/<sha256 of body>.gz, so identical pages are stored
+    once; urls/<sha256 of normalized URL>.json points each URL at its body and
+    keeps the status, encoding and headers needed to rebuild a Response.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, kind, digest, ext):
+        return os.path.join(self.root, kind, digest[:2], digest + ext)
+
+    @staticmethod
+    def _write_atomic(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+
+    def url_key(self, url):
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def store(self, url, resp):
+        body = resp.content
+        body_key = hashlib.sha256(body).hexdigest()
+        body_path = self._path("objects", body_key, ".gz")
+        if not os.path.exists(body_path):
+            self._write_atomic(body_path, gzip.compress(body))
+        meta = {
+            "url": normalize_url(url),
+            "status": resp.status_code,
+            "encoding": resp.encoding,
+            "headers": dict(resp.headers),
+            "body": body_key,
+            "fetched_at": time.time(),
+        }
+        self._write_atomic(self._path("urls", self.url_key(url), ".json"), json.dumps(meta).encode("utf-8"))
+
+    def _load_meta(self, path):
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def _build_response(self, meta):
+        with gzip.open(self._path("objects", meta["body"], ".gz"), "rb") as fh:
+            body = fh.read()
+        resp = requests.Response()
+        resp.status_code = meta["status"]
+        resp._content = body
+        resp.encoding = meta["encoding"]
+        resp.headers = requests.structures.CaseInsensitiveDict(meta["headers"])
+        resp.url = meta["url"]
+        return resp
+
+    def load(self, url):
+        """Return a requests.Response rebuilt from the cache, or None if not stored."""
+        path = self._path("urls", self.url_key(url), ".json")
+        if not os.path.exists(path):
+            return None
+        return self._build_response(self._load_meta(path))
+
+    def iter_pages(self, host=None):
+        """Yield (url, html) for every cached page, optionally only for one host."""
+        urls_dir = os.path.join(self.root, "urls")
+        if not os.path.isdir(urls_dir):
+            return
+        for shard in sorted(os.listdir(urls_dir)):
+            for name in sorted(os.listdir(os.path.join(urls_dir, shard))):
+                if not name.endswith(".json"):
+                    continue
+                meta = self._load_meta(os.path.join(urls_dir, shard, name))
+                if host and urlsplit(meta["url"]).netloc != host:
+                    continue
+                yield meta["url"], self._build_response(meta).text
 
-    all_job_urls = []
-    for page in range(1, pages + 1):
-        url = base_url.format(page)
-        print(f"[FRESHER LIST] Scraping page {page} -> {url}")
-        try:
-            resp = session.get(url, headers=headers, timeout=15, verify=False)
-        except Exception as e:
-            print(f"  Request error for page {page}: {e}")
-            continue
+_html_caches = {}
 
-        if resp.status_code != 200:
-            print(f"  Failed to fetch page {page} (Status {resp.status_code})")
-            continue
+def get_html_cache():
+    """The HtmlCache for the current OUTPUT_DIR / HTML_CACHE_DIR, or None when disabled."""
+    if not HTML_CACHE_DIR:
+        if REPLAY:
+            raise RuntimeError("REPLAY needs HTML_CACHE_DIR to be set")
+        return None
+    root = os.path.join(OUTPUT_DIR, HTML_CACHE_DIR)
+    cache = _html_caches.get(root)
+    if cache is None:
+        cache = _html_caches.setdefault(root, HtmlCache(root))
+    return cache
+
+class CachingSession:
+    """Wraps a Session so every GET is written to (or, in replay mode, read from) the cache."""
+
+    def __init__(self, session, cache, replay=False):
+        self.session = session
+        self.cache = cache
+        self.replay = replay
+
+    def get(self, url, **kwargs):
+        if self.replay:
+            resp = self.cache.load(url)
+            if resp is None:
+                raise CacheMiss(f"{url} is not in the HTML cache")
+            return resp
+        resp = self.session.get(url, **kwargs)
+        if resp.status_code == 200:
+            self.cache.store(url, resp)
+        return resp
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+# --- Run metrics: per-stage latency / parse histograms, counters, JSON + Prometheus output ---
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense (`bounds` are upper limits)."""
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)   # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        i = 0
+        while i < len(self.bounds) and value > self.bounds[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (None if empty or past the last bound)."""
+        if not self.count:
+            return None
+        target, seen = q * self.count, 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return None
+
+    def cumulative(self):
+        """[(le, cumulative count)] including the +Inf bucket."""
+        running, result = 0, []
+        for bound, n in zip(self.bounds + [float("inf")], self.counts):
+            running += n
+            result.append((bound, running))
+        return result
+
+    def to_dict(self):
+        return {"count": self.count, "sum": round(self.sum, 6),
+                "mean": round(self.sum / self.count, 6) if self.count else None,
+                "p50": self.quantile(0.5), "p90": self.quantile(0.9), "p99": self.quantile(0.99),
+                "buckets": {("+Inf" if le == float("inf") else str(le)): n for le, n in self.cumulative()}}
+
+class StageMetrics:
+    """Counters for one stage; safe to update from fetch threads."""
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.parse = Histogram(PARSE_BUCKETS)
+        self.statuses = {}
+        self.bytes = 0
+        self.errors = 0
+        self.retries = 0
+        self.sleep_seconds = 0.0
+        self.write_seconds = 0.0
+        self.wall_seconds = 0.0
+        self.records = 0
+
+    def observe_request(self, status, latency, nbytes):
+        with self.lock:
+            self.latency.observe(latency)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes += nbytes
+
+    def observe_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def observe_parse(self, seconds):
+        with self.lock:
+            self.parse.observe(seconds)
+
+    def add(self, field, amount):
+        """Add to one of the plain counters (retries, sleep_seconds, write_seconds, records, ...)."""
+        with self.lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def timed(self, kind):
+        """Context manager timing a block as "parse" (histogram) or "write" / "sleep" seconds."""
+        metrics = self
+
+        class _Timer:
+            def __enter__(self):
+                self.start = time.perf_counter()
+
+            def __exit__(self, *exc):
+                elapsed = time.perf_counter() - self.start
+                if kind == "parse":
+                    metrics.observe_parse(elapsed)
+                else:
+                    metrics.add(f"{kind}_seconds", elapsed)
+
+        return _Timer()
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                "wall_seconds": round(self.wall_seconds, 3),
+                "records": self.records,
+                "records_per_sec": round(self.records / self.wall_seconds, 3) if self.wall_seconds else None,
+                "requests": self.latency.count,
+                "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+                "errors": self.errors,
+                "retries": self.retries,
+                "bytes": self.bytes,
+                "latency_seconds": self.latency.to_dict(),
+                "parse_seconds": self.parse.to_dict(),
+                "sleep_seconds": round(self.sleep_seconds, 3),
+                "write_seconds": round(self.write_seconds, 3),
+            }
+
+class RunMetrics:
+    """All StageMetrics of one run, plus the report / Prometheus exporters."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.stages = {}
+        self.lock = threading.Lock()
+
+    def stage(self, name):
+        with self.lock:
+            metrics = self.stages.get(name)
+            if metrics is None:
+                metrics = self.stages[name] = StageMetrics(name)
+            return metrics
+
+    def run(self, name):
+        """Context manager adding the block's wall time to stage `name`; yields its StageMetrics."""
+        metrics = self.stage(name)
+
+        class _StageRun:
+            def __enter__(self):
+                self.start = time.perf_counter()
+                return metrics
+
+            def __exit__(self, *exc):
+                metrics.add("wall_seconds", time.perf_counter() - self.start)
+
+        return _StageRun()
+
+    def report(self):
+        return {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "elapsed_seconds": round(time.time() - self.started, 3),
+            "config": {"FETCH_CONCURRENCY": FETCH_CONCURRENCY, "HOST_RATE": HOST_RATE,
+                       "PARSE_WORKERS": PARSE_WORKERS, "PARSER_BACKEND": PARSER_BACKEND,
+                       "REPLAY": REPLAY, "INCREMENTAL": INCREMENTAL, "REFRESH": REFRESH,
+                       "OUTPUT_FORMAT": OUTPUT_FORMAT},
+            "stages": {name: metrics.to_dict() for name, metrics in list(self.stages.items())},
+        }
+
+    def prometheus_text(self):
+        """The metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP timesjobs_{name} {help_text}")
+            lines.append(f"# TYPE timesjobs_{name} {kind}")
+
+        def histogram(name, attr):
+            for stage, metrics in list(self.stages.items()):
+                hist = getattr(metrics, attr)
+                for le, n in hist.cumulative():
+                    le = "+Inf" if le == float("inf") else repr(float(le))
+                    lines.append(f'timesjobs_{name}_bucket{{stage="{stage}",le="{le}"}} {n}')
+                lines.append(f'timesjobs_{name}_sum{{stage="{stage}"}} {hist.sum}')
+                lines.append(f'timesjobs_{name}_count{{stage="{stage}"}} {hist.count}')
+
+        def counter(name, attr):
+            for stage, metrics in list(self.stages.items()):
+                lines.append(f'timesjobs_{name}{{stage="{stage}"}} {getattr(metrics, attr)}')
+
+        family("request_duration_seconds", "histogram", "HTTP request latency.")
+        histogram("request_duration_seconds", "latency")
+        family("parse_duration_seconds", "histogram", "Time to parse one page.")
+        histogram("parse_duration_seconds", "parse")
+        family("responses_total", "counter", "HTTP responses by status code.")
+        for stage, metrics in list(self.stages.items()):
+            for code, n in sorted(metrics.statuses.items()):
+                lines.append(f'timesjobs_responses_total{{stage="{stage}",code="{code}"}} {n}')
+        for name, attr, help_text in [
+                ("request_errors_total", "errors", "Requests that raised instead of returning a response."),
+                ("request_retries_total", "retries", "Requests retried after an error or a retryable status."),
+                ("response_bytes_total", "bytes", "Response body bytes downloaded."),
+                ("sleep_seconds_total", "sleep_seconds", "Time fetch threads spent waiting on the host rate limiter (summed)."),
+                ("write_seconds_total", "write_seconds", "Time spent writing CSV / dataset files."),
+                ("records_total", "records", "Records (URLs, rows) produced."),
+                ("stage_seconds_total", "wall_seconds", "Wall-clock time spent in the stage.")]:
+            family(name, "counter", help_text)
+            counter(name, attr)
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path=None, prometheus_path=None):
+        """Write the JSON run report (and append it to the run history for cross-run comparisons)."""
+        report = self.report()
+        path = path or os.path.join(OUTPUT_DIR, RUN_REPORT_FILE)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        if RUN_HISTORY_FILE:
+            with open(os.path.join(OUTPUT_DIR, RUN_HISTORY_FILE), "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(report) + "\n")
+        prometheus_path = prometheus_path or (os.path.join(OUTPUT_DIR, PROMETHEUS_FILE) if PROMETHEUS_FILE else None)
+        if prometheus_path:
+            with open(prometheus_path, "w", encoding="utf-8") as fh:
+                fh.write(self.prometheus_text())
+        print(f"[METRICS] Run report written to {path}")
+        return report
+
+    def serve(self, port, host=None):
+        """Serve /metrics (Prometheus text) on host:port from a background thread; returns the server."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        run_metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                found = self.path.split("?")[0] in ("/", "/metrics")
+                body = run_metrics.prometheus_text().encode("utf-8") if found else b""
+                self.send_response(200 if found else 404)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host or METRICS_HOST, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+        print(f"[METRICS] Serving Prometheus metrics on http://{server.server_address[0]}:"
+              f"{server.server_address[1]}/metrics")
+        return server
+
+METRICS = RunMetrics()
+
+# --- Fetch engine: concurrent requests with per-host token-bucket limits ---
+class TokenBucket:
+    """Blocking token bucket: refills `rate` tokens per second, holds up to `burst`."""
+
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = self.clock()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _state(self):
+        """Context manager guarding the bucket's state (a plain lock here)."""
+        return self.lock
+
+    def _refill(self, now):
+        if now <= self.updated:     # still inside a pause
+            return
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Take one token, sleeping until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._state():
+                now = self.clock()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds):
+        """Hand out no tokens for `seconds` (and start empty afterwards)."""
+        with self._state():
+            now = self.clock()
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0.0
+            self.updated = self.paused_until
+
+class AdaptiveRateLimiter(TokenBucket):
+    """Token bucket whose rate follows the server's responses (AIMD).
+
+    Every healthy response adds AIMD_INCREASE / rate, i.e. the rate grows by
+    AIMD_INCREASE req/s per second of healthy traffic. A throttled (429/5xx),
+    failed or slow response multiplies the rate by AIMD_DECREASE, at most once
+    per cooldown so a burst of in-flight failures counts as one signal.
+    Retry-After pauses the host for the time the server asked for.
+    """
+
+    def __init__(self, rate, burst=1, min_rate=None, max_rate=None):
+        super().__init__(rate, burst)
+        self.min_rate = HOST_RATE_MIN if min_rate is None else min_rate
+        self.max_rate = HOST_RATE_MAX if max_rate is None else max_rate
+        self.latency_fast = None      # EWMA over the last few responses
+        self.latency_slow = None      # long-run EWMA, the "healthy" baseline
+        self.last_decrease = 0.0
+        self.decreases = 0
+
+    def _set_rate(self, rate):
+        self._refill(self.clock())
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+
+    def _decrease(self, now):
+        cooldown = max(1.0, 1.0 / self.rate, self.latency_fast or 0.0)
+        if now - self.last_decrease >= cooldown:
+            self._set_rate(self.rate * AIMD_DECREASE)
+            self.last_decrease = now
+            self.decreases += 1
+
+    def feedback(self, status=None, latency=None, retry_after=None):
+        """Adjust the rate after a response (`status` None means the request failed)."""
+        with self._state():
+            now = self.clock()
+            slow = False
+            if latency is not None and status is not None and status < 500:
+                if self.latency_fast is None:
+                    self.latency_fast = self.latency_slow = latency
+                else:
+                    self.latency_fast += 0.3 * (latency - self.latency_fast)
+                    self.latency_slow += 0.02 * (latency - self.latency_slow)
+                slow = self.latency_fast > LATENCY_BACKOFF * self.latency_slow
+            if status is None or status in RETRY_STATUSES or slow:
+                self._decrease(now)
+            else:
+                self._set_rate(self.rate + AIMD_INCREASE / self.rate)
+        if retry_after:
+            self.pause(min(retry_after, RETRY_AFTER_MAX))
+
+def retry_after_seconds(resp):
+    """Seconds requested by a Retry-After header (delta or HTTP date), or None."""
+    value = resp.headers.get("Retry-After") if resp is not None else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        job_divs = soup.select("div.srp-listing")
+class SharedRateLimiter(AdaptiveRateLimiter):
+    """AdaptiveRateLimiter whose state lives in a SQLite table, so every process
+    (on any machine) using the same database file draws on one per-host budget.
+
+    Each acquire / feedback is one short write transaction: the row is loaded
+    into the usual attributes, updated by the inherited logic, and saved back.
+    Wall-clock time is used because monotonic clocks differ between processes.
+    """
+
+    clock = staticmethod(time.time)
+    SHARED_FIELDS = ("rate", "tokens", "updated", "paused_until", "latency_fast", "latency_slow",
+                     "last_decrease", "decreases")
+
+    def __init__(self, path, host, rate, burst=1):
+        super().__init__(rate, burst)
+        self.path = path
+        self.host = host
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("CREATE TABLE IF NOT EXISTS host_budget (host TEXT PRIMARY KEY, state TEXT)")
+        conn.execute("INSERT OR IGNORE INTO host_budget (host, state) VALUES (?, ?)",
+                      (host, json.dumps({field: getattr(self, field) for field in self.SHARED_FIELDS})))
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _state(self):
+        limiter = self
+
+        class _SharedState:
+            def __enter__(self):
+                limiter.lock.acquire()
+                self.conn = limiter._conn()
+                self.conn.execute("BEGIN IMMEDIATE")
+                row = self.conn.execute("SELECT state FROM host_budget WHERE host = ?", (limiter.host,)).fetchone()
+                for field, value in json.loads(row[0]).items():
+                    setattr(limiter, field, value)
+
+            def __exit__(self, exc_type, *exc):
+                try:
+                    if exc_type is None:
+                        state = {field: getattr(limiter, field) for field in limiter.SHARED_FIELDS}
+                        self.conn.execute("UPDATE host_budget SET state = ? WHERE host = ?",
+                                          (json.dumps(state), limiter.host))
+                        self.conn.execute("COMMIT")
+                    else:
+                        self.conn.execute("ROLLBACK")
+                finally:
+                    limiter.lock.release()
+
+        return _SharedState()
+
+_host_buckets = {}
+_host_buckets_lock = threading.Lock()
+
+def host_bucket(host, rate=None, burst=None):
+    """Return the process-wide token bucket for `host` (created on first use).
+
+    With HOST_BUDGET_DB set the bucket is a SharedRateLimiter, shared with every
+    other worker using that database.
+    """
+    with _host_buckets_lock:
+        bucket = _host_buckets.get(host)
+        if bucket is None:
+            if HOST_BUDGET_DB:
+                bucket = SharedRateLimiter(HOST_BUDGET_DB, host, rate or HOST_RATE, burst or HOST_BURST)
+            else:
+                bucket = AdaptiveRateLimiter(rate or HOST_RATE, burst or HOST_BURST)
+            _host_buckets[host] = bucket
+        return bucket
+
+class FetchEngine:
+    """Fetch many URLs with a thread pool while respecting per-host rate limits.
+
+    Each worker thread keeps its own Session (Sessions are not thread-safe).
+    Results come back in input order, so callers build exactly the same
+    record lists they did with the old serial loops. Every response is fed
+    back to the host's AdaptiveRateLimiter; errors and RETRY_STATUSES are
+    retried here (up to FETCH_RETRIES times) after the limiter has backed off.
+    """
+
+    def __init__(self, headers=None, concurrency=None, rate=None, burst=None, timeout=15, stage="fetch"):
+        self.headers = headers or {"User-Agent": "Mozilla/5.0"}
+        self.metrics = METRICS.stage(stage)
+        self.concurrency = max(1, concurrency or FETCH_CONCURRENCY)
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = new_session(retry_statuses=False)
+        return session
+
+    def fetch(self, url, extra_headers=None):
+        headers = dict(self.headers, **extra_headers) if extra_headers else self.headers
+        metrics = self.metrics
+        if REPLAY:
+            start = time.monotonic()
+            resp = self._session().get(url, headers=headers, timeout=self.timeout, verify=False)
+            metrics.observe_request(resp.status_code, time.monotonic() - start, len(resp.content))
+            return resp
+        limiter = host_bucket(urlsplit(url).netloc, self.rate, self.burst)
+        for attempt in range(FETCH_RETRIES + 1):
+            if attempt:
+                metrics.add("retries", 1)
+            metrics.add("sleep_seconds", limiter.acquire())
+            start = time.monotonic()
+            try:
+                resp = self._session().get(url, headers=headers, timeout=self.timeout, verify=False)
+            except requests.RequestException:
+                metrics.observe_error()
+                limiter.feedback(None)
+                if attempt == FETCH_RETRIES:
+                    raise
+                continue
+            latency = time.monotonic() - start
+            metrics.observe_request(resp.status_code, latency, len(resp.content))
+            limiter.feedback(resp.status_code, latency, retry_after_seconds(resp))
+            if resp.status_code not in RETRY_STATUSES or attempt == FETCH_RETRIES:
+                return resp
 
-        page_urls = []
-        for div in job_divs:
+    def _fetch_safe(self, url, extra_headers=None):
+        try:
+            return url, self.fetch(url, extra_headers), None
+        except Exception as e:
+            return url, None, e
+
+    def map(self, urls, headers_for=None):
+        """Yield (url, response, error) for each URL, in input order.
+
+        `headers_for(url)` may return extra request headers for that URL.
+        At most 2 * concurrency fetches are outstanding, so memory stays
+        bounded no matter how long `urls` is.
+        """
+        window = self.concurrency * 2
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            pending = deque()
+            for url in urls:
+                extra = headers_for(url) if headers_for else None
+                pending.append(pool.submit(self._fetch_safe, url, extra))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+# --- Stage journal: append-only record of finished work, used to resume a stage ---
+class StageJournal:
+    """Append-only JSONL journal of the work items a stage has completed.
+
+    Every line is {"key": ..., "data": ...}. Opening an existing journal replays
+    it, so a restarted stage skips everything already done. Only each key's byte
+    offset is kept in memory; get() reads the entry back from the file, so a
+    journal of full detail records costs no more RAM than its URLs. Writes are
+    flushed and fsynced every `fsync_every` entries; a torn last line left by
+    a crash is dropped on the next open. Call finish() once the stage's output
+    file is written; the journal is then deleted.
+    """
+
+    def __init__(self, stage, fsync_every=None):
+        self.path = os.path.join(OUTPUT_DIR, JOURNAL_DIR, f"{stage}.jsonl")
+        self.fsync_every = fsync_every or JOURNAL_FSYNC_EVERY
+        self.offsets = {}
+        self._unsynced = 0
+        self._reader = None
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if os.path.exists(self.path):
+            self._replay()
+        self._fh = open(self.path, "ab")
+
+    def _replay(self):
+        good = 0
+        with open(self.path, "rb") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self.offsets[entry["key"]] = good
+                good += len(line)
+        if good != os.path.getsize(self.path):
+            with open(self.path, "r+b") as fh:
+                fh.truncate(good)
+
+    def __contains__(self, key):
+        return key in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get(self, key, default=None):
+        offset = self.offsets.get(key)
+        if offset is None:
+            return default
+        if not self._fh.closed:
+            self._fh.flush()
+        if self._reader is None:
+            self._reader = open(self.path, "rb")
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline()).get("data")
+
+    def record(self, key, data=None):
+        self.offsets[key] = self._fh.tell()
+        self._fh.write((json.dumps({"key": key, "data": data}, ensure_ascii=False) + "\n").encode("utf-8"))
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if not self._fh.closed:
+            self.sync()
+            self._fh.close()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def finish(self):
+        self.close()
+        os.remove(self.path)
+
+# --- URL frontier: every job URL ever listed, deduplicated, with crawl timestamps ---
+class UrlFrontier:
+    """SQLite-backed set of normalized job URLs.
+
+    Listing stages add what they find (first_seen / last_seen are kept per URL);
+    detail stages mark what they scraped (last_scraped), so an incremental run
+    only fetches postings that have never been scraped. Writes are committed
+    every COMMIT_EVERY rows or COMMIT_SECONDS, whichever comes first, so a
+    stage running in parallel is never locked out for long.
+    """
+
+    COMMIT_EVERY = 200
+    COMMIT_SECONDS = 1.0
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(OUTPUT_DIR, FRONTIER_DB)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=60)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                source TEXT,
+                first_seen REAL,
+                last_seen REAL,
+                last_scraped REAL
+            )""")
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(urls)")}
+        for column in ("etag TEXT", "last_modified TEXT", "content_hash TEXT"):
+            if column.split()[0] not in columns:
+                self.conn.execute(f"ALTER TABLE urls ADD COLUMN {column}")
+        self.conn.commit()
+        self._uncommitted = 0
+        self._dirty_since = None
+
+    def add(self, urls, source):
+        """Record listed URLs. Returns them normalized and deduplicated, in first-seen order,
+        plus how many were never seen in any earlier run."""
+        now = time.time()
+        unique_urls = list(dict.fromkeys(normalize_url(url) for url in urls))
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO urls (url, source, first_seen, last_seen) VALUES (?, ?, ?, ?)",
+            ((url, source, now, now) for url in unique_urls))
+        new_count = self.conn.total_changes - before
+        self.conn.executemany("UPDATE urls SET last_seen = ? WHERE url = ?", ((now, url) for url in unique_urls))
+        self.conn.commit()
+        return unique_urls, new_count
+
+    def is_scraped(self, url):
+        row = self.conn.execute("SELECT last_scraped FROM urls WHERE url = ?", (normalize_url(url),)).fetchone()
+        return bool(row and row[0])
+
+    def mark_scraped(self, url, source=None):
+        now = time.time()
+        self.conn.execute(
+            "INSERT INTO urls (url, source, first_seen, last_seen, last_scraped) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET last_scraped = excluded.last_scraped",
+            (normalize_url(url), source, now, now, now))
+        self._mark_dirty()
+
+    def validators(self, url):
+        """(etag, last_modified, content_hash) stored for `url`, or None."""
+        return self.conn.execute("SELECT etag, last_modified, content_hash FROM urls WHERE url = ?",
+                                 (normalize_url(url),)).fetchone()
+
+    def set_validators(self, url, etag, last_modified, content_hash, source=None):
+        now = time.time()
+        self.conn.execute(
+            "INSERT INTO urls (url, source, first_seen, last_seen, etag, last_modified, content_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO UPDATE SET etag = excluded.etag, "
+            "last_modified = excluded.last_modified, content_hash = excluded.content_hash",
+            (normalize_url(url), source, now, now, etag, last_modified, content_hash))
+        self._mark_dirty()
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for re-fetching a known URL."""
+        row = self.validators(url)
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def _mark_dirty(self):
+        self._uncommitted += 1
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        if self._uncommitted >= self.COMMIT_EVERY or now - self._dirty_since >= self.COMMIT_SECONDS:
+            self.commit()
+
+    def commit(self):
+        self.conn.commit()
+        self._uncommitted = 0
+        self._dirty_since = None
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+def load_previous_records(out_path, stage, keep=None):
+    """Rows of an earlier detail CSV keyed by URL (used by incremental runs).
+
+    The rows are copied into a scratch StageJournal named `stage`, so only the
+    URLs stay in memory. `keep(url)` selects which rows to copy. Call finish()
+    on the result when done.
+    """
+    previous = StageJournal(stage)
+    if len(previous):            # left over from a crashed run: rebuild it from the CSV
+        previous.finish()
+        previous = StageJournal(stage)
+    for chunk in iter_frames(out_path):
+        for row in chunk.to_dict("records"):
+            if keep is None or keep(row["URL"]):
+                previous.record(row["URL"], row)
+    return previous
+
+# --- Streaming CSV: stages hand each other files read and written in chunks ---
+# Records are never collected for a whole stage. Every stage reads its input
+# STREAM_CHUNK_ROWS rows at a time and appends its output chunk by chunk, so
+# peak memory depends on the chunk size, not on how big the crawl is.
+def iter_frames(source, chunk_rows=None):
+    """Yield DataFrame chunks of `source`: a CSV path (read lazily) or a DataFrame."""
+    chunk_rows = chunk_rows or STREAM_CHUNK_ROWS
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunk_rows):
+            yield source.iloc[start:start + chunk_rows].copy()
+        return
+    if not source or not os.path.exists(source):
+        return
+    try:
+        reader = pd.read_csv(source, chunksize=chunk_rows)
+    except pd.errors.EmptyDataError:     # a stage that produced no rows
+        return
+    with reader:
+        yield from reader
+
+def frame_columns(source):
+    """Column names of a CSV path or DataFrame, without reading its rows."""
+    if isinstance(source, pd.DataFrame):
+        return list(source.columns)
+    try:
+        return list(pd.read_csv(source, nrows=0).columns) if source and os.path.exists(source) else []
+    except pd.errors.EmptyDataError:
+        return []
+
+class CsvSink:
+    """Append DataFrame chunks or record dicts to a CSV, `batch_rows` records at a time.
+
+    The first chunk fixes the columns (unless given). The file is written as
+    `path + ".tmp"` and renamed when the `with` block ends without an error.
+    run_all_stages skips stages whose CSV exists, so a crash must not leave a
+    half-written one behind.
+    """
+
+    def __init__(self, path, columns=None, batch_rows=None):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.columns = list(columns) if columns else None
+        self.batch_rows = batch_rows or STREAM_CHUNK_ROWS
+        self.rows = 0
+        self._buffer = []
+        self._header = True
+        open(self.tmp_path, "w").close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        elif os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+    def write(self, records):
+        """Add a DataFrame, or an iterable of record dicts."""
+        if isinstance(records, pd.DataFrame):
+            self.flush()
+            self._write_frame(records)
+            return
+        for record in records:
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_rows:
+                self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._write_frame(pd.DataFrame.from_records(self._buffer, columns=self.columns))
+            self._buffer = []
+
+    def _write_frame(self, df):
+        if self.columns is None:
+            self.columns = list(df.columns)
+        df.reindex(columns=self.columns).to_csv(self.tmp_path, mode="a", header=self._header, index=False)
+        self._header = False
+        self.rows += len(df)
+
+    def close(self):
+        self.flush()
+        if self._header and self.columns:
+            pd.DataFrame(columns=self.columns).to_csv(self.tmp_path, index=False)
+        os.replace(self.tmp_path, self.path)
+
+# --- Parser backends: choose the tree builder and only build the subtrees we read ---
+_module_available = {}
+
+def has_module(name):
+    if name not in _module_available:
+        _module_available[name] = importlib.util.find_spec(name) is not None
+    return _module_available[name]
+
+def parser_backend(backend=None):
+    backend = backend or PARSER_BACKEND
+    if backend == "auto":
+        return "lxml" if has_module("lxml") else "html.parser"
+    if backend == "selectolax" and not has_module("selectolax"):
+        raise RuntimeError("PARSER_BACKEND 'selectolax' needs the selectolax package")
+    return backend
+
+TAG_FILTER_CLASS = None      # SoupStrainer subclass, defined on first use so bs4 loads lazily
+
+def tag_filter(keep):
+    """parse_only filter that keeps a tag (and its whole subtree) when keep(name, attrs) is true.
+
+    Tags nested inside a kept tag are always built, so the extractors see the
+    same subtrees they would in a full parse, just without the rest of the page.
+    """
+    global TAG_FILTER_CLASS
+    if TAG_FILTER_CLASS is None:
+        class TagFilter(bs4.SoupStrainer):
+            def __init__(self, keep):
+                super().__init__()
+                self.keep = keep
+
+            def allow_tag_creation(self, nsprefix, name, attrs):  # bs4 >= 4.13
+                return bool(self.keep(name, attrs or {}))
+
+            def search_tag(self, markup_name=None, markup_attrs=None):  # bs4 < 4.13
+                if markup_attrs is None:
+                    markup_attrs = {}
+                return bool(self.keep(markup_name, markup_attrs))
+        TAG_FILTER_CLASS = TagFilter
+    return TAG_FILTER_CLASS(keep)
+
+def _classes(attrs):
+    value = attrs.get("class") or ""
+    return set(value.split() if isinstance(value, str) else value)
+
+def keep_fresher_listing(name, attrs):
+    return name == "div" and "srp-listing" in _classes(attrs)
+
+def keep_it_listing(name, attrs):
+    return name == "li" and "job-bx" in _classes(attrs)
+
+def keep_fresher_detail(name, attrs):
+    if name in ("h1", "h2", "li", "label"):
+        return True
+    if name == "span":
+        return bool(_classes(attrs) & {"posting-time", "jd-cont-bx", "basic-info-dtl"})
+    if name == "div":
+        return attrs.get("id") == "JobDescription" or bool(_classes(attrs) & {"srp-loc", "srp-exp", "srp-sal"})
+    return False
+
+def keep_it_detail(name, attrs):
+    if name in ("h1", "h2", "li"):
+        return True
+    if name == "i":
+        return bool(_classes(attrs) & {"location", "experience", "salary"})
+    if name == "span":
+        return bool(_classes(attrs) & {"posted-days", "mt-4", "jd-skill-tag"})
+    if name == "div":
+        return "jd-desc" in _classes(attrs)
+    return False
+
+def make_soup(html, keep=None, backend=None):
+    """BeautifulSoup tree for `html` built by the configured backend, restricted to `keep`.
+
+    The subtree filter is only used with lxml: html.parser closes unterminated
+    tags based on the tags it has built, so filtering changes its tree on
+    sloppy markup. html.parser therefore always builds the full original tree.
+    """
+    builder = parser_backend(backend)
+    if builder == "selectolax":
+        builder = "lxml" if has_module("lxml") else "html.parser"
+    if builder == "html.parser":
+        return bs4.BeautifulSoup(html, "html.parser")
+    return bs4.BeautifulSoup(html, builder, parse_only=tag_filter(keep) if keep else None)
+
+def selectolax_tree(html):
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:  # selectolax < 0.3.13
+        from selectolax.parser import HTMLParser as LexborHTMLParser
+    return LexborHTMLParser(html)
+
+def parse_fresher_listing(html, backend=None):
+    """Absolute detail URLs from one mobile search-result page."""
+    page_urls = []
+    if parser_backend(backend) == "selectolax":
+        for div in selectolax_tree(html).css("div.srp-listing"):
+            a_tag = div.css_first("a.srp-apply-new")
+            href = a_tag.attributes.get("href") if a_tag else None
+            if href:
+                page_urls.append(href)
+    else:
+        soup = make_soup(html, keep_fresher_listing, backend)
+        for div in soup.select("div.srp-listing"):
             a_tag = div.find("a", class_="srp-apply-new")
             if a_tag and a_tag.get("href"):
-                href = a_tag["href"].replace("&amp;", "&").strip()
-                if href.startswith("/"):
-                    href = f"https://m.timesjobs.com{href}"
-                page_urls.append(href)
+                page_urls.append(a_tag["href"])
+
+    for i, href in enumerate(page_urls):
+        href = href.replace("&amp;", "&").strip()
+        if href.startswith("/"):
+            href = f"{FRESHER_SITE}{href}"
+        page_urls[i] = href
+    return page_urls
+
+def parse_it_listing(html, backend=None):
+    """Detail URLs from one desktop search-result page."""
+    job_links = []
+    if parser_backend(backend) == "selectolax":
+        for li in selectolax_tree(html).css("li"):
+            if " ".join((li.attributes.get("class") or "").split()) != "clearfix job-bx wht-shd-bx":
+                continue
+            a_tag = li.css_first("a.posoverlay_srp[href]")
+            if a_tag:
+                job_links.append(a_tag.attributes.get("href") or "")
+        return job_links
+
+    soup = make_soup(html, keep_it_listing, backend)
+    for job in soup.find_all("li", class_="clearfix job-bx wht-shd-bx"):
+        a_tag = job.find("a", href=True, class_="posoverlay_srp")
+        if a_tag:
+            job_links.append(a_tag["href"])
+    return job_links
+
+def page_kind(url):
+    """Classify a TimesJobs URL as fresher/IT and listing/detail page."""
+    parts = urlsplit(url)
+    if "jobs-search-result" in parts.path:
+        return "fresher_listing"
+    if "job-search" in parts.path:
+        return "it_listing"
+    if parts.netloc.startswith("m.") or "/mobile/" in parts.path:
+        return "fresher_detail"
+    return "it_detail"
+
+def check_parser_parity(backend=None, limit=None):
+    """Re-parse every cached page with full-tree html.parser and with `backend`.
+
+    Prints each page whose extracted URLs/record differ and returns the number
+    of mismatches (None if the cache holds no pages), so a new backend or
+    filter can be proven safe on real pages.
+    """
+    parsers = {
+        "fresher_listing": lambda url, html, b: parse_fresher_listing(html, backend=b),
+        "it_listing": lambda url, html, b: parse_it_listing(html, backend=b),
+        "fresher_detail": parse_fresher_detail,
+        "it_detail": parse_it_job_detail,
+    }
+    cache = get_html_cache()
+    if cache is None:
+        raise RuntimeError("parser parity check needs HTML_CACHE_DIR to be set")
+    checked = mismatches = 0
+    for url, html in cache.iter_pages():
+        if limit is not None and checked >= limit:
+            break
+        parse = parsers[page_kind(url)]
+        expected = parse(url, html, "html.parser")
+        actual = parse(url, html, backend)
+        checked += 1
+        if expected != actual:
+            mismatches += 1
+            print(f"[PARITY] Mismatch ({parser_backend(backend)}) for {url}")
+            if isinstance(expected, dict):
+                for key in expected:
+                    if expected[key] != actual.get(key):
+                        print(f"  {key}: {expected[key]!r} != {actual.get(key)!r}")
+    print(f"[PARITY] {checked} cached pages checked, {mismatches} mismatches")
+    if not checked:
+        # Nothing compared is not a pass (tests/test_parser_parity.py covers the fixture pages).
+        print("[PARITY] The HTML cache is empty; scrape (or --replay) some pages first")
+        return None
+    return mismatches
+
+# --- Detail pipeline: fetch threads -> bounded queue -> parse processes -> writer ---
+NOT_MODIFIED = "Not modified since last scrape"
+
+def timed_parse(parse_func, url, html, backend):
+    """parse_func(url, html, backend) plus the seconds it took (measured where it ran)."""
+    start = time.perf_counter()
+    record = parse_func(url, html, backend)
+    return record, time.perf_counter() - start
+
+def run_detail_pipeline(urls, parse_func, engine, workers=None, queue_size=None,
+                        headers_for=None, on_response=None):
+    """Fetch, parse and hand back detail records as a staged pipeline.
+
+    A fetch thread drives `engine` and puts raw pages on a bounded queue; the
+    calling thread (the writer) feeds them to a process pool running
+    `parse_func(url, html, backend)` and yields `(url, record, problem)` in
+    input order. `problem` is a message when the page was skipped (record is
+    None). Both the queue and the number of outstanding parses are capped at
+    `queue_size`, so a slow stage holds back the others instead of buffering.
+
+    `headers_for` is passed to the engine; `on_response(url, resp)` runs in the
+    calling thread before parsing and returning True skips the parse (the
+    page is reported with problem NOT_MODIFIED).
+    """
+    workers = PARSE_WORKERS if workers is None else workers
+    queue_size = queue_size or PIPELINE_QUEUE_SIZE
+    backend = parser_backend()
+    fetched = queue.Queue(maxsize=queue_size)
+    finished = object()
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                fetched.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch_stage():
+        try:
+            for item in engine.map(urls, headers_for):
+                if not put(item):
+                    return
+        except Exception as e:
+            put((None, None, e))
+        finally:
+            put(finished)
+
+    def resolve(job):
+        url, work, problem = job
+        if problem is not None:
+            return url, None, problem
+        try:
+            record, seconds = work.result() if hasattr(work, "result") else work()
+        except Exception as e:
+            return url, None, f"Error scraping {url}: {e}"
+        engine.metrics.observe_parse(seconds)
+        return url, record, None
+
+    # Spawned (not forked) workers: the fetch threads are already running.
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    fetcher = threading.Thread(target=fetch_stage, name="detail-fetch", daemon=True)
+    fetcher.start()
+    pending = deque()
+    try:
+        while True:
+            item = fetched.get()
+            if item is finished:
+                break
+            url, resp, err = item
+            if err is not None:
+                job = (url, None, f"Error scraping {url}: {err}")
+            elif on_response is not None and on_response(url, resp):
+                job = (url, None, NOT_MODIFIED)
+            elif resp.status_code != 200:
+                job = (url, None, f"Skipping (status {resp.status_code})")
+            elif pool is not None:
+                job = (url, pool.submit(timed_parse, parse_func, url, resp.text, backend), None)
+            else:
+                job = (url, lambda u=url, h=resp.text: timed_parse(parse_func, u, h, backend), None)
+            pending.append(job)
+            while len(pending) >= queue_size:
+                yield resolve(pending.popleft())
+        while pending:
+            yield resolve(pending.popleft())
+    finally:
+        stop.set()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+# --- Detail stage: journal + frontier + pipeline, shared by the fresher and IT scrapers ---
+def run_detail_stage(stage, label, source, urls, parse_func, engine, out_path,
+                     incremental=None, refresh=False, describe=None):
+    """Scrape detail pages for `urls`, write them to `out_path` and return the number of rows.
+
+    Progress is journaled under `stage` so a crashed run resumes. Incremental
+    runs reuse rows of the existing `out_path` for URLs the frontier has seen
+    scraped. With `refresh`, those rows are re-checked instead: the request
+    carries If-None-Match / If-Modified-Since, and a 304 or an unchanged body
+    hash keeps the old row without parsing. Rows keep the order of `urls`.
+    Records are read back from the journals and streamed to `out_path`.
+    """
+    if incremental is None:
+        incremental = INCREMENTAL
+    frontier = UrlFrontier()
+    previous = {}
+    if incremental or refresh:
+        previous = load_previous_records(out_path, f"{stage}.previous", keep=frontier.is_scraped)
+        print(f"[{label}] {'Refresh' if refresh else 'Incremental'}: {len(previous)} previously scraped postings")
+
+    journal = StageJournal(stage)
+    pending = [url for url in dict.fromkeys(urls)
+               if url not in journal and (refresh or url not in previous)]
+    if len(journal):
+        print(f"[{label}] Resuming: {len(journal)} URLs already done, {len(pending)} to go")
+
+    # Looked up here: the engine calls headers_for from its fetch thread, and the
+    # SQLite connection belongs to this one.
+    conditional = {url: frontier.conditional_headers(url) for url in pending if url in previous} if refresh else {}
+
+    def on_response(url, resp):
+        # Remember validators for every page; report "unchanged" only when we still have its old row.
+        if resp.status_code == 304:
+            return url in previous
+        if resp.status_code != 200:
+            return False
+        digest = hashlib.sha256(resp.content).hexdigest()
+        old = frontier.validators(url)
+        frontier.set_validators(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), digest, source)
+        return url in previous and old is not None and old[2] == digest
 
-        print(f"  Page {page}: {len(page_urls)} URLs found")
-        all_job_urls.extend(page_urls)
+    unchanged = 0
+    try:
+        pipeline = run_detail_pipeline(pending, parse_func, engine,
+                                       headers_for=conditional.get, on_response=on_response)
+        for i, (url, record, problem) in enumerate(pipeline, start=1):
+            print(f"[{label}] Scraping ({i}/{len(pending)}): {url}")
+            if problem is NOT_MODIFIED:
+                unchanged += 1
+                print(f"  {problem}")
+                continue
+            if problem:
+                print(f"  {problem}")
+                continue
+            journal.record(url, record)
+            frontier.mark_scraped(url, source)
+            if describe:
+                print(f"  {describe(record)}")
+    finally:
+        journal.close()
+        frontier.close()
+    if refresh:
+        print(f"[{label}] Refresh: {unchanged} unchanged, {len(pending) - unchanged} re-fetched")
+
+    records = (journal.get(url) or previous.get(url) for url in urls if url in journal or url in previous)
+    with engine.metrics.timed("write"), CsvSink(out_path) as sink:
+        sink.write(records)
+    engine.metrics.add("records", sink.rows)
+    journal.finish()
+    if isinstance(previous, StageJournal):    # (an empty journal is falsy, but still has a file to remove)
+        previous.finish()
+    return sink.rows
+
+# --- Listing crawl: walk search pages until the results run out ---
+# Search pages past the last result come back empty (or with a 404), and some
+# listings keep repeating earlier postings. Walking them all would spend time
+# and politeness budget for nothing. The sequential crawl stops after
+# LISTING_STOP_AFTER pages in a row bring no new job URL. With LISTING_PROBE,
+# the last page is found first by probing pages 1, 2, 4, 8, ... and then
+# bisecting. The known range is then fetched concurrently.
+def fetch_listing_page(engine, url, parse_func):
+    """Job URLs on one search page; [] for a page past the end (non-200).
+
+    Raises on request errors and on RETRY_STATUSES still failing after the
+    engine's retries, so a throttled page is never taken for the end.
+    """
+    resp = engine.fetch(url)
+    if resp.status_code in RETRY_STATUSES:
+        raise requests.HTTPError(f"status {resp.status_code} for {url}")
+    if resp.status_code != 200:
+        print(f"  Failed to fetch {url} (Status {resp.status_code})")
+        return []
+    with engine.metrics.timed("parse"):
+        return parse_func(resp.text)
+
+def find_last_page(label, page_url, pages, parse_func, engine, journal):
+    """Highest page number (<= pages) that still has results, found with O(log pages) fetches.
+
+    A page counts as past the end if it is empty or repeats the results of the
+    last good page probed. Good pages are journaled, so the range fetch skips them.
+    """
+    probed = {}
+
+    def has_results(page, reference):
+        url = page_url(page)
+        if url in journal:
+            found = journal.get(url, [])
+        else:
+            found = fetch_listing_page(engine, url, parse_func)
+        fresh = bool(found) and set(found) != set(probed.get(reference, ()))
+        if fresh:
+            probed[page] = found
+            if url not in journal:
+                journal.record(url, found)
+        print(f"[{label}] Probe page {page}: {len(found)} URLs{'' if fresh else ' (past the end)'}")
+        return fresh
+
+    if not has_results(1, None):
+        return 0
+    good, page = 1, 2
+    while page <= pages and has_results(page, good):
+        good, page = page, page * 2
+    bad = min(page, pages + 1)
+    while bad - good > 1:
+        middle = (good + bad) // 2
+        if has_results(middle, good):
+            good = middle
+        else:
+            bad = middle
+    return good
+
+def crawl_listing_pages(label, page_url, pages, parse_func, engine, journal, probe=None, stop_after=None):
+    """Fetch search pages 1..pages into `journal` (page URL -> job URLs) until the results end.
+
+    Returns the number of pages crawled (the pages that would be walked, in probe mode).
+    """
+    probe = LISTING_PROBE if probe is None else probe
+    stop_after = LISTING_STOP_AFTER if stop_after is None else stop_after
+    last = None
+    if probe:
+        try:
+            last = find_last_page(label, page_url, pages, parse_func, engine, journal)
+        except Exception as e:
+            print(f"[{label}] Probing failed ({e}); walking the pages in order instead")
+    if last is not None:
+        todo = [page_url(page) for page in range(1, last + 1) if page_url(page) not in journal]
+        print(f"[{label}] Last page with results: {last} of {pages}; fetching {len(todo)} remaining pages")
+        for i, (url, resp, err) in enumerate(engine.map(todo), start=1):
+            if err is not None:
+                print(f"  Error on {url}: {err}")
+                continue
+            if resp.status_code != 200:
+                print(f"  Failed to fetch {url} (Status {resp.status_code})")
+                continue
+            with engine.metrics.timed("parse"):
+                found = parse_func(resp.text)
+            journal.record(url, found)
+            print(f"[{label}] ({i}/{len(todo)}) {url}: {len(found)} URLs found")
+        return last
 
-        # Save progress every 10 pages
-        if page % 10 == 0:
-            out_path = os.path.join(OUTPUT_DIR, "timesjobs_job_urls.csv")
-            pd.DataFrame({"Job_URL": all_job_urls}).to_csv(out_path, index=False)
-            print(f"  Saved progress to {out_path}")
+    seen, streak = set(), 0
+    for page in range(1, pages + 1):
+        url = page_url(page)
+        if url in journal:
+            found = journal.get(url, [])
+        else:
+            print(f"[{label}] Scraping page {page} -> {url}")
+            try:
+                found = fetch_listing_page(engine, url, parse_func)
+            except Exception as e:
+                print(f"  Error on page {page}: {e}")
+                continue
+            journal.record(url, found)
+            print(f"  Page {page}: {len(found)} URLs found")
+        # Pages whose URLs were all seen before are as good as empty.
+        streak = 0 if set(found) - seen else streak + 1
+        seen.update(found)
+        if stop_after and streak >= stop_after:
+            print(f"[{label}] Stopping after page {page}: {streak} pages in a row had no new job URLs")
+            return page
+    return pages
 
-        time.sleep(random.uniform(1.5, 3.5))
+# --- Part 1: Scrape fresher job listing URLs (mobile site) ---
+def scrape_fresher_listing_pages(pages=FRESHER_PAGES, base_url=None):
+    base_url = base_url or FRESHER_SEARCH_URL
+    # Pages are fetched one at a time, paced by the host's adaptive rate limiter
+    # (all at once in probe mode, where the range of pages is known up front).
+    engine = FetchEngine(headers={"User-Agent": "Mozilla/5.0"}, concurrency=None if LISTING_PROBE else 1,
+                         stage="fresher_listing")
+    # Progress goes to the journal after every page instead of rewriting the CSV.
+    journal = StageJournal("fresher_listing")
+    if len(journal):
+        print(f"[FRESHER LIST] Resuming: {len(journal)} pages already done")
+
+    page_list_urls = [base_url.format(page) for page in range(1, pages + 1)]
+    try:
+        crawl_listing_pages("FRESHER LIST", base_url.format, pages, parse_fresher_listing, engine, journal)
+    finally:
+        journal.close()
 
-    # final save
+    # final save: normalized and deduplicated through the frontier
+    frontier = UrlFrontier()
+    try:
+        all_job_urls, new_count = frontier.add(
+            (job_url for url in page_list_urls for job_url in journal.get(url, [])), "fresher")
+    finally:
+        frontier.close()
+    print(f"[FRESHER LIST] {new_count} URLs not seen in earlier runs")
     out_path = os.path.join(OUTPUT_DIR, "timesjobs_job_urls.csv")
-    pd.DataFrame({"Job_URL": all_job_urls}).to_csv(out_path, index=False)
+    with engine.metrics.timed("write"):
+        pd.DataFrame({"Job_URL": all_job_urls}).to_csv(out_path, index=False)
+    engine.metrics.add("records", len(all_job_urls))
+    journal.finish()
     print(f"[FRESHER LIST] Total {len(all_job_urls)} job URLs saved to {out_path}.")
     return all_job_urls
 
 # --- Part 2: Scrape details for fresher job URLs (first 100) ---
-def scrape_fresher_details(listing_csv="timesjobs_job_urls.csv", limit=FRESHER_DETAIL_LIMIT):
+def parse_fresher_detail(url, html, backend=None):
+    """Build one fresher record from a mobile-site detail page.
+
+    Everything the fresher dataset needs, including Qualification and Job_Title,
+    comes out of this single parse so each page is downloaded only once.
+    """
+    soup = make_soup(html, keep_fresher_detail, backend)
+
+    # Company Name
+    company_tag = soup.find("h2")
+    company = None
+    if company_tag:
+        # Sometimes <h2><span>CompanyName</span></h2>
+        span = company_tag.find("span")
+        if span:
+            company = span.get_text(strip=True)
+        else:
+            company = company_tag.get_text(strip=True)
+
+    # Posting time (mobile markup may differ)
+    posting_time = None
+    posting_time_tag = soup.find("span", class_="posting-time")
+    if posting_time_tag:
+        posting_time = posting_time_tag.get_text(strip=True)
+
+    # Location
+    location_tag = soup.find("div", class_="srp-loc")
+    location = location_tag.text.replace("Location:", "").strip() if location_tag else None
+
+    # Experience
+    experience_tag = soup.find("div", class_="srp-exp")
+    experience = re.sub(r"\s+", " ", experience_tag.get_text()).strip() if experience_tag else None
+
+    # Salary
+    salary_tag = soup.find("div", class_="srp-sal")
+    salary = salary_tag.text.strip() if salary_tag else None
+
+    # Job Role / Description
+    job_role_tag = soup.find("div", id="JobDescription")
+    job_role = re.sub(r"\s+", " ", job_role_tag.get_text()).strip() if job_role_tag else None
+
+    # Industry Type
+    industry_tag = soup.find("span", class_="jd-cont-bx")
+    industry = industry_tag.get_text(strip=True) if industry_tag else None
+
+    # Qualification: try multiple strategies
+    qualification = None
+    # look for li.clearfix label containing 'Qualification'
+    qualification_li = None
+    for li in soup.find_all("li", class_="clearfix"):
+        label = li.find("label")
+        if label and "Qualification" in label.get_text():
+            qualification_li = li
+            break
+    if qualification_li:
+        span = qualification_li.find("span", class_="jd-cont-bx") or qualification_li.find("span", class_="basic-info-dtl")
+        if span:
+            qualification = re.sub(r"\s+", " ", span.get_text()).strip()
+    if qualification is None:
+        # same fallback postprocess_freshers used to re-download the page for
+        qualification = qualification_from_soup(soup)
+
+    # Employment Type
+    emp_type = None
+    emp_tag = soup.find("label", string=lambda text: text and "Employment Type" in text)
+    if emp_tag:
+        span = emp_tag.find_next("span", class_="jd-cont-bx")
+        if span:
+            emp_type = span.get_text(strip=True)
+
+    return {
+        "URL": url,
+        "Company": company,
+        "Posting_Time": posting_time,
+        "Location": location,
+        "Experience": experience,
+        "Salary": salary,
+        "Job_Description": job_role,
+        "Industry": industry,
+        "Qualification": qualification,
+        "Employment_Type": emp_type,
+        "Job_Title": job_title_from_soup(soup)
+    }
+
+def scrape_fresher_details(listing_csv="timesjobs_job_urls.csv", limit=FRESHER_DETAIL_LIMIT,
+                           incremental=None, refresh=False):
     headers = {
         "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36")
     }
-    session = new_session()
+    engine = FetchEngine(headers=headers, stage="fresher_details")
 
+    out_path = os.path.join(OUTPUT_DIR, "timesjobs_job_details.csv")
     # Load the listing CSV
     if not os.path.exists(listing_csv):
         print(f"Listing file {listing_csv} not found. Exiting fresher details scraping.")
-        return pd.DataFrame()
+        with CsvSink(out_path):
+            pass
+        return out_path
 
-    all_urls = pd.read_csv(listing_csv)
+    all_urls = pd.read_csv(listing_csv, usecols=["Job_URL"])
     urls_to_scrape = all_urls["Job_URL"].dropna().tolist()[:limit]
 
-    all_data = []
-    for i, url in enumerate(urls_to_scrape, start=1):
-        print(f"[FRESHER DETAILS] Scraping ({i}/{len(urls_to_scrape)}): {url}")
-        try:
-            resp = session.get(url, headers=headers, timeout=15, verify=False)
-            if resp.status_code != 200:
-                print(f"  Skipping (status {resp.status_code})")
-                continue
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Company Name
-            company_tag = soup.find("h2")
-            company = None
-            if company_tag:
-                # Sometimes <h2><span>CompanyName</span></h2>
-                span = company_tag.find("span")
-                if span:
-                    company = span.get_text(strip=True)
-                else:
-                    company = company_tag.get_text(strip=True)
-
-            # Posting time (mobile markup may differ)
-            posting_time = None
-            posting_time_tag = soup.find("span", class_="posting-time")
-            if posting_time_tag:
-                posting_time = posting_time_tag.get_text(strip=True)
-
-            # Location
-            location_tag = soup.find("div", class_="srp-loc")
-            location = location_tag.text.replace("Location:", "").strip() if location_tag else None
-
-            # Experience
-            experience_tag = soup.find("div", class_="srp-exp")
-            experience = re.sub(r"\s+", " ", experience_tag.get_text()).strip() if experience_tag else None
-
-            # Salary
-            salary_tag = soup.find("div", class_="srp-sal")
-            salary = salary_tag.text.strip() if salary_tag else None
-
-            # Job Role / Description
-            job_role_tag = soup.find("div", id="JobDescription")
-            job_role = re.sub(r"\s+", " ", job_role_tag.get_text()).strip() if job_role_tag else None
-
-            # Industry Type
-            industry_tag = soup.find("span", class_="jd-cont-bx")
-            industry = industry_tag.get_text(strip=True) if industry_tag else None
-
-            # Qualification: try multiple strategies
-            qualification = None
-            # look for li.clearfix label containing 'Qualification'
-            qualification_li = None
-            for li in soup.find_all("li", class_="clearfix"):
-                label = li.find("label")
-                if label and "Qualification" in label.get_text():
-                    qualification_li = li
-                    break
-            if qualification_li:
-                span = qualification_li.find("span", class_="jd-cont-bx") or qualification_li.find("span", class_="basic-info-dtl")
-                if span:
-                    qualification = re.sub(r"\s+", " ", span.get_text()).strip()
-
-            # Employment Type
-            emp_type = None
-            emp_tag = soup.find("label", string=lambda text: text and "Employment Type" in text)
-            if emp_tag:
-                span = emp_tag.find_next("span", class_="jd-cont-bx")
-                if span:
-                    emp_type = span.get_text(strip=True)
-
-            all_data.append({
-                "URL": url,
-                "Company": company,
-                "Posting_Time": posting_time,
-                "Location": location,
-                "Experience": experience,
-                "Salary": salary,
-                "Job_Description": job_role,
-                "Industry": industry,
-                "Qualification": qualification,
-                "Employment_Type": emp_type
-            })
-
-            print(f"  Done: {company or 'N/A'}")
-            time.sleep(random.uniform(2, 5))
-
-        except Exception as e:
-            print(f"  Error scraping {url}: {e}")
-            continue
-
-    df_freshers = pd.DataFrame(all_data)
-    out_path = os.path.join(OUTPUT_DIR, "timesjobs_job_details.csv")
-    df_freshers.to_csv(out_path, index=False)
-    print(f"[FRESHER DETAILS] Saved {len(df_freshers)} records to {out_path}")
-    return df_freshers
+    rows = run_detail_stage(
+        "fresher_details", "FRESHER DETAILS", "fresher", urls_to_scrape, parse_fresher_detail, engine,
+        out_path, incremental=incremental, refresh=refresh,
+        describe=lambda record: f"Done: {record['Company'] or 'N/A'}")
+    print(f"[FRESHER DETAILS] Saved {rows} records to {out_path}")
+    return out_path
+
+# --- Helper: extract Qualification from a parsed detail page ---
+def qualification_from_soup(soup):
+    label = soup.find("label", string=lambda t: t and "Qualification" in t)
+    if label:
+        span = label.find_next("span", class_="jd-cont-bx") or label.find_next("span", class_="basic-info-dtl")
+        if span:
+            return re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
+    # try the li.clearfix strategy
+    for li in soup.find_all("li", class_="clearfix"):
+        lab = li.find("label")
+        if lab and "Qualification" in lab.get_text():
+            span = li.find("span", class_="jd-cont-bx") or li.find("span", class_="basic-info-dtl")
+            if span:
+                return re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
+    return None
+
+# --- Helper: extract Job Title (h1) from a parsed detail page ---
+def job_title_from_soup(soup):
+    title_tag = soup.find("h1")
+    if title_tag:
+        return title_tag.get_text(strip=True)
+    # fallback: find h1-like job title markup
+    title_alt = soup.find("h1", class_="jd-job-title")
+    if title_alt:
+        return title_alt.get_text(strip=True)
+    return None
 
 # --- Helper: function to extract Qualification from a detail URL (if missing) ---
 def get_qualification(url, session=None):
@@ -209,20 +1748,7 @@ def get_qualification(url, session=None):
         resp = session.get(url, headers=headers, timeout=12, verify=False)
         if resp.status_code != 200:
             return None
-        soup = BeautifulSoup(resp.text, "html.parser")
-        label = soup.find("label", string=lambda t: t and "Qualification" in t)
-        if label:
-            span = label.find_next("span", class_="jd-cont-bx") or label.find_next("span", class_="basic-info-dtl")
-            if span:
-                return re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
-        # try the li.clearfix strategy
-        for li in soup.find_all("li", class_="clearfix"):
-            lab = li.find("label")
-            if lab and "Qualification" in lab.get_text():
-                span = li.find("span", class_="jd-cont-bx") or li.find("span", class_="basic-info-dtl")
-                if span:
-                    return re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
-        return None
+        return qualification_from_soup(make_soup(resp.text, keep_fresher_detail))
     except Exception as e:
         print(f"  get_qualification error for {url}: {e}")
         return None
@@ -236,323 +1762,2185 @@ def get_job_title(url, session=None):
         resp = session.get(url, headers=headers, timeout=12, verify=False)
         if resp.status_code != 200:
             return None
-        soup = BeautifulSoup(resp.text, "html.parser")
-        title_tag = soup.find("h1")
-        if title_tag:
-            return title_tag.get_text(strip=True)
-        # fallback: find h1-like job title markup
-        title_alt = soup.find("h1", class_="jd-job-title")
-        if title_alt:
-            return title_alt.get_text(strip=True)
-        return None
+        return job_title_from_soup(make_soup(resp.text, keep_fresher_detail))
     except Exception as e:
         print(f"  get_job_title error for {url}: {e}")
         return None
 
-# --- Part 3: Post-process fresher dataframe: fill Qualification and add Job_Title ---
-def postprocess_freshers(df_freshers):
-    session = new_session()
-
-    # fill missing Qualification
-    print("[POSTPROCESS] Filling missing Qualification entries...")
-    for idx, row in df_freshers.iterrows():
-        if pd.isna(row.get("Qualification")) or not row.get("Qualification"):
-            qual = get_qualification(row["URL"], session=session)
-            df_freshers.at[idx, "Qualification"] = qual
-            time.sleep(random.uniform(2, 5))
-
-    # get job titles for each URL
-    print("[POSTPROCESS] Extracting Job_Title for each fresher URL...")
-    job_titles = []
-    for i, url in enumerate(df_freshers["URL"].tolist(), start=1):
-        print(f"  [{i}/{len(df_freshers)}] fetching title for {url}")
-        title = get_job_title(url, session=session)
-        job_titles.append(title)
-        time.sleep(random.uniform(2, 5))
-
-    df_freshers["Job_Title"] = job_titles
+# --- Part 3: Post-process fresher dataframe: fill missing Qualification / Job_Title ---
+# parse_fresher_detail already fills both fields from the page it downloaded, so
+# re-fetching that page cannot add anything. The fallback only runs for details
+# CSVs written before it did (they have no Job_Title column); each such page is
+# fetched once and both fields filled from it.
+def legacy_fresher_details(source):
+    """True if the fresher details `source` predates the fused extractor (no Job_Title column)."""
+    for chunk in iter_frames(source):
+        return "Job_Title" not in chunk.columns
+    return False
+
+def missing_fresher_fields(df_freshers):
+    """(missing Qualification, missing Job_Title) boolean masks, adding absent columns."""
+    for col in ["Qualification", "Job_Title"]:
+        # (object dtype: an all-empty column reads back from CSV as float, which won't take strings)
+        df_freshers[col] = df_freshers[col].astype(object) if col in df_freshers.columns else None
+    missing_qual = df_freshers["Qualification"].isna() | (df_freshers["Qualification"] == "")
+    missing_title = df_freshers["Job_Title"].isna() | (df_freshers["Job_Title"] == "")
+    return missing_qual, missing_title
+
+def postprocess_freshers(source):
+    """Write jobs_freshers.csv from the fresher details (CSV path or DataFrame), filling missing fields; returns it.
+
+    Two streaming passes: the first collects the URLs to re-fetch (legacy
+    details only), the second writes jobs_freshers.csv with the fetched values
+    filled in. The file is
+    written even when nothing is missing, so the stage always has an output
+    that later runs (and single-stage commands) can pick up.
+    """
+    todo = {}
+    for chunk in (iter_frames(source) if legacy_fresher_details(source) else []):
+        missing_qual, missing_title = missing_fresher_fields(chunk)
+        todo.update(dict.fromkeys(chunk.loc[missing_qual | missing_title, "URL"]))
+
+    engine = FetchEngine(headers={"User-Agent": "Mozilla/5.0"}, timeout=12, stage="postprocess")
+    journal = StageJournal("postprocess")
+    if todo:
+        print(f"[POSTPROCESS] Re-fetching {len(todo)} fresher pages with missing Qualification/Job_Title...")
+        urls = [url for url in todo if url not in journal]
+        try:
+            for i, (url, resp, err) in enumerate(engine.map(urls), start=1):
+                print(f"  [{i}/{len(urls)}] fetching {url}")
+                if err is not None:
+                    print(f"  postprocess error for {url}: {err}")
+                    continue
+                if resp.status_code != 200:
+                    continue
+                with engine.metrics.timed("parse"):
+                    soup = make_soup(resp.text, keep_fresher_detail)
+                    found = {"Qualification": qualification_from_soup(soup), "Job_Title": job_title_from_soup(soup)}
+                journal.record(url, found)
+        finally:
+            journal.close()
+
     out_path = os.path.join(OUTPUT_DIR, "jobs_freshers.csv")
-    df_freshers.to_csv(out_path, index=False)
+    with CsvSink(out_path) as sink:
+        for df_freshers in iter_frames(source):
+            missing_qual, missing_title = missing_fresher_fields(df_freshers)
+            for idx in (df_freshers.index[missing_qual | missing_title] if todo else []):
+                found = journal.get(df_freshers.at[idx, "URL"])
+                if found is None:
+                    continue
+                if missing_qual[idx]:
+                    df_freshers.at[idx, "Qualification"] = found["Qualification"]
+                if missing_title[idx]:
+                    df_freshers.at[idx, "Job_Title"] = found["Job_Title"]
+            with engine.metrics.timed("write"):
+                sink.write(df_freshers)
+    engine.metrics.add("records", len(journal))
+    journal.finish()
     print(f"[POSTPROCESS] Saved updated fresher file to {out_path}")
-    return df_freshers
+    return out_path
 
 # --- Part 4: Extract skills & short job description from Job_Description text ---
-def extract_job_info_from_description(df):
-    print("[EXTRACT] Parsing Job_Description for Skills and Description...")
-    def extract_job_info(text):
+def extract_job_info(text):
+    """Row-at-a-time reference extractor (the original implementation, kept for benchmarks)."""
+    if not isinstance(text, str):
+        return {"Skills": None, "Description": None}
+    text_clean = re.sub(r'\s+', ' ', text.strip())
+    description = None
+    match_desc = re.search(r'Job Responsibilities(.*?)(Education Requirement|Skills|Skills & Competencies|$)',
+                           text_clean, flags=re.IGNORECASE)
+    if match_desc:
+        description = match_desc.group(1).strip()
+
+    skills = None
+    match_skills = re.search(r'(Skills & Competencies|Skills)(.*)', text_clean, flags=re.IGNORECASE)
+    if match_skills:
+        skills = match_skills.group(2).strip()
+    return {"Skills": skills, "Description": description}
+
+# Precompiled equivalents of the extract_job_info patterns. The lazy
+# "Job Responsibilities(.*?)(Education Requirement|Skills|...|$)" is split into
+# finding the heading and then the first terminator after it: the same match
+# (the cleaned text has no newlines), without retrying the alternation at
+# every character. Whitespace is collapsed with " ".join(text.split()), which
+# uses the same definition of whitespace as re's \s and is far cheaper.
+RESPONSIBILITIES_RE = re.compile(r'Job Responsibilities', re.IGNORECASE)
+DESCRIPTION_END_RE = re.compile(r'Education Requirement|Skills', re.IGNORECASE)
+SKILLS_RE = re.compile(r'(Skills & Competencies|Skills)(.*)', re.IGNORECASE)
+EXTRACT_CHUNK_ROWS = 20000   # descriptions per batch / per worker task
+EXTRACT_WORKERS = os.cpu_count() or 1
+
+class StagePool:
+    """One spawned process pool for every chunk a stage streams through.
+
+    It is only started once a chunk has more than `chunk_rows` rows (smaller
+    inputs are cheaper in-process than spawning workers), and shut down when
+    the `with` block ends.
+    """
+
+    def __init__(self, workers, chunk_rows):
+        self.workers = workers
+        self.chunk_rows = chunk_rows
+        self.pool = None
+
+    def get(self, rows):
+        """The pool to use for a chunk of `rows` rows, or None to run it in-process."""
+        if self.pool is None and self.workers > 1 and rows > self.chunk_rows:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self.pool
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+def map_batches(func, items, workers, chunk_rows, pool=None):
+    """[func(batch) for each batch of `items`], in order, in parallel processes when it pays off.
+
+    With a shared `pool` (see StagePool) the batches are made small enough to
+    give each of its `workers` one; without, a pool is started for this call
+    only when there is more than one batch of `chunk_rows`.
+    """
+    items = list(items)
+    if pool is not None and items:
+        chunk_rows = min(chunk_rows, -(-len(items) // workers))
+    batches = [items[i:i + chunk_rows] for i in range(0, len(items), chunk_rows)]
+    if pool is not None:
+        return list(pool.map(func, batches))
+    if workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(batches)),
+                                 mp_context=multiprocessing.get_context("spawn")) as own_pool:
+            return list(own_pool.map(func, batches))
+    return [func(batch) for batch in batches]
+
+def extract_job_info_batch(texts):
+    """(skills, descriptions) lists for a batch of Job_Description values.
+
+    Gives exactly what extract_job_info does per row, but with precompiled
+    patterns, no per-row dicts and a single pass over the batch.
+    """
+    skills_search = SKILLS_RE.search
+    heading_search, end_search = RESPONSIBILITIES_RE.search, DESCRIPTION_END_RE.search
+    skills, descriptions = [], []
+    for text in texts:
         if not isinstance(text, str):
-            return {"Skills": None, "Description": None}
-        text_clean = re.sub(r'\s+', ' ', text.strip())
-        description = None
-        match_desc = re.search(r'Job Responsibilities(.*?)(Education Requirement|Skills|Skills & Competencies|$)',
-                               text_clean, flags=re.IGNORECASE)
-        if match_desc:
-            description = match_desc.group(1).strip()
-
-        skills = None
-        match_skills = re.search(r'(Skills & Competencies|Skills)(.*)', text_clean, flags=re.IGNORECASE)
-        if match_skills:
-            skills = match_skills.group(2).strip()
-        return {"Skills": skills, "Description": description}
-
-    extracted = df["Job_Description"].apply(extract_job_info)
-    df["Skills"] = extracted.apply(lambda x: x["Skills"])
-    df["Description"] = extracted.apply(lambda x: x["Description"])
+            skills.append(None)
+            descriptions.append(None)
+            continue
+        text_clean = " ".join(text.split())
+        match = heading_search(text_clean)
+        if match:
+            end = end_search(text_clean, match.end())
+            descriptions.append(text_clean[match.end():end.start() if end else len(text_clean)].strip())
+        else:
+            descriptions.append(None)
+        match = skills_search(text_clean)
+        skills.append(match.group(2).strip() if match else None)
+    return skills, descriptions
+
+def extract_skills_and_descriptions(texts, workers=None, chunk_rows=None, pool=None):
+    """Run extract_job_info_batch over `texts` in chunks, in parallel processes when it pays off."""
+    workers = EXTRACT_WORKERS if workers is None else workers
+    results = map_batches(extract_job_info_batch, texts, workers, chunk_rows or EXTRACT_CHUNK_ROWS, pool)
+    skills = [value for chunk_skills, _ in results for value in chunk_skills]
+    descriptions = [value for _, chunk_descriptions in results for value in chunk_descriptions]
+    return skills, descriptions
+
+def extract_job_info_from_description(source):
+    """Add Skills / Description to the fresher rows (CSV path or DataFrame), chunk by chunk; returns the CSV."""
+    print("[EXTRACT] Parsing Job_Description for Skills and Description...")
+    metrics = METRICS.stage("extract")
     out_path = os.path.join(OUTPUT_DIR, "jobs_freshers_parsed.csv")
-    df.to_csv(out_path, index=False)
+    with CsvSink(out_path) as sink, StagePool(EXTRACT_WORKERS, EXTRACT_CHUNK_ROWS) as pool:
+        for df in iter_frames(source):
+            texts = df["Job_Description"] if "Job_Description" in df.columns else [None] * len(df)
+            with metrics.timed("parse"):
+                skills, descriptions = extract_skills_and_descriptions(texts, pool=pool.get(len(df)))
+            df["Skills"] = pd.Series(skills, index=df.index, dtype=object)
+            df["Description"] = pd.Series(descriptions, index=df.index, dtype=object)
+            with metrics.timed("write"):
+                sink.write(df)
+    metrics.add("records", sink.rows)
     print(f"[EXTRACT] Saved parsed fresher data to {out_path}")
-    return df
+    return out_path
+
+def benchmark_description_extraction(rows=150000, workers=None, seed=0):
+    """Time the row-wise reference against the batched extractor on synthetic descriptions.
+
+    Checks both produce identical Skills/Description columns and prints rows/sec.
+    """
+    rng = random.Random(seed)
+    words = ["design", "develop", "maintain", "client", "reports", "testing", "support", "data",
+             "team", "modules", "APIs", "customers", "documentation", "sales", "targets"]
+    skills_pool = ["Python", "SQL", "Excel", "Java", "Communication", "Tally", "AutoCAD", "React"]
+
+    def sentence(n):
+        return " ".join(rng.choice(words) for _ in range(n))
+
+    texts = []
+    for i in range(rows):
+        shape = i % 6
+        if shape == 0:
+            texts.append(None)
+            continue
+        parts = []
+        if shape in (1, 2, 3):
+            parts.append(f"Job Responsibilities\n  {sentence(rng.randint(20, 80))}.")
+        if shape in (1, 4):
+            parts.append(f"Education Requirement  B.Tech / {sentence(5)}")
+        if shape in (1, 2, 5):
+            label = rng.choice(["Skills & Competencies", "skills", "SKILLS"])
+            parts.append(f"{label}\t{', '.join(rng.sample(skills_pool, 3))}")
+        texts.append("  " + "\n".join(parts) + "  ")
+    series = pd.Series(texts, dtype=object)
+
+    start = time.perf_counter()
+    extracted = series.apply(extract_job_info)
+    reference = [extracted.apply(lambda x: x["Skills"]), extracted.apply(lambda x: x["Description"])]
+    reference_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = [pd.Series(values) for values in extract_skills_and_descriptions(series, workers=workers)]
+    batched_secs = time.perf_counter() - start
+
+    identical = all(new.equals(old) for new, old in zip(batched, reference))
+    print(f"[BENCH] {rows} descriptions: row-wise {reference_secs:.2f}s ({rows / reference_secs:,.0f} rows/s), "
+          f"batched {batched_secs:.2f}s ({rows / batched_secs:,.0f} rows/s), identical={identical}")
+    return {"rows": rows, "reference_secs": reference_secs, "batched_secs": batched_secs, "identical": identical}
 
 # --- Part 5: Scrape IT job listing URLs (desktop site) ---
 def get_it_job_urls(base_url, num_pages=IT_PAGES):
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; JobScraperBot/1.0)"}
-    session = new_session()
-    job_links = []
+    engine = FetchEngine(headers={"User-Agent": "Mozilla/5.0 (compatible; JobScraperBot/1.0)"},
+                         concurrency=None if LISTING_PROBE else 1, stage="it_listing")
+    journal = StageJournal("it_listing")
+    if len(journal):
+        print(f"[IT LIST] Resuming: {len(journal)} pages already done")
 
-    for page in range(1, num_pages + 1):
-        url = f"{base_url}&sequence={page}"
-        print(f"[IT LIST] Scraping page {page} -> {url}")
-        try:
-            resp = session.get(url, headers=headers, timeout=15, verify=False)
-            if resp.status_code != 200:
-                print(f"  Failed to fetch page {page} (Status {resp.status_code})")
-                continue
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_boxes = soup.find_all("li", class_="clearfix job-bx wht-shd-bx")
-            found_on_page = 0
-            for job in job_boxes:
-                a_tag = job.find("a", href=True, class_="posoverlay_srp")
-                if a_tag:
-                    job_links.append(a_tag["href"])
-                    found_on_page += 1
-            print(f"  Found {found_on_page} job cards on page {page}.")
-            time.sleep(random.uniform(2, 6))
-        except Exception as e:
-            print(f"  Error on page {page}: {e}")
-            continue
+    page_list_urls = [f"{base_url}&sequence={page}" for page in range(1, num_pages + 1)]
+    try:
+        crawl_listing_pages("IT LIST", lambda page: f"{base_url}&sequence={page}", num_pages, parse_it_listing,
+                            engine, journal)
+    finally:
+        journal.close()
 
+    frontier = UrlFrontier()
+    try:
+        job_links, new_count = frontier.add(
+            (link for url in page_list_urls for link in journal.get(url, [])), "it")
+    finally:
+        frontier.close()
+    print(f"[IT LIST] {new_count} URLs not seen in earlier runs")
     out_path = os.path.join(OUTPUT_DIR, "timesjobs_ITjob_URL.csv")
-    pd.DataFrame({"URL": job_links}).to_csv(out_path, index=False)
+    with engine.metrics.timed("write"):
+        pd.DataFrame({"URL": job_links}).to_csv(out_path, index=False)
+    engine.metrics.add("records", len(job_links))
+    journal.finish()
     print(f"[IT LIST] Saved {len(job_links)} IT job URLs to {out_path}")
     return job_links
 
 # --- Part 6: Scrape IT job details from collected URLs ---
-def scrape_it_job_details(it_urls_csv="timesjobs_ITjob_URL.csv"):
+def parse_it_job_detail(url, html, backend=None):
+    """Build one IT record from a desktop-site detail page."""
+    soup = make_soup(html, keep_it_detail, backend)
+
+    # Job title
+    title_tag = soup.find("h1", class_="jd-job-title")
+    title = title_tag.get_text(strip=True) if title_tag else None
+
+    # Company
+    company_tag = soup.find("h2")
+    company = company_tag.get_text(strip=True) if company_tag else None
+
+    # Posting date
+    posted = None
+    posted_tag = soup.find("span", class_="posted-days")
+    if posted_tag:
+        posted = posted_tag.get_text(strip=True)
+
+    # Location
+    location = None
+    loc_i = soup.find("i", class_="location")
+    if loc_i:
+        parent_li = loc_i.find_parent("li")
+        if parent_li:
+            location = re.sub(r"\s+", " ", parent_li.get_text(separator=" ", strip=True)).strip()
+
+    # Experience
+    experience = None
+    exp_i = soup.find("i", class_="experience")
+    if exp_i:
+        parent_li = exp_i.find_parent("li")
+        if parent_li:
+            experience = re.sub(r"\s+", " ", parent_li.get_text(separator=" ", strip=True)).strip()
+
+    # Salary
+    salary = None
+    sal_i = soup.find("i", class_="salary")
+    if sal_i:
+        parent_li = sal_i.find_parent("li")
+        if parent_li:
+            salary = re.sub(r"\s+", " ", parent_li.get_text(separator=" ", strip=True)).strip()
+
+    # Industry, Qualification, Employment Type
+    industry = None
+    qualification = None
+    employment_type = None
+
+    for li in soup.find_all("li", class_="clearfix"):
+        label = li.find("label")
+        if not label:
+            continue
+        label_text = label.get_text()
+        if "Industry" in label_text:
+            span = li.find("span", class_="basic-info-dtl")
+            if span:
+                industry = re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
+        if "Qualification" in label_text:
+            span = li.find("span", class_="basic-info-dtl")
+            if span:
+                qualification = re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
+
+    # Employment type possibility
+    employment_tag = soup.find("span", class_="mt-4")
+    if employment_tag:
+        employment_type = re.sub(r"\s+", " ", employment_tag.get_text(strip=True)).strip()
+
+    # Skills tags
+    skills = []
+    for a in soup.select("span.jd-skill-tag a"):
+        if a.get("title"):
+            skills.append(a.get("title").replace(" Jobs", ""))
+    skills_text = ", ".join(skills) if skills else None
+
+    # Description
+    desc_div = soup.find("div", class_="jd-desc")
+    description = desc_div.get_text(" ", strip=True) if desc_div else None
+
+    return {
+        "URL": url,
+        "Job_Title": title,
+        "Company": company,
+        "Posting_Date": posted,
+        "Location": location,
+        "Experience": experience,
+        "Salary": salary,
+        "Industry": industry,
+        "Qualification": qualification,
+        "Employment_Type": employment_type,
+        "Skills": skills_text,
+        "Description": description
+    }
+
+def scrape_it_job_details(it_urls_csv="timesjobs_ITjob_URL.csv", incremental=None, refresh=False):
     headers = {
         "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     }
-    session = new_session()
+    engine = FetchEngine(headers=headers, stage="it_details")
 
+    out_path = os.path.join(OUTPUT_DIR, "timesjobs_ITjobs.csv")
     if not os.path.exists(it_urls_csv):
         print(f"IT URL file {it_urls_csv} not found. Exiting IT details scraping.")
-        return pd.DataFrame()
+        with CsvSink(out_path):
+            pass
+        return out_path
 
-    df_urls = pd.read_csv(it_urls_csv)
+    df_urls = pd.read_csv(it_urls_csv, usecols=["URL"])
     urls = df_urls['URL'].dropna().tolist()
 
-    data = []
-    for i, url in enumerate(urls, start=1):
+    rows = run_detail_stage("it_details", "IT DETAILS", "it", urls, parse_it_job_detail, engine,
+                            out_path, incremental=incremental, refresh=refresh)
+    print(f"[IT DETAILS] Saved {rows} IT records to {out_path}")
+    return out_path
+
+# --- Work-queue crawl: listing pages and detail URLs leased to many workers ---
+# The queue is a SQLite file. Workers are processes on this machine (--workers)
+# or on other machines sharing the file (--worker-only --queue PATH). Each worker
+# leases a batch of tasks, and the lease expires if the worker dies. Failed tasks
+# go back to the queue until QUEUE_MAX_ATTEMPTS. Listing pages are queued
+# QUEUE_LISTING_WINDOW at a time; once a window is done, the next one is only
+# queued if the last LISTING_STOP_AFTER pages still brought new job URLs, as in
+# the sequential crawl (LISTING_PROBE is not used here). When a listing kind has
+# no work left, its detail URLs are queued in listing order, deduplicated and
+# limited like the single-process path. All workers share one per-host rate budget
+# through HOST_BUDGET_DB. Afterwards merge_queue_results() writes the usual
+# listing/detail CSVs, and main() carries on from them. A finished queue is then
+# deleted, so every run crawls afresh; one with tasks still leased elsewhere is
+# kept and resumed by the next run.
+QUEUE_STAGES = {
+    # listing kind: (detail kind, listing parser, detail parser, detail limit setting, frontier source)
+    "fresher_listing": ("fresher_detail", parse_fresher_listing, parse_fresher_detail, "FRESHER_DETAIL_LIMIT", "fresher"),
+    "it_listing": ("it_detail", parse_it_listing, parse_it_job_detail, None, "it"),
+}
+# Module settings copied into spawned worker processes.
+WORKER_SETTINGS = ["OUTPUT_DIR", "FRESHER_SITE", "FRESHER_SEARCH_URL", "IT_SEARCH_URL", "FRESHER_PAGES",
+                   "FRESHER_DETAIL_LIMIT", "IT_PAGES", "FETCH_CONCURRENCY", "HOST_RATE", "HOST_BURST",
+                   "HOST_RATE_MIN", "HOST_RATE_MAX", "HTML_CACHE_DIR", "REPLAY", "PARSER_BACKEND", "QUEUE_BATCH",
+                   "QUEUE_LEASE_SECONDS", "QUEUE_MAX_ATTEMPTS", "QUEUE_POLL_SECONDS"]
+
+class WorkQueue:
+    """SQLite task table with leases.
+
+    A task is (kind, key, payload). It is pending, leased (to a worker, until
+    lease_until), done (with a JSON result) or failed. Every state change is
+    one BEGIN IMMEDIATE transaction, so any number of processes can share the
+    file. The database runs in WAL mode, which needs a filesystem with working
+    locks (a local disk, or a network share that supports them).
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(OUTPUT_DIR, QUEUE_DB)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY,
+                kind TEXT,
+                key TEXT,
+                priority INTEGER,
+                payload TEXT,
+                state TEXT DEFAULT 'pending',
+                attempts INTEGER DEFAULT 0,
+                worker TEXT,
+                lease_until REAL,
+                result TEXT,
+                error TEXT,
+                updated REAL,
+                UNIQUE (kind, key)
+            )""")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, priority, id)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _begin(self):
+        # `with self._begin():` commits on success and rolls back on error.
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def add(self, kind, items):
+        """Queue (priority, key, payload) items not queued before; failed ones get another chance."""
+        now = time.time()
+        with self._begin():
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tasks (kind, key, priority, payload, updated) VALUES (?, ?, ?, ?, ?)",
+                ((kind, key, priority, json.dumps(payload), now) for priority, key, payload in items))
+            self.conn.execute("UPDATE tasks SET state = 'pending', attempts = 0, error = NULL "
+                              "WHERE kind = ? AND state = 'failed'", (kind,))
+
+    def lease(self, worker, limit, seconds=None):
+        """Lease up to `limit` pending tasks to `worker`: [(id, kind, key, payload)]."""
+        now = time.time()
+        with self._begin():
+            # Leases that ran out belong to dead or stuck workers: retry, or give up after too many attempts.
+            self.conn.execute(
+                "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = 'lease expired', worker = NULL WHERE state = 'leased' AND lease_until < ?",
+                (QUEUE_MAX_ATTEMPTS, now))
+            rows = self.conn.execute(
+                "SELECT id, kind, key, payload FROM tasks WHERE state = 'pending' ORDER BY priority, id LIMIT ?",
+                (limit,)).fetchall()
+            self.conn.executemany(
+                "UPDATE tasks SET state = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1, "
+                "updated = ? WHERE id = ?",
+                ((worker, now + (seconds or QUEUE_LEASE_SECONDS), now, row[0]) for row in rows))
+        return [(task_id, kind, key, json.loads(payload)) for task_id, kind, key, payload in rows]
+
+    def complete(self, task_id, worker, result):
+        """Store a task's result. False if the lease was lost (another worker owns it now)."""
+        with self._begin():
+            cursor = self.conn.execute(
+                "UPDATE tasks SET state = 'done', result = ?, error = NULL, updated = ? "
+                "WHERE id = ? AND state = 'leased' AND worker = ?",
+                (json.dumps(result), time.time(), task_id, worker))
+        return cursor.rowcount == 1
+
+    def fail(self, task_id, worker, error):
+        """Give a leased task back to the queue, or mark it failed after QUEUE_MAX_ATTEMPTS."""
+        with self._begin():
+            self.conn.execute(
+                "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, worker = NULL, updated = ? WHERE id = ? AND state = 'leased' AND worker = ?",
+                (QUEUE_MAX_ATTEMPTS, str(error), time.time(), task_id, worker))
+
+    def plan_listing(self, kind, urls, window, stop_after):
+        """Queue the first `window` of a listing's page `urls`; extend_listing() queues the rest as needed."""
+        plan = {"urls": list(urls), "window": window, "stop_after": stop_after}
+        with self._begin():
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                              (f"listing:{kind}", json.dumps(plan)))
+        self.add(kind, ((page, url, {"url": url}) for page, url in enumerate(plan["urls"][:window], start=1)))
+
+    def extend_listing(self, kind):
+        """Once a listing window is done, queue the next one unless the results have ended. Returns how many."""
+        with self._begin():
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (f"listing:{kind}",)).fetchone()
+            open_tasks = self.conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE kind = ? AND state IN ('pending', 'leased')", (kind,)).fetchone()[0]
+            if row is None or open_tasks:
+                return 0
+            plan = json.loads(row[0])
+            queued = self.conn.execute("SELECT COALESCE(MAX(priority), 0) FROM tasks WHERE kind = ?",
+                                       (kind,)).fetchone()[0]
+            # Same rule as crawl_listing_pages: pages whose URLs were all seen before count as empty.
+            seen, streak = set(), 0
+            for (result,) in self.conn.execute(
+                    "SELECT result FROM tasks WHERE kind = ? AND state = 'done' ORDER BY priority", (kind,)):
+                found = json.loads(result) or []
+                streak = 0 if set(found) - seen else streak + 1
+                seen.update(found)
+            if plan["stop_after"] and streak >= plan["stop_after"]:
+                return 0
+            urls = plan["urls"][queued:queued + plan["window"]]
+            now = time.time()
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tasks (kind, key, priority, payload, updated) VALUES (?, ?, ?, ?, ?)",
+                ((kind, url, page, json.dumps({"url": url}), now) for page, url in enumerate(urls, start=queued + 1)))
+        return len(urls)
+
+    def release_details(self, listing_kind, detail_kind, limit=None):
+        """Once no `listing_kind` work is left, queue its detail URLs (once). Returns how many were queued."""
+        with self._begin():
+            flag = f"released:{detail_kind}"
+            if self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (flag,)).fetchone():
+                return 0
+            open_tasks = self.conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE kind = ? AND state IN ('pending', 'leased')",
+                (listing_kind,)).fetchone()[0]
+            if open_tasks:
+                return 0
+            urls = [url for (result,) in self.conn.execute(
+                        "SELECT result FROM tasks WHERE kind = ? AND state = 'done' ORDER BY priority, id",
+                        (listing_kind,))
+                    for url in json.loads(result) or []]
+            urls = list(dict.fromkeys(normalize_url(url) for url in urls))[:limit]
+            now = time.time()
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tasks (kind, key, priority, payload, updated) VALUES (?, ?, ?, ?, ?)",
+                ((detail_kind, url, i, json.dumps({"url": url}), now) for i, url in enumerate(urls)))
+            self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (flag, str(len(urls))))
+        return len(urls)
+
+    def outstanding(self):
+        """Tasks still pending or leased."""
+        return self.conn.execute("SELECT COUNT(*) FROM tasks WHERE state IN ('pending', 'leased')").fetchone()[0]
+
+    def results(self, kind):
+        """(key, result) of every finished task of `kind`, in queue order."""
+        for key, result in self.conn.execute(
+                "SELECT key, result FROM tasks WHERE kind = ? AND state = 'done' ORDER BY priority, id", (kind,)):
+            yield key, json.loads(result)
+
+    def counts(self):
+        """{kind: {state: count}}"""
+        counts = {}
+        for kind, state, n in self.conn.execute("SELECT kind, state, COUNT(*) FROM tasks GROUP BY kind, state"):
+            counts.setdefault(kind, {})[state] = n
+        return counts
+
+    def close(self):
+        self.conn.close()
+
+    def remove(self):
+        """Close the queue and delete its file (and SQLite's WAL side files)."""
+        self.close()
+        for path in (self.path, self.path + "-wal", self.path + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+def seed_work_queue(work_queue, fresher_pages=None, it_pages=None):
+    """Plan every listing page and queue the first window (re-seeding an existing queue only adds what is missing)."""
+    fresher_pages = fresher_pages or FRESHER_PAGES
+    it_pages = it_pages or IT_PAGES
+    fresher_urls = [FRESHER_SEARCH_URL.format(page) for page in range(1, fresher_pages + 1)]
+    it_urls = [f"{IT_SEARCH_URL}&sequence={page}" for page in range(1, it_pages + 1)]
+    for kind, urls in (("fresher_listing", fresher_urls), ("it_listing", it_urls)):
+        work_queue.plan_listing(kind, urls, QUEUE_LISTING_WINDOW, LISTING_STOP_AFTER)
+
+def process_queue_tasks(work_queue, worker, kind, tasks, engine):
+    """Fetch and parse one kind's leased tasks, storing each result (or failure) in the queue."""
+    listing_stage = QUEUE_STAGES.get(kind)
+    if listing_stage:
+        parse = lambda url, html: listing_stage[1](html)
+    else:
+        parse = next(stage[2] for stage in QUEUE_STAGES.values() if stage[0] == kind)
+    by_url = {payload["url"]: task_id for task_id, _, _, payload in tasks}
+    for url, resp, err in engine.map(list(by_url)):
+        task_id = by_url[url]
+        if err is not None:
+            print(f"  [{worker}] {kind} error for {url}: {err}")
+            work_queue.fail(task_id, worker, err)
+            continue
+        if resp.status_code in RETRY_STATUSES:
+            work_queue.fail(task_id, worker, f"status {resp.status_code}")
+            continue
+        if resp.status_code != 200:
+            # Same as the serial scrapers: a page that is gone is skipped, not retried.
+            work_queue.complete(task_id, worker, None)
+            continue
         try:
-            print(f"[IT DETAILS] Scraping ({i}/{len(urls)}): {url}")
-            resp = session.get(url, headers=headers, timeout=15, verify=False)
-            if resp.status_code != 200:
-                print(f"  Skipping (status {resp.status_code})")
-                continue
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Job title
-            title_tag = soup.find("h1", class_="jd-job-title")
-            title = title_tag.get_text(strip=True) if title_tag else None
-
-            # Company
-            company_tag = soup.find("h2")
-            company = company_tag.get_text(strip=True) if company_tag else None
-
-            # Posting date
-            posted = None
-            posted_tag = soup.find("span", class_="posted-days")
-            if posted_tag:
-                posted = posted_tag.get_text(strip=True)
-
-            # Location
-            location = None
-            loc_i = soup.find("i", class_="location")
-            if loc_i:
-                parent_li = loc_i.find_parent("li")
-                if parent_li:
-                    location = re.sub(r"\s+", " ", parent_li.get_text(separator=" ", strip=True)).strip()
-
-            # Experience
-            experience = None
-            exp_i = soup.find("i", class_="experience")
-            if exp_i:
-                parent_li = exp_i.find_parent("li")
-                if parent_li:
-                    experience = re.sub(r"\s+", " ", parent_li.get_text(separator=" ", strip=True)).strip()
-
-            # Salary
-            salary = None
-            sal_i = soup.find("i", class_="salary")
-            if sal_i:
-                parent_li = sal_i.find_parent("li")
-                if parent_li:
-                    salary = re.sub(r"\s+", " ", parent_li.get_text(separator=" ", strip=True)).strip()
-
-            # Industry, Qualification, Employment Type
-            industry = None
-            qualification = None
-            employment_type = None
-
-            for li in soup.find_all("li", class_="clearfix"):
-                label = li.find("label")
-                if not label:
-                    continue
-                label_text = label.get_text()
-                if "Industry" in label_text:
-                    span = li.find("span", class_="basic-info-dtl")
-                    if span:
-                        industry = re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
-                if "Qualification" in label_text:
-                    span = li.find("span", class_="basic-info-dtl")
-                    if span:
-                        qualification = re.sub(r"\s+", " ", span.get_text(strip=True)).strip()
-
-            # Employment type possibility
-            employment_tag = soup.find("span", class_="mt-4")
-            if employment_tag:
-                employment_type = re.sub(r"\s+", " ", employment_tag.get_text(strip=True)).strip()
-
-            # Skills tags
-            skills = []
-            for a in soup.select("span.jd-skill-tag a"):
-                if a.get("title"):
-                    skills.append(a.get("title").replace(" Jobs", ""))
-            skills_text = ", ".join(skills) if skills else None
-
-            # Description
-            desc_div = soup.find("div", class_="jd-desc")
-            description = desc_div.get_text(" ", strip=True) if desc_div else None
-
-            data.append({
-                "URL": url,
-                "Job_Title": title,
-                "Company": company,
-                "Posting_Date": posted,
-                "Location": location,
-                "Experience": experience,
-                "Salary": salary,
-                "Industry": industry,
-                "Qualification": qualification,
-                "Employment_Type": employment_type,
-                "Skills": skills_text,
-                "Description": description
-            })
-
-            sleep_time = random.uniform(2, 6)
-            print(f"  Sleeping for {sleep_time:.2f} seconds...")
-            time.sleep(sleep_time)
-
+            with engine.metrics.timed("parse"):
+                result = parse(url, resp.text)
         except Exception as e:
-            print(f"  Error scraping {url}: {e}")
+            print(f"  [{worker}] {kind} parse error for {url}: {e}")
+            work_queue.fail(task_id, worker, e)
             continue
+        work_queue.complete(task_id, worker, result)
+        engine.metrics.add("records", len(result) if listing_stage else 1)
+
+def run_queue_worker(queue_path=None, worker=None):
+    """Lease and process tasks until the queue has nothing left. Safe to run on many machines at once."""
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    work_queue = WorkQueue(queue_path)
+    global HOST_BUDGET_DB
+    HOST_BUDGET_DB = HOST_BUDGET_DB or work_queue.path
+    headers = {"User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")}
+    engines = {}
+    done = 0
+    print(f"[QUEUE] Worker {worker} started on {work_queue.path}")
+    try:
+        while True:
+            tasks = work_queue.lease(worker, QUEUE_BATCH)
+            if not tasks:
+                released = 0
+                for listing_kind, (detail_kind, _, _, limit_setting, _) in QUEUE_STAGES.items():
+                    limit = globals()[limit_setting] if limit_setting else None
+                    released += (work_queue.extend_listing(listing_kind)
+                                 or work_queue.release_details(listing_kind, detail_kind, limit))
+                if not released and not work_queue.outstanding():
+                    break
+                if not released:
+                    time.sleep(QUEUE_POLL_SECONDS)   # others hold leases; theirs may expire or add work
+                continue
+            for kind in dict.fromkeys(task[1] for task in tasks):
+                engine = engines.get(kind)
+                if engine is None:
+                    engine = engines[kind] = FetchEngine(headers=headers, stage=f"queue_{kind}")
+                process_queue_tasks(work_queue, worker, kind, [task for task in tasks if task[1] == kind], engine)
+            done += len(tasks)
+            print(f"[QUEUE] {worker}: {done} tasks processed, {work_queue.outstanding()} outstanding")
+    finally:
+        work_queue.close()
+    return done
+
+def queue_worker_process(settings, queue_path, worker):
+    """Entry point of a spawned local worker: adopt the parent's settings, then work the queue."""
+    globals().update(settings, RUN_HISTORY_FILE=None)   # the coordinator's report goes to the history
+    with METRICS.run("queue_crawl"):
+        run_queue_worker(queue_path, worker)
+    METRICS.write_report(os.path.join(OUTPUT_DIR, f"run_report.{worker}.json"))
+
+def merge_queue_results(work_queue):
+    """Write the listing and detail CSVs from a finished queue, as the serial stages would."""
+    frontier = UrlFrontier()
+    try:
+        for listing_kind, (detail_kind, _, _, _, source) in QUEUE_STAGES.items():
+            listed = [url for _, urls in work_queue.results(listing_kind) for url in urls or []]
+            all_urls, new_count = frontier.add(listed, source)
+            listing_csv, column, details_csv = (
+                ("timesjobs_job_urls.csv", "Job_URL", "timesjobs_job_details.csv") if source == "fresher"
+                else ("timesjobs_ITjob_URL.csv", "URL", "timesjobs_ITjobs.csv"))
+            pd.DataFrame({column: all_urls}).to_csv(os.path.join(OUTPUT_DIR, listing_csv), index=False)
+            with CsvSink(os.path.join(OUTPUT_DIR, details_csv)) as sink:
+                for _, record in work_queue.results(detail_kind):
+                    if record:
+                        frontier.mark_scraped(record["URL"], source)
+                        sink.write([record])
+            print(f"[QUEUE] {source}: {len(all_urls)} listed URLs ({new_count} new), {sink.rows} detail records")
+    finally:
+        frontier.close()
+    failed = {kind: states["failed"] for kind, states in work_queue.counts().items() if states.get("failed")}
+    if failed:
+        print(f"[QUEUE] Gave up on {failed} tasks after {QUEUE_MAX_ATTEMPTS} attempts (re-run to retry them)")
+
+def run_queue_crawl(workers=None, queue_path=None):
+    """Seed the queue, crawl it with `workers` local processes and merge the results."""
+    workers = workers or QUEUE_WORKERS
+    work_queue = WorkQueue(queue_path)
+    seed_work_queue(work_queue)
+    print(f"[QUEUE] {work_queue.outstanding()} tasks outstanding in {work_queue.path}; starting {workers} workers")
+    settings = {name: globals()[name] for name in WORKER_SETTINGS}
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=queue_worker_process, name=f"queue-worker-{i}",
+                                 args=(settings, work_queue.path, f"{socket.gethostname()}-w{i}"))
+                 for i in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    outstanding = work_queue.outstanding()
+    if outstanding:
+        print(f"[QUEUE] {outstanding} tasks still leased by other workers; merging what is done")
+    merge_queue_results(work_queue)
+    if outstanding:
+        print(f"[QUEUE] Keeping {work_queue.path}; the next run resumes it")
+        work_queue.close()
+    else:
+        # Finished and merged: the next run must list the site again, not re-merge these results.
+        work_queue.remove()
+
+# --- Feature engineering: Salary (LPA) and Experience (years) normalization ---
+# Salary/Experience are free text ("Rs 3.50 - 6.00 Lacs p.a.", "0 - 3 Years",
+# "As per industry standards", "5+ Yrs", "Fresher"). There are only a few
+# hundred distinct strings, so each one is parsed once and the results are
+# broadcast back to every row through pd.factorize codes.
+NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+SALARY_UNITS = [                      # (pattern, multiplier to lakhs) - first match wins
+    (re.compile(r'\bcr(?:ore)?s?\b'), 100.0),
+    (re.compile(r'\bl(?:ac|akh)s?\b|\blpa\b|\bl\b'), 1.0),
+    (re.compile(r'\d\s*k\b|\bthousands?\b'), 0.01),
+]
+MONTHLY_RE = re.compile(r'per month|/ ?month|\bp\.?\s?m\b|\bmonthly\b|\bpm\b')
+UPTO_RE = re.compile(r'\bup ?to\b|\bmax(?:imum)?\b|\bless than\b|\bbelow\b|<')
+AT_LEAST_RE = re.compile(r'\+|\bmin(?:imum)?\b|\bat ?least\b|\babove\b|\bmore than\b|>')
+MONTHS_RE = re.compile(r'\bmonths?\b|\bmos?\b')
+YEARS_RE = re.compile(r'\byears?\b|\byrs?\b')
+EXPERIENCE_UNITS = [(MONTHS_RE, 1 / 12), (YEARS_RE, 1.0)]   # (pattern, multiplier to years)
+FRESHER_RE = re.compile(r'\bfreshers?\b')
+# Upper bounds (in years, exclusive) of each Experience_Category, checked in order.
+EXPERIENCE_CATEGORIES = [(1, "Fresher"), (3, "Junior"), (6, "Mid-level"), (10, "Senior")]
+EXPERIENCE_TOP_CATEGORY = "Lead"
+NORMALIZED_COLUMNS = ["Salary_Min_LPA", "Salary_Max_LPA", "Experience_Min_Years",
+                      "Experience_Max_Years", "Experience_Category"]
+
+def _scaled_numbers(text, units):
+    """Each number in `text` with the multiplier of the unit written after it (None if unknown).
+
+    A unit belongs to the number before it, so "6 months - 1 year" is 6 months
+    and 1 year. Ranges usually name the unit once ("3 - 6 Lacs"), so a number
+    without a unit of its own takes the next number's, or else the previous one's.
+    """
+    matches = list(NUMBER_RE.finditer(text))
+    factors = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        tail = text[match.start():end]          # with the number, for units like "50k"
+        factors.append(next((factor for pattern, factor in units if pattern.search(tail)), None))
+    for order in (range(len(factors) - 1, -1, -1), range(len(factors))):
+        carried = None
+        for i in order:
+            factors[i] = carried = factors[i] if factors[i] is not None else carried
+    return [(float(match.group()), factor) for match, factor in zip(matches, factors)]
+
+def _range_bounds(text, numbers):
+    """(min, max) from the numbers in a range string, honouring "up to" / "5+" wording."""
+    if not numbers:
+        return None, None
+    if len(numbers) >= 2:
+        low, high = numbers[0], numbers[1]
+        return (low, high) if low <= high else (high, low)
+    if UPTO_RE.search(text):
+        return None, numbers[0]
+    if AT_LEAST_RE.search(text):
+        return numbers[0], None
+    return numbers[0], numbers[0]
+
+def parse_salary(text):
+    """(min_lpa, max_lpa) for a raw Salary string; (None, None) if it states no amount."""
+    if not isinstance(text, str):
+        return None, None
+    text = text.lower().replace(",", "")
+    scaled = _scaled_numbers(text, SALARY_UNITS)
+    if not scaled:
+        return None, None
+    if scaled[0][1] is None:
+        # No unit: plain rupee amounts are large ("300000 - 500000"), lakh figures are small.
+        default = 1e-5 if max(number for number, _ in scaled) >= 1000 else 1.0
+        scaled = [(number, default) for number, _ in scaled]
+    yearly = 12 if MONTHLY_RE.search(text) else 1
+    low, high = _range_bounds(text, [number * factor * yearly for number, factor in scaled])
+    return (round(low, 2) if low is not None else None,
+            round(high, 2) if high is not None else None)
+
+def parse_experience(text):
+    """(min_years, max_years) for a raw Experience string; freshers are (0, 0)."""
+    if not isinstance(text, str):
+        return None, None
+    text = text.lower()
+    scaled = _scaled_numbers(text, EXPERIENCE_UNITS)
+    if not scaled:
+        return (0.0, 0.0) if FRESHER_RE.search(text) else (None, None)
+    # Years unless a unit says otherwise; each bound is converted before the two are ordered.
+    low, high = _range_bounds(text, [number * (1.0 if factor is None else factor) for number, factor in scaled])
+    return (round(low, 2) if low is not None else None,
+            round(high, 2) if high is not None else None)
+
+def experience_category(min_years, max_years):
+    """Bucket a year range by its lower bound (the upper bound when there is none)."""
+    years = min_years if min_years is not None else max_years
+    if years is None:
+        return None
+    for upper, name in EXPERIENCE_CATEGORIES:
+        if years < upper:
+            return name
+    return EXPERIENCE_TOP_CATEGORY
+
+def map_unique(values, parse_func):
+    """Apply `parse_func` once per distinct value of `values`; return (codes, parsed uniques).
+
+    codes[i] indexes the parsed list for row i; missing values get code -1,
+    which picks the trailing entry appended for them.
+    """
+    codes, uniques = pd.factorize(values)
+    parsed = [parse_func(value) for value in uniques]
+    parsed.append(parse_func(None))
+    return codes, parsed
+
+def normalize_salary_experience(df):
+    """Return a copy of `df` with NORMALIZED_COLUMNS derived from Salary and Experience."""
+    df = df.copy()
+    for source, parse_func, low_col, high_col in [
+            ("Salary", parse_salary, "Salary_Min_LPA", "Salary_Max_LPA"),
+            ("Experience", parse_experience, "Experience_Min_Years", "Experience_Max_Years")]:
+        values = df[source] if source in df.columns else pd.Series([None] * len(df), dtype=object)
+        codes, parsed = map_unique(values, parse_func)
+        bounds = np.array([(np.nan if low is None else low, np.nan if high is None else high)
+                           for low, high in parsed], dtype=float)
+        df[low_col] = bounds[codes, 0]
+        df[high_col] = bounds[codes, 1]
+        if source == "Experience":
+            categories = np.array([experience_category(low, high) for low, high in parsed], dtype=object)
+            df["Experience_Category"] = categories[codes]
+    return df
 
-    df_it = pd.DataFrame(data)
-    out_path = os.path.join(OUTPUT_DIR, "timesjobs_ITjobs.csv")
-    df_it.to_csv(out_path, index=False)
-    print(f"[IT DETAILS] Saved {len(df_it)} IT records to {out_path}")
-    return df_it
-
-# --- Part 7: Final concatenation and saving to Excel ---
-def finalize_and_save(df_freshers, df_it):
-    # Drop the columns specified in your original script
-    if not df_freshers.empty:
-        if "Posting_Time" in df_freshers.columns:
-            df_freshers.drop(columns=["Posting_Time"], inplace=True, errors='ignore')
-        for col in ["Qualification", "Employment_Type"]:
-            if col in df_freshers.columns:
-                df_freshers.drop(columns=[col], inplace=True, errors='ignore')
-
-    if not df_it.empty:
-        for col in ["Posting_Date", "Qualification", "Employment_Type"]:
-            if col in df_it.columns:
-                df_it.drop(columns=[col], inplace=True, errors='ignore')
-
-    # Concatenate (keep original order of columns as you requested)
-    timesjobs = pd.concat([df_freshers, df_it], ignore_index=True, sort=False)
-
-    # Desired column order (from your original script)
-    columns_wanted = ["Company", "Industry", "Job_Title", "Experience", "Salary", "Location", "Description", "Skills", "URL"]
-    # Retain only available columns but keep order
-    cols_present = [c for c in columns_wanted if c in timesjobs.columns]
-    timejobs_data = timesjobs[cols_present]
+# --- Skills index: integer vocabulary, CSR posting x skill matrix, inverted index ---
+# Skills arrive as "Python, SQL, Data Analysis" (IT tag lists) or free text
+# after "Skills" in fresher descriptions. Each distinct Skills string is split
+# and canonicalized once, postings become rows of a CSR matrix over an integer
+# skill vocabulary, and the transpose (skill -> sorted posting ids) is the
+# inverted index. Queries then work on small integer arrays, not strings.
+SKILL_SPLIT_RE = re.compile(r'[,;|•\n]+|\s+\band\b\s+|\s+&\s+', re.IGNORECASE)
+SKILL_STRIP = " \t.:-*()[]'\""
+SKILL_ALIASES = {
+    "js": "javascript", "node": "node.js", "nodejs": "node.js", "reactjs": "react", "react.js": "react",
+    "ms excel": "excel", "microsoft excel": "excel", "advanced excel": "excel", "ms office": "ms-office",
+    "microsoft office": "ms-office", "ml": "machine learning", "c sharp": "c#", "golang": "go",
+    "communication skills": "communication", "good communication": "communication",
+}
+SKILL_MAX_LEN = 40           # longer fragments are sentences, not skills
+
+def _gather_ranges(starts, lengths):
+    """Concatenated positions start[k]..start[k]+length[k]-1 for every k, without a Python loop."""
+    return np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+
+def canonical_skill(token):
+    """Lower-cased, trimmed, alias-resolved skill name; None for empty / sentence-like fragments."""
+    token = " ".join(token.split()).strip(SKILL_STRIP).lower()
+    if not token or len(token) > SKILL_MAX_LEN:
+        return None
+    return SKILL_ALIASES.get(token, token)
+
+def split_skills(text):
+    """Distinct canonical skills in a raw Skills string, in order of first appearance."""
+    if not isinstance(text, str):
+        return []
+    skills = []
+    for token in SKILL_SPLIT_RE.split(text):
+        skill = canonical_skill(token)
+        if skill and skill not in skills:
+            skills.append(skill)
+    return skills
+
+class SkillsIndex:
+    """Posting x skill CSR matrix (indptr / indices) plus its transpose as an inverted index.
+
+    Row i is posting i of the dataset; vocab[j] is skill id j. skill_indptr /
+    skill_postings hold, for each skill, the sorted ids of postings that list it.
+    """
+
+    def __init__(self, vocab, indptr, indices):
+        self.vocab = list(vocab)
+        self.skill_ids = {skill: i for i, skill in enumerate(self.vocab)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        # Transpose: a stable sort by skill id keeps posting ids ascending within each skill.
+        rows = np.repeat(np.arange(self.n_postings, dtype=np.int32), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        self.skill_postings = rows[order]
+        self.skill_indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=len(self.vocab)), out=self.skill_indptr[1:])
+
+    @property
+    def n_postings(self):
+        return len(self.indptr) - 1
+
+    @classmethod
+    def build(cls, skills_values):
+        """Index an iterable of raw Skills strings (one per posting)."""
+        builder = SkillsIndexBuilder()
+        builder.add(skills_values)
+        return builder.finish()
+
+    def save(self, path):
+        np.savez_compressed(path, vocab=np.array(self.vocab, dtype=str), indptr=self.indptr, indices=self.indices)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["vocab"].tolist(), data["indptr"], data["indices"])
+
+    def postings(self, skill):
+        """Sorted ids of postings listing `skill` (empty if the skill is unknown)."""
+        skill_id = self.skill_ids.get(canonical_skill(skill) or "")
+        if skill_id is None:
+            return np.zeros(0, dtype=np.int32)
+        return self.skill_postings[self.skill_indptr[skill_id]:self.skill_indptr[skill_id + 1]]
+
+    def postings_with_all(self, *skills):
+        """Posting ids listing every one of `skills` ("Python AND SQL")."""
+        lists = sorted((self.postings(skill) for skill in skills), key=len)
+        result = lists[0] if lists else np.zeros(0, dtype=np.int32)
+        for ids in lists[1:]:
+            result = np.intersect1d(result, ids, assume_unique=True)
+        return result
+
+    def postings_with_any(self, *skills):
+        """Posting ids listing at least one of `skills`."""
+        return np.unique(np.concatenate([self.postings(skill) for skill in skills] or [np.zeros(0, dtype=np.int32)]))
+
+    def skill_counts(self, postings=None):
+        """Number of postings per skill id, over all postings or the given posting ids."""
+        if postings is None:
+            return np.bincount(self.indices, minlength=len(self.vocab))
+        postings = np.asarray(postings, dtype=np.int64)
+        starts = self.indptr[postings]
+        entries = _gather_ranges(starts, self.indptr[postings + 1] - starts)
+        return np.bincount(self.indices[entries], minlength=len(self.vocab))
+
+    def top_skills(self, n=10, postings=None):
+        """[(skill, count)] for the `n` most requested skills."""
+        counts = self.skill_counts(postings)
+        top = np.argsort(-counts, kind="stable")[:n]
+        return [(self.vocab[i], int(counts[i])) for i in top if counts[i]]
+
+    def top_skills_by(self, groups, n=10):
+        """{group: [(skill, count)]} for a per-posting grouping column such as Industry."""
+        codes, labels = pd.factorize(groups if isinstance(groups, pd.Series) else pd.Series(list(groups), dtype=object))
+        rows = np.repeat(codes, np.diff(self.indptr))
+        keep = rows >= 0
+        counts = np.bincount(rows[keep].astype(np.int64) * len(self.vocab) + self.indices[keep],
+                             minlength=len(labels) * len(self.vocab)).reshape(len(labels), len(self.vocab))
+        result = {}
+        for g, label in enumerate(labels):
+            top = np.argsort(-counts[g], kind="stable")[:n]
+            result[label] = [(self.vocab[i], int(counts[g, i])) for i in top if counts[g, i]]
+        return result
+
+    def to_scipy(self):
+        """The posting x skill matrix as a scipy.sparse.csr_matrix (needs scipy)."""
+        from scipy.sparse import csr_matrix
+        data = np.ones(len(self.indices), dtype=np.int8)
+        return csr_matrix((data, self.indices, self.indptr), shape=(self.n_postings, len(self.vocab)))
+
+class SkillsIndexBuilder:
+    """Builds a SkillsIndex chunk by chunk, keeping only skill ids (never the Skills text) between chunks."""
+
+    def __init__(self):
+        self.skill_ids = {}
+        self.lengths, self.indices = [], []
+
+    def add(self, skills_values):
+        """Append the postings of one chunk of raw Skills strings."""
+        if not isinstance(skills_values, pd.Series):
+            skills_values = pd.Series(list(skills_values), dtype=object)
+        codes, parsed = map_unique(skills_values, split_skills)
+        # Skill ids of every distinct Skills string in the chunk, laid out back to back.
+        flat, unique_lengths = [], []
+        for skills in parsed:
+            ids = sorted(self.skill_ids.setdefault(skill, len(self.skill_ids)) for skill in skills)
+            flat.extend(ids)
+            unique_lengths.append(len(ids))
+        flat = np.array(flat, dtype=np.int32)
+        unique_lengths = np.array(unique_lengths, dtype=np.int64)
+        unique_starts = np.cumsum(unique_lengths) - unique_lengths
+        # Missing values have code -1, i.e. the trailing (empty) entry map_unique appends.
+        lengths = unique_lengths[codes]
+        self.lengths.append(lengths)
+        self.indices.append(flat[_gather_ranges(unique_starts[codes], lengths)])
+
+    def finish(self):
+        lengths = np.concatenate(self.lengths) if self.lengths else np.zeros(0, dtype=np.int64)
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        indices = np.concatenate(self.indices) if self.indices else np.zeros(0, dtype=np.int32)
+        return SkillsIndex(list(self.skill_ids), indptr, indices)
+
+def save_skills_index(index, out_path):
+    """Save the final dataset's SkillsIndex next to it."""
+    index.save(out_path)
+    print(f"[SKILLS] Indexed {len(index.vocab)} distinct skills over {index.n_postings} postings "
+          f"({len(index.indices)} posting-skill pairs) to {out_path}")
+    return index
+
+# --- Keyword classifier: rule tables -> one combined regex -> Industry / title / skill groups ---
+# Industry labels, job titles and skill tags come in thousands of spellings.
+# Each rule table maps a group to its keywords. A table is compiled into one
+# regex whose alternation is shaped like a trie of the keywords, so a single
+# scan of a text finds every keyword in it. Keywords only match as whole words.
+# Only distinct values are classified (a column of 150K rows holds a few
+# thousand), and each classifier caches its answers across chunks.
+# Rules are listed in priority order: a text matching several single-label
+# groups gets the earliest one ("Software Test Engineer" is QA, not development).
+INDUSTRY_RULES = [
+    ("BPO / ITES", ["bpo", "ites", "kpo", "call centre", "call center", "transcription", "crm"]),
+    ("IT / Software", ["it", "software", "information technology", "it services", "saas", "internet",
+                       "e-commerce", "ecommerce", "hardware", "networking"]),
+    ("Banking / Finance", ["banking", "bank", "financial services", "finance", "broking", "insurance",
+                           "nbfc", "accounting", "accounts", "fintech", "investment"]),
+    ("Education / Training", ["education", "teaching", "training", "e-learning", "edtech", "academic"]),
+    ("Healthcare / Pharma", ["healthcare", "hospital", "hospitals", "medical", "pharma", "pharmaceutical",
+                             "pharmaceuticals", "biotech", "biotechnology", "clinical", "diagnostics"]),
+    ("Telecom", ["telecom", "telecommunications", "telecommunication", "isp"]),
+    ("Manufacturing / Engineering", ["manufacturing", "engineering", "automobile", "automotive", "auto ancillary",
+                                     "industrial", "machinery", "electrical", "electronics", "chemicals",
+                                     "steel", "textile", "textiles", "fmcg"]),
+    ("Construction / Real Estate", ["construction", "real estate", "infrastructure", "cement", "architecture",
+                                    "interior design"]),
+    ("Retail / Consumer", ["retail", "consumer durables", "consumer goods", "apparel", "fashion", "wholesale"]),
+    ("Media / Marketing", ["media", "advertising", "marketing", "entertainment", "publishing", "printing",
+                           "broadcasting", "events", "public relations"]),
+    ("Logistics / Transport", ["logistics", "courier", "transportation", "shipping", "freight", "aviation",
+                               "supply chain", "warehousing"]),
+    ("Hospitality / Travel", ["hospitality", "hotel", "hotels", "restaurant", "restaurants", "travel", "tourism"]),
+    ("Recruitment / Consulting", ["recruitment", "staffing", "placement", "manpower", "consulting", "consultancy",
+                                  "hr services"]),
+    ("Energy / Utilities", ["power", "energy", "oil", "gas", "petroleum", "solar", "utilities", "mining"]),
+]
+TITLE_RULES = [
+    ("QA / Testing", ["test", "tester", "testing", "qa", "quality assurance", "quality analyst", "sdet"]),
+    ("Data / Analytics", ["data", "analytics", "analyst", "data scientist", "machine learning", "ml", "ai",
+                          "business intelligence", "bi", "mis"]),
+    ("DevOps / Cloud", ["devops", "cloud", "sre", "site reliability", "aws", "azure", "platform engineer"]),
+    ("Network / IT Support", ["network", "system administrator", "sysadmin", "desktop support", "it support",
+                              "technical support", "helpdesk", "help desk", "infrastructure", "security"]),
+    ("Software Development", ["developer", "software", "programmer", "full stack", "fullstack", "frontend",
+                              "front end", "backend", "back end", "web", "java", "python", ".net", "php",
+                              "android", "ios", "react", "angular", "node", "sde", "coder", "application"]),
+    ("Design", ["designer", "design", "ui", "ux", "graphic", "graphics", "animator", "autocad"]),
+    ("Sales / Business Development", ["sales", "business development", "bde", "bdm", "relationship manager",
+                                      "telesales", "telecaller", "tele caller", "inside sales", "pre sales"]),
+    ("Marketing / Content", ["marketing", "digital marketing", "seo", "sem", "content", "writer", "copywriter",
+                             "social media", "brand", "branding", "pr"]),
+    ("Customer Service", ["customer service", "customer support", "customer care", "voice process",
+                          "non voice", "chat process", "call centre", "call center", "bpo", "csr"]),
+    ("Finance / Accounts", ["accountant", "accounts", "accounting", "finance", "financial", "audit", "auditor",
+                            "tax", "taxation", "ca", "payroll", "billing", "credit", "underwriter"]),
+    ("HR / Admin", ["hr", "human resource", "human resources", "recruiter", "recruitment", "talent acquisition",
+                    "admin", "administration", "administrative", "office assistant", "receptionist",
+                    "front office", "back office", "data entry"]),
+    ("Engineering", ["mechanical", "civil", "electrical", "electronics", "production", "maintenance",
+                     "site engineer", "quality engineer", "design engineer", "plant", "instrumentation"]),
+    ("Operations / Logistics", ["operations", "operation", "logistics", "supply chain", "procurement",
+                                "purchase", "store", "warehouse", "dispatch"]),
+    ("Teaching / Training", ["teacher", "faculty", "trainer", "tutor", "lecturer", "professor", "teaching"]),
+    ("Healthcare", ["nurse", "doctor", "pharmacist", "medical", "clinical", "physiotherapist", "lab technician"]),
+    ("Management", ["manager", "management", "head", "lead", "director", "chief", "vp", "president",
+                    "team leader", "supervisor", "coordinator", "executive assistant"]),
+    ("Trainee / Intern", ["trainee", "intern", "internship", "fresher", "freshers", "apprentice", "graduate"]),
+]
+SKILL_RULES = [
+    ("Programming", ["python", "java", "c", "c++", "c#", "javascript", "typescript", "golang", "go", "ruby",
+                     "php", "scala", "kotlin", "perl", "r", "rust", "swift", "vb.net", ".net", "asp.net",
+                     "core java", "j2ee", "oops"]),
+    ("Web", ["html", "html5", "css", "css3", "react", "reactjs", "react.js", "angular", "angularjs", "vue",
+             "vue.js", "node", "nodejs", "node.js", "django", "flask", "spring", "spring boot", "jquery",
+             "bootstrap", "wordpress", "laravel", "rest", "rest api", "web services"]),
+    ("Data / Analytics", ["sql", "mysql", "postgresql", "oracle", "mongodb", "nosql", "data analysis",
+                          "data analytics", "machine learning", "deep learning", "tableau", "power bi", "pandas",
+                          "numpy", "statistics", "big data", "hadoop", "spark", "etl", "data science", "ai",
+                          "nlp", "mis"]),
+    ("Cloud / DevOps", ["aws", "azure", "gcp", "cloud", "docker", "kubernetes", "jenkins", "devops", "ci/cd",
+                        "terraform", "ansible", "linux", "unix", "shell scripting", "git"]),
+    ("Mobile", ["android", "ios", "flutter", "react native", "xamarin", "mobile"]),
+    ("Testing", ["testing", "manual testing", "automation testing", "selenium", "qa", "junit", "testng",
+                 "cucumber", "jmeter", "test cases"]),
+    ("Networking / Security", ["networking", "network", "ccna", "tcp/ip", "firewall", "security",
+                               "cyber security", "cybersecurity", "vpn", "routing", "switching"]),
+    ("Design", ["photoshop", "illustrator", "figma", "ui", "ux", "graphic design", "coreldraw", "autocad",
+                "solidworks", "catia", "3ds max", "revit"]),
+    ("Office / Accounting", ["excel", "ms excel", "advanced excel", "ms office", "word", "powerpoint", "tally",
+                             "gst", "accounting", "accounts", "sap", "erp", "taxation", "bookkeeping"]),
+    ("Sales / Marketing", ["sales", "marketing", "digital marketing", "seo", "sem", "smo", "lead generation",
+                           "business development", "cold calling", "negotiation", "crm", "salesforce"]),
+    ("Communication / Soft skills", ["communication", "communication skills", "english", "presentation",
+                                     "interpersonal", "teamwork", "team player", "leadership",
+                                     "problem solving", "customer service", "time management"]),
+]
+CLASSIFY_FIELDS = True       # add Industry_Group / Title_Group / Skill_Groups to the final dataset
+CLASSIFIED_COLUMNS = ["Industry_Group", "Title_Group", "Skill_Groups"]
+OTHER_GROUP = "Other"        # group of a non-empty value no keyword matched
+WORD_CHAR = "a-z0-9"
+
+def trie_pattern(words):
+    """Regex matching any of `words`, with shared prefixes factored out ("java(?:script)?")."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        # Longer continuations come first and the end of a word is optional, so the
+        # longest keyword wins and shorter ones remain for backtracking.
+        return "(?:" + "|".join(branches) + (")?" if "" in node else ")")
+    return build(trie)
+
+class KeywordClassifier:
+    """Map texts to groups through a rule table of (group, [keywords]) in priority order."""
+
+    def __init__(self, rules, other=OTHER_GROUP, trie=True):
+        self.groups = [group for group, _ in rules]
+        self.other = other
+        self.priority = {}
+        for rank, (_, keywords) in enumerate(rules):
+            for keyword in keywords:
+                self.priority.setdefault(keyword.lower(), rank)
+        if trie:
+            body = trie_pattern(self.priority)
+        else:
+            # Flat alternation, longest keyword first: the same matches, tried one keyword at a time.
+            body = "|".join(re.escape(k) for k in sorted(self.priority, key=len, reverse=True))
+        self.pattern = re.compile(f"(?<![{WORD_CHAR}])(?:{body})(?![{WORD_CHAR}])")
+        self.cache = {}
+
+    def ranks(self, text):
+        """Sorted ranks of the groups whose keywords occur in `text` (one regex scan).
+
+        Matches do not overlap and the longest keyword wins, so "Data Entry
+        Operator" is HR / Admin even though "data" alone ranks higher.
+        """
+        return sorted({self.priority[m] for m in self.pattern.findall(text.lower())})
+
+    def classify(self, text):
+        """The highest-priority group in `text`; OTHER_GROUP if none, None for a missing value."""
+        if not isinstance(text, str) or not text.strip():
+            return None
+        ranks = self.ranks(text)
+        return self.groups[ranks[0]] if ranks else self.other
 
-    out_path = os.path.join(OUTPUT_DIR, "Timesjobs_data.xlsx")
-    timejobs_data.to_excel(out_path, index=False)
-    print(f"[FINAL] Saved combined data to {out_path}")
+    def tags(self, text):
+        """Every group in `text`, in priority order, joined with ", " (multi-label, for skills)."""
+        if not isinstance(text, str) or not text.strip():
+            return None
+        ranks = self.ranks(text)
+        return ", ".join(self.groups[rank] for rank in ranks) if ranks else self.other
+
+    def column(self, values, multi=False):
+        """Group of every value as an object array; each distinct value is classified once."""
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        label = self.tags if multi else self.classify
+        cache = self.cache.setdefault(multi, {})
+        for value in uniques:
+            if value not in cache:
+                cache[value] = label(value)
+        groups = np.array([cache[value] for value in uniques] + [None], dtype=object)
+        return groups[codes]
+
+CLASSIFIERS = {}
+
+def get_classifier(name):
+    """The shared KeywordClassifier for INDUSTRY / TITLE / SKILL rules, compiled on first use."""
+    if name not in CLASSIFIERS:
+        CLASSIFIERS[name] = KeywordClassifier({"industry": INDUSTRY_RULES, "title": TITLE_RULES,
+                                               "skills": SKILL_RULES}[name])
+    return CLASSIFIERS[name]
+
+def classify_fields(df):
+    """Return a copy of `df` with CLASSIFIED_COLUMNS binned from Industry, Job_Title and Skills."""
+    df = df.copy()
+    for source, name, column, multi in [("Industry", "industry", "Industry_Group", False),
+                                        ("Job_Title", "title", "Title_Group", False),
+                                        ("Skills", "skills", "Skill_Groups", True)]:
+        values = df[source] if source in df.columns else [None] * len(df)
+        df[column] = get_classifier(name).column(values, multi=multi)
+    return df
 
-# --- main flow ---
-def main():
-    # 1) Scrape fresher listing pages (500 pages)
-    listing_file = os.path.join(OUTPUT_DIR, "timesjobs_job_urls.csv")
-    if not os.path.exists(listing_file):
-        scrape_fresher_listing_pages(FRESHER_PAGES)
+def benchmark_keyword_classifier(rows=150000, seed=0):
+    """Time row-at-a-time binning with a flat keyword alternation against the trie regex + cache.
+
+    Runs on synthetic Industry / Job_Title / Skills columns, checks both give
+    identical groups and prints rows/sec.
+    """
+    rng = random.Random(seed)
+    industries = ["IT-Software/Software Services", "BPO/ITES/CRM/Transcription", "Banking/ Financial Services/ Broking",
+                  "Education/Teaching/Training", "Pharma/Biotech/Clinical Research", "Automobile/Auto Ancillary",
+                  "Real Estate/Property", "Advertising/Event Management/PR/MR", "Courier/ Freight/ Transportation",
+                  "Hotels/Hospitality/Restaurant", "Recruitment/Staffing", "Agriculture/Dairy", None]
+    roles = ["Software Engineer", "Java Developer", "Software Test Engineer", "Data Analyst", "Sales Executive",
+             "HR Recruiter", "Accountant", "Customer Support Executive", "Graphic Designer", "DevOps Engineer",
+             "Mechanical Engineer", "Digital Marketing Executive", "Store Manager", "Graduate Trainee", "Lab Attendant"]
+    levels = ["", "Senior ", "Junior ", "Lead ", "Trainee "]
+    skill_pool = [k for _, keywords in SKILL_RULES for k in keywords] + ["teamwork", "hindi", "driving", "ms-dos"]
+    industry = [rng.choice(industries) for _ in range(rows)]
+    titles = [f"{rng.choice(levels)}{rng.choice(roles)}{rng.choice(['', ' - Pune', ' ({})'.format(rng.randrange(99))])}"
+              for _ in range(rows)]
+    skills = [", ".join(rng.sample(skill_pool, rng.randint(2, 6))).title() if rng.random() > 0.05 else None
+              for _ in range(rows)]
+    columns = [(industry, INDUSTRY_RULES, False), (titles, TITLE_RULES, False), (skills, SKILL_RULES, True)]
+    pd.factorize(pd.Series([], dtype=object))   # import pandas (a lazy module) outside the timed runs
+
+    start = time.perf_counter()
+    reference = []
+    for values, rules, multi in columns:
+        flat = KeywordClassifier(rules, trie=False)
+        label = flat.tags if multi else flat.classify
+        reference.append([label(text) for text in values])
+    reference_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [KeywordClassifier(rules).column(values, multi) for values, rules, multi in columns]
+    compiled_secs = time.perf_counter() - start
+
+    identical = all(list(new) == old for new, old in zip(compiled, reference))
+    distinct = [len(set(values)) for values, _, _ in columns]
+    print(f"[BENCH] {rows} rows x 3 columns ({'/'.join(map(str, distinct))} distinct values): "
+          f"row-wise {reference_secs:.2f}s ({rows / reference_secs:,.0f} rows/s), "
+          f"compiled {compiled_secs:.2f}s ({rows / compiled_secs:,.0f} rows/s), identical={identical}")
+    return {"rows": rows, "reference_secs": reference_secs, "compiled_secs": compiled_secs, "identical": identical}
+
+# --- Near-duplicate detection: MinHash signatures + LSH banding -> Canonical_ID ---
+# Reposts differ by a word or two between the mobile and desktop sites, so exact
+# matching misses them. Each posting ("Company | Job_Title | Description") becomes
+# a set of word shingles. A MinHash signature estimates the Jaccard similarity of
+# two sets by the share of equal positions. LSH splits the signatures into bands,
+# and postings that share any band are candidates. Only candidates are compared,
+# and pairs at or above NEAR_DUP_THRESHOLD are merged into one cluster. The run is
+# near-linear in the number of postings and never does all-pairs work.
+DEDUP_FIELDS = ["Company", "Job_Title", "Description"]
+NEAR_DUPLICATES = True       # add Canonical_ID (saved-dataset row of each near-duplicate cluster's first posting)
+DROP_NEAR_DUPLICATES = False # also keep only the canonical row of every cluster
+NEAR_DUP_THRESHOLD = 0.8     # estimated Jaccard similarity that makes two postings duplicates
+MINHASH_PERMUTATIONS = 128   # signature length
+LSH_BANDS = 32               # bands of MINHASH_PERMUTATIONS / LSH_BANDS rows; more bands = more candidates
+SHINGLE_SIZE = 3             # words per shingle
+DEDUP_CHUNK_ROWS = 20000     # postings per signature batch / per worker task
+DEDUP_WORKERS = os.cpu_count() or 1
+DEDUP_SEED = 1
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+def minhash_params(permutations=None, seed=None):
+    """(a, b) uint64 arrays of the multiply-shift hash functions, one pair per signature position."""
+    rng = np.random.default_rng(DEDUP_SEED if seed is None else seed)
+    size = permutations or MINHASH_PERMUTATIONS
+    a = rng.integers(1, 2 ** 63, size=size, dtype=np.uint64) * np.uint64(2) + np.uint64(1)   # odd multipliers
+    b = rng.integers(0, 2 ** 63, size=size, dtype=np.uint64)
+    return a, b
+
+def shingle_hashes(texts, shingle_size=None):
+    """Flat uint64 array of every text's shingle hashes, plus the number of shingles per text.
+
+    Words are hashed once per batch (crc32, stable across processes). A shingle
+    hash mixes the hashes of its words. Texts shorter than a shingle get a
+    single shingle; texts without words get none.
+    """
+    k = shingle_size or SHINGLE_SIZE
+    word_hashes, lengths, token_cache = [], [], {}
+    for text in texts:
+        words = TOKEN_RE.findall(text.lower()) if isinstance(text, str) else []
+        if words and len(words) < k:
+            words = words + [""] * (k - len(words))
+        for word in words:
+            value = token_cache.get(word)
+            if value is None:
+                value = token_cache[word] = zlib.crc32(word.encode("utf-8"))
+            word_hashes.append(value)
+        lengths.append(len(words))
+    words = np.array(word_hashes, dtype=np.uint64)
+    lengths = np.array(lengths, dtype=np.int64)
+    counts = np.maximum(lengths - k + 1, 0)
+    # Shingle j of a text starts at word j: positions are the text's start offset plus 0..count-1.
+    starts = _gather_ranges(np.cumsum(lengths) - lengths, counts)
+    shingles = np.zeros(len(starts), dtype=np.uint64)
+    for offset in range(k):
+        shingles = shingles * np.uint64(0x100000001B3) + words[starts + offset]
+    return shingles, counts
+
+def minhash_batch(texts, shingle_size=None, permutations=None, seed=None):
+    """MinHash signatures (uint32, one row per text) for a batch of texts.
+
+    Texts without any word get a row of 0xFFFFFFFF and never match anything.
+    """
+    a, b = minhash_params(permutations, seed)
+    shingles, counts = shingle_hashes(texts, shingle_size)
+    # Built transposed (permutation x text) so each hash function reduces over contiguous memory.
+    signatures = np.full((len(a), len(counts)), np.iinfo(np.uint32).max, dtype=np.uint32)
+    has_shingles = np.flatnonzero(counts)
+    ends = np.cumsum(counts)[has_shingles]
+    a, b = a[:, None], b[:, None]
+    # Hash ~64K shingles at a time, in place, so the permutations x shingles matrix stays small.
+    # The hash is the top 32 bits of a * x + b; shifting is monotonic, so it is done after the min.
+    buffer = np.empty((len(a), 65536), dtype=np.uint64)
+    block_start, row = 0, 0
+    while row < len(has_shingles):
+        last = max(row + 1, np.searchsorted(ends, block_start + 65536, side="right"))
+        block_end = ends[last - 1]
+        block = shingles[block_start:block_end]
+        hashed = buffer[:, :len(block)] if len(block) <= buffer.shape[1] else np.empty((len(a), len(block)), np.uint64)
+        np.multiply(a, block, out=hashed)
+        hashed += b
+        offsets = np.concatenate(([0], ends[row:last - 1] - block_start))
+        signatures[:, has_shingles[row:last]] = np.minimum.reduceat(hashed, offsets, axis=1) >> np.uint64(32)
+        block_start, row = block_end, last
+    return np.ascontiguousarray(signatures.T)
+
+def minhash_signatures(texts, workers=None, chunk_rows=None, pool=None):
+    """MinHash signatures for all `texts`, computed in chunks, in parallel processes when it pays off."""
+    workers = DEDUP_WORKERS if workers is None else workers
+    results = map_batches(minhash_batch, texts, workers, chunk_rows or DEDUP_CHUNK_ROWS, pool)
+    if not results:
+        return np.empty((0, MINHASH_PERMUTATIONS), dtype=np.uint32)
+    return np.concatenate(results)
+
+def lsh_band_pairs(signatures, bands=None):
+    """Yield, band by band, (left, right) row arrays of rows that share that band.
+
+    Within a band, each row whose band equals another's is paired with one
+    row holding that band. This gives one pair per row per band rather than all
+    pairs of a bucket, and only one band's pairs exist at a time.
+    """
+    bands = bands or LSH_BANDS
+    width = signatures.shape[1]
+    rows_per_band = width // bands
+    valid = np.flatnonzero(signatures[:, 0] != np.iinfo(np.uint32).max)
+    band_values = signatures[valid]
+    mix = np.random.default_rng(DEDUP_SEED).integers(1, 2 ** 63, size=width, dtype=np.uint64) | np.uint64(1)
+    for band in range(bands):
+        cols = slice(band * rows_per_band, (band + 1) * rows_per_band)
+        keys = (band_values[:, cols].astype(np.uint64) * mix[cols]).sum(axis=1)
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        new_bucket = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+        leaders = order[np.flatnonzero(new_bucket)[np.cumsum(new_bucket) - 1]]
+        members = ~new_bucket
+        yield valid[leaders[members]], valid[order[members]]
+
+def cluster_labels(labels, left, right):
+    """Merge the clusters joined by the (left, right) edges; returns the new labels.
+
+    `labels[i]` is the smallest row of row i's cluster (np.arange(n) to start).
+    Each pass hooks the larger of an edge's two cluster roots onto the smaller,
+    then compresses label chains (pointer jumping). This is union-find with path
+    compression, vectorized, and each cluster stays labelled by its smallest row.
+    """
+    labels = labels.copy()
+    while True:
+        open_edges = labels[left] != labels[right]
+        if not open_edges.any():
+            return labels
+        left, right = left[open_edges], right[open_edges]
+        low = np.minimum(labels[left], labels[right])
+        np.minimum.at(labels, labels[left], low)
+        np.minimum.at(labels, labels[right], low)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+def dedup_texts(df, fields=None):
+    """The text compared for near-duplicates: the DEDUP_FIELDS of each row joined by " | "."""
+    fields = [col for col in (fields or DEDUP_FIELDS) if col in df.columns]
+    if not fields:
+        return pd.Series([None] * len(df), index=df.index, dtype=object)
+    texts = df[fields[0]].fillna("").astype(str)
+    for col in fields[1:]:
+        texts = texts + " | " + df[col].fillna("").astype(str)
+    return texts
+
+def canonical_ids(signatures, threshold=None):
+    """Canonical id (row position of the cluster's first posting) for each signature row,
+    and the number of similar pairs that merged clusters.
+
+    Signatures of any number of chunks can be concatenated first; only they,
+    not the texts, need to be in memory at once.
+    """
+    threshold = NEAR_DUP_THRESHOLD if threshold is None else threshold
+    labels = np.arange(len(signatures))
+    pairs = 0
+    for left, right in lsh_band_pairs(signatures):
+        # Pairs already in one cluster need no check. The rest are kept only if the whole
+        # signature agrees closely enough, checked 64K pairs at a time.
+        open_pairs = labels[left] != labels[right]
+        left, right = left[open_pairs], right[open_pairs]
+        similar = np.zeros(len(left), dtype=bool)
+        for start in range(0, len(left), 65536):
+            block = slice(start, start + 65536)
+            agree = (signatures[left[block]] == signatures[right[block]]).sum(axis=1)
+            similar[block] = agree >= threshold * signatures.shape[1]
+        pairs += int(similar.sum())
+        labels = cluster_labels(labels, left[similar], right[similar])
+    return labels, pairs
+
+def near_duplicate_ids(texts, threshold=None, workers=None):
+    """canonical_ids() of the MinHash signatures of `texts`."""
+    return canonical_ids(minhash_signatures(texts, workers=workers), threshold)
+
+def benchmark_near_duplicates(rows=150000, workers=None, seed=0):
+    """Cluster synthetic postings with planted reposts; print the time and how many were found."""
+    rng = random.Random(seed)
+    words = ["design", "develop", "maintain", "client", "reports", "testing", "support", "data", "team",
+             "modules", "apis", "customers", "documentation", "sales", "targets", "python", "sql", "cloud",
+             "excel", "payroll", "network", "security", "mobile", "android", "finance", "audit", "growth"]
+    texts, planted = [], 0
+    for i in range(rows):
+        if i and rng.random() < 0.1:
+            # Repost of an earlier posting with a couple of words swapped.
+            source = texts[rng.randrange(len(texts))].split()
+            for _ in range(2):
+                source[rng.randrange(len(source))] = rng.choice(words)
+            texts.append(" ".join(source))
+            planted += 1
+        else:
+            texts.append(f"company{rng.randrange(rows)} | " + " ".join(rng.choice(words) for _ in range(60)))
+    start = time.perf_counter()
+    ids, pairs = near_duplicate_ids(texts, workers=workers)
+    secs = time.perf_counter() - start
+    found = rows - len(np.unique(ids))
+    print(f"[BENCH] {rows} postings: {secs:.2f}s ({rows / secs:,.0f} rows/s), {pairs} similar pairs, "
+          f"{found} rows merged into earlier postings ({planted} reposts planted)")
+    return {"rows": rows, "secs": secs, "merged": found, "planted": planted}
+
+# --- Columnar sink: Parquet / Arrow IPC part files with dictionary-encoded columns ---
+class ColumnarWriter:
+    """Append record batches to a folder of Parquet (or Arrow IPC) part files.
+
+    Rows are buffered and written as part-NNNNN files of `chunk_rows` rows, so
+    the writer never holds more than one chunk. Columns are strings, except
+    NUMERIC_COLUMNS (float64) and INTEGER_COLUMNS (int64); CATEGORICAL_COLUMNS
+    are dictionary-encoded (read back as pandas categoricals).
+    """
+
+    def __init__(self, path, columns, fmt="parquet", chunk_rows=None, categorical=None, numeric=None):
+        import pyarrow as pa
+        self.pa = pa
+        self.path = path
+        self.columns = list(columns)
+        self.fmt = fmt
+        self.chunk_rows = chunk_rows or COLUMNAR_CHUNK_ROWS
+        categorical = set(CATEGORICAL_COLUMNS if categorical is None else categorical)
+        numeric = set(NUMERIC_COLUMNS if numeric is None else numeric)
+        self.schema = pa.schema([
+            (col, pa.float64() if col in numeric else pa.int64() if col in INTEGER_COLUMNS
+             else pa.dictionary(pa.int32(), pa.string()) if col in categorical else pa.string())
+            for col in self.columns])
+        self._buffer = []
+        self.parts = 0
+        self.rows = 0
+        if os.path.isdir(path):
+            for name in os.listdir(path):
+                if name.startswith("part-"):
+                    os.remove(os.path.join(path, name))
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, records):
+        """Add an iterable of record dicts, or a DataFrame."""
+        if isinstance(records, pd.DataFrame):
+            self.flush()
+            for start in range(0, len(records), self.chunk_rows):
+                self._write_frame(records.iloc[start:start + self.chunk_rows])
+            return
+        for record in records:
+            self._buffer.append(record)
+            if len(self._buffer) >= self.chunk_rows:
+                self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._write_frame(pd.DataFrame.from_records(self._buffer, columns=self.columns))
+            self._buffer = []
+
+    def _write_frame(self, df):
+        pa = self.pa
+        arrays = []
+        for field in self.schema:
+            values = df[field.name] if field.name in df.columns else pd.Series([None] * len(df), dtype=object)
+            if pa.types.is_floating(field.type) or pa.types.is_integer(field.type):
+                arrays.append(pa.array(pd.to_numeric(values, errors="coerce"), type=field.type, from_pandas=True))
+                continue
+            array = pa.array(values.astype("string"), type=pa.string(), from_pandas=True)
+            arrays.append(array.dictionary_encode() if pa.types.is_dictionary(field.type) else array)
+        table = pa.Table.from_arrays(arrays, schema=self.schema)
+        part_path = os.path.join(self.path, f"part-{self.parts:05d}.{self.fmt}")
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, part_path, compression="zstd")
+        else:
+            with pa.ipc.new_file(part_path, self.schema) as writer:
+                writer.write_table(table)
+        self.parts += 1
+        self.rows += len(df)
+
+    def close(self):
+        self.flush()
+
+def iter_columnar_batches(path, batch_rows=10000):
+    """Yield pyarrow RecordBatches from a Parquet / Arrow IPC part folder, in part order."""
+    import pyarrow as pa
+    for name in sorted(os.listdir(path)):
+        part_path = os.path.join(path, name)
+        if name.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            yield from pq.ParquetFile(part_path).iter_batches(batch_size=batch_rows)
+        elif name.endswith(".arrow"):
+            with pa.ipc.open_file(part_path) as reader:
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+
+def read_columnar(path):
+    """Load a columnar dataset written by ColumnarWriter into one DataFrame."""
+    import pyarrow as pa
+    batches = list(iter_columnar_batches(path))
+    if not batches:
+        return pd.DataFrame()
+    return pa.Table.from_batches(batches).to_pandas()
+
+EXCEL_MAX_ROWS = 1048576
+
+class ExcelSink:
+    """Stream rows into an .xlsx workbook with openpyxl's write-only mode.
+
+    A new sheet (with the header) starts whenever Excel's row limit is reached.
+    """
+
+    def __init__(self, path, header):
+        from openpyxl import Workbook
+        self.path = path
+        self.header = list(header)
+        self.wb = Workbook(write_only=True)
+        self.sheet = None
+        self.sheet_rows = 0
+        self.rows = 0
+
+    def append(self, rows):
+        """Add an iterable of row tuples."""
+        for row in rows:
+            if self.sheet is None or self.sheet_rows >= EXCEL_MAX_ROWS:
+                self.sheet = self.wb.create_sheet(f"Sheet{len(self.wb.worksheets) + 1}")
+                self.sheet.append(self.header)
+                self.sheet_rows = 1
+            self.sheet.append(list(row))
+            self.sheet_rows += 1
+            self.rows += 1
+
+    def write(self, df):
+        """Add a DataFrame chunk; missing values become empty cells."""
+        values = df.reindex(columns=self.header).astype(object)
+        self.append(values.where(values.notna(), None).itertuples(index=False, name=None))
+
+    def close(self):
+        if self.sheet is None:
+            self.wb.create_sheet("Sheet1").append(self.header)
+        self.wb.save(self.path)
+
+def export_excel(dataset_path, out_path):
+    """Downstream step: stream a columnar dataset into an .xlsx workbook, one batch at a time."""
+    sink = None
+    for batch in iter_columnar_batches(dataset_path):
+        if sink is None:
+            sink = ExcelSink(out_path, batch.schema.names)
+        sink.append(zip(*[col.to_pylist() for col in batch.columns]))
+    sink = sink or ExcelSink(out_path, [])
+    sink.close()
+    print(f"[EXPORT] Wrote {sink.rows} rows from {dataset_path} to {out_path}")
+    return out_path
+
+# --- Part 7: Final concatenation and saving (columnar dataset, optional Excel) ---
+def finalize_and_save(fresher_source, it_source, output_format=None, export_to_excel=None):
+    """Combine the fresher and IT rows (CSV paths or DataFrames) into the final dataset, streaming.
+
+    With NEAR_DUPLICATES the inputs are read twice: the first pass only computes
+    MinHash signatures (a Canonical_ID needs every row's signature), and the
+    second pass writes the rows.
+    """
+    output_format = output_format or OUTPUT_FORMAT
+    export_to_excel = EXPORT_EXCEL if export_to_excel is None else export_to_excel
+    if output_format in ("parquet", "arrow") and not has_module("pyarrow"):
+        print(f"[FINAL] pyarrow is not installed; falling back to Excel output instead of {output_format}")
+        output_format = "excel"
+
+    # Desired column order (from your original script); columns outside it (Posting_Time,
+    # Posting_Date, Qualification, Employment_Type, ...) are dropped as in the original.
+    columns_wanted = ["Company", "Industry", "Job_Title", "Experience", "Salary", "Location", "Description", "Skills", "URL"]
+    # Retain only available columns but keep order
+    available = set(frame_columns(fresher_source)) | set(frame_columns(it_source))
+    cols_present = [c for c in columns_wanted if c in available]
+
+    def combined_chunks(normalize=True):
+        # Fresher rows first, then IT rows, as pd.concat used to order them.
+        for source in (fresher_source, it_source):
+            for chunk in iter_frames(source):
+                chunk = chunk.reindex(columns=cols_present)
+                if normalize and NORMALIZE_FIELDS:
+                    chunk = normalize_salary_experience(chunk)
+                if normalize and CLASSIFY_FIELDS:
+                    chunk = classify_fields(chunk)
+                yield chunk
+
+    metrics = METRICS.stage("finalize")
+    canonical = None
+    if NEAR_DUPLICATES:
+        with metrics.timed("parse"), StagePool(DEDUP_WORKERS, DEDUP_CHUNK_ROWS) as pool:
+            signatures = [minhash_signatures(dedup_texts(chunk), pool=pool.get(len(chunk)))
+                          for chunk in combined_chunks(normalize=False)]
+            signatures = np.concatenate(signatures) if signatures else np.empty((0, MINHASH_PERMUTATIONS), np.uint32)
+            canonical, pairs = canonical_ids(signatures)
+        print(f"[DEDUP] {len(canonical)} rows form {len(np.unique(canonical))} near-duplicate clusters "
+              f"({pairs} similar pairs)")
+        keep = canonical == np.arange(len(canonical))
+        if DROP_NEAR_DUPLICATES:
+            # Canonical_ID is a row of the saved dataset, so renumber the rows that are kept.
+            canonical = (np.cumsum(keep) - 1)[canonical]
+    out_columns = (cols_present + (NORMALIZED_COLUMNS if NORMALIZE_FIELDS else [])
+                   + (CLASSIFIED_COLUMNS if CLASSIFY_FIELDS else [])
+                   + (["Canonical_ID"] if NEAR_DUPLICATES else []))
+
+    if output_format == "excel":
+        out_path = os.path.join(OUTPUT_DIR, "Timesjobs_data.xlsx")
+        sink = ExcelSink(out_path, out_columns)
     else:
-        print(f"[MAIN] Found existing listing file {listing_file}, skipping listing scrape (delete file to re-run).")
-
-    # 2) Scrape fresher details for first 100 URLs
-    details_file = os.path.join(OUTPUT_DIR, "timesjobs_job_details.csv")
-    if not os.path.exists(details_file):
-        df_freshers = scrape_fresher_details(listing_csv=listing_file, limit=FRESHER_DETAIL_LIMIT)
+        out_path = os.path.join(OUTPUT_DIR, f"Timesjobs_data.{output_format}")
+        sink = ColumnarWriter(out_path, out_columns, fmt=output_format)
+    skills_index = SkillsIndexBuilder() if SKILLS_INDEX_FILE else None
+    row = 0
+    for chunk in combined_chunks():
+        if canonical is not None:
+            span = slice(row, row + len(chunk))
+            row += len(chunk)
+            chunk["Canonical_ID"] = canonical[span]
+            if DROP_NEAR_DUPLICATES:
+                chunk = chunk[keep[span]]
+        # Row i of the skills index is row i of the saved dataset.
+        if skills_index is not None:
+            skills_index.add(chunk["Skills"] if "Skills" in chunk.columns else [None] * len(chunk))
+        with metrics.timed("write"):
+            sink.write(chunk)
+    with metrics.timed("write"):
+        sink.close()
+    rows = sink.rows
+    metrics.add("records", rows)
+    if canonical is not None and DROP_NEAR_DUPLICATES:
+        print(f"[DEDUP] Kept {rows} canonical rows")
+    if skills_index is not None:
+        with metrics.timed("write"):
+            save_skills_index(skills_index.finish(), os.path.join(OUTPUT_DIR, SKILLS_INDEX_FILE))
+
+    if output_format == "excel":
+        print(f"[FINAL] Saved {rows} combined rows to {out_path}")
+        return out_path
+    print(f"[FINAL] Saved {rows} combined rows to {out_path} ({sink.parts} part files)")
+    if export_to_excel:
+        with metrics.timed("write"):
+            export_excel(out_path, os.path.join(OUTPUT_DIR, "Timesjobs_data.xlsx"))
+    return out_path
+
+# --- Stage graph: content-hashed, incremental, independent branches in parallel ---
+# Every stage declares the stages it reads, the settings it depends on and the
+# code that produces its output. A stage's key hashes those settings, the source
+# of that code and the content hashes of its inputs' outputs. The key and the
+# hashes of the outputs are kept in STAGE_MANIFEST. A stage reruns only when its
+# key changed or its outputs are missing or were modified. A stage whose rerun
+# reproduces identical output therefore does not invalidate the stages after it.
+STAGE_MANIFEST = "stages.json"   # under OUTPUT_DIR
+STAGE_WORKERS = 2                # stages run at once (the fresher and IT chains are independent)
+
+def file_digest(path, known=None):
+    """sha256 of a file, or of a folder's files (name + content), with size / mtime for reuse.
+
+    `known` is an earlier result for the same path. If the size and mtime still
+    match, its hash is reused instead of re-reading the file.
+    """
+    if os.path.isdir(path):
+        files = sorted(os.path.join(root, name) for root, _, names in os.walk(path) for name in names)
     else:
-        print(f"[MAIN] Found existing fresher details file {details_file}, loading it.")
-        df_freshers = pd.read_csv(details_file)
-
-    # 3) Postprocess: fill qualification and extract job titles (if not already done)
-    # We'll only run if Job_Title is missing or Qualification missing in df_freshers
-    needs_post = True
-    if "Job_Title" in df_freshers.columns and df_freshers["Job_Title"].notna().all():
-        # if all titles present and qualification present, skip
-        if "Qualification" in df_freshers.columns and df_freshers["Qualification"].notna().all():
-            needs_post = False
-
-    if needs_post:
-        df_freshers = postprocess_freshers(df_freshers)
-
-    # 4) Extract Skills & Description from Job_Description text
-    df_freshers = extract_job_info_from_description(df_freshers)
-
-    # 5) Drop columns Posting_Time, Qualification, Employment_Type from fresher df (to mimic original)
-    for col in ["Posting_Time", "Qualification", "Employment_Type"]:
-        if col in df_freshers.columns:
-            df_freshers.drop(columns=[col], inplace=True, errors='ignore')
-
-    # Save intermediate final fresher file
+        files = [path]
+    size = sum(os.path.getsize(f) for f in files)
+    mtime = max((os.stat(f).st_mtime_ns for f in files), default=0)
+    if known and known.get("size") == size and known.get("mtime") == mtime:
+        return known
+    digest = hashlib.sha256()
+    for f in files:
+        digest.update(os.path.relpath(f, path).encode("utf-8") if f != path else b"")
+        with open(f, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(block)
+    return {"sha256": digest.hexdigest(), "size": size, "mtime": mtime}
+
+# Code that cannot change a stage's records: request pacing, metrics and runtime
+# caches. Changes to it do not invalidate stage outputs.
+FINGERPRINT_SKIP = {"TokenBucket", "AdaptiveRateLimiter", "SharedRateLimiter", "host_bucket",
+                    "retry_after_seconds", "Histogram", "StageMetrics", "RunMetrics", "METRICS", "CLASSIFIERS"}
+TABLE_TYPES = (list, tuple, dict, set, frozenset)
+
+def _is_module_code(obj):
+    """A function or class defined at the top level of this module."""
+    return ((inspect.isfunction(obj) or inspect.isclass(obj)) and obj.__module__ == __name__
+            and globals().get(obj.__name__) is obj)
+
+def _referenced_names(obj):
+    """Global names used by a function (including nested functions, lambdas and comprehensions) or class."""
+    if inspect.isclass(obj):
+        names = [base.__name__ for base in obj.__bases__]
+        for member in vars(obj).values():
+            member = getattr(member, "__func__", member)
+            for func in ([member.fget, member.fset] if isinstance(member, property) else [member]):
+                if inspect.isfunction(func):
+                    names.extend(_referenced_names(func))
+        return names
+    codes, names = [obj.__code__], []
+    while codes:
+        code = codes.pop()
+        names.extend(code.co_names)
+        codes.extend(const for const in code.co_consts if inspect.iscode(const))
+    return names
+
+def _table_items(table):
+    return [item for pair in table.items() for item in pair] if isinstance(table, dict) else list(table)
+
+def _stable_text(obj):
+    """Text for a constant that does not change between runs (no object addresses)."""
+    if _is_module_code(obj):
+        return obj.__qualname__
+    if isinstance(obj, re.Pattern):
+        return f"re.compile({obj.pattern!r}, {obj.flags})"
+    if isinstance(obj, dict):
+        return "{" + ", ".join(f"{_stable_text(k)}: {_stable_text(v)}" for k, v in obj.items()) + "}"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ", ".join(sorted(_stable_text(item) for item in obj)) + "}"
+    if isinstance(obj, (list, tuple)):
+        return "[" + ", ".join(_stable_text(item) for item in obj) + "]"
+    return repr(obj)
+
+def code_closure(objects):
+    """`objects` plus every module-level function, class, pattern and table they reach, as {name: object}.
+
+    Functions and classes are followed through the global names their code
+    uses, tables (lists, dicts, ...) through the functions and classes they
+    hold. Scalars are settings and belong in a stage's params; FINGERPRINT_SKIP
+    and private tables (runtime caches) are left out.
+    """
+    found, todo = {}, [(getattr(obj, "__qualname__", None) or _stable_text(obj), obj) for obj in objects]
+    while todo:
+        name, obj = todo.pop()
+        if name in found:
+            continue
+        found[name] = obj
+        if inspect.isfunction(obj) or inspect.isclass(obj):
+            refs = [(ref, globals().get(ref)) for ref in _referenced_names(obj)]
+        elif isinstance(obj, TABLE_TYPES):
+            refs = [(item.__name__, item) for item in _table_items(obj) if _is_module_code(item)]
+        else:
+            refs = []
+        for ref, value in refs:
+            if ref in FINGERPRINT_SKIP or ref in found:
+                continue
+            if (_is_module_code(value) or isinstance(value, re.Pattern)
+                    or (isinstance(value, TABLE_TYPES) and not ref.startswith("_"))):
+                todo.append((ref, value))
+    return found
+
+def code_fingerprint(objects):
+    """sha256 over the source of `objects` and of everything in their code_closure()."""
+    parts = []
+    for name, obj in code_closure(objects).items():
+        try:
+            text = inspect.getsource(obj)
+        except (OSError, TypeError):
+            text = _stable_text(obj)
+        parts.append((name, text))
+    digest = hashlib.sha256()
+    for name, text in sorted(parts):
+        digest.update(f"{name}\n{text}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+class StageGraphError(ValueError):
+    """Raised when the requested stages cannot run (unknown names, missing upstream output, a cycle)."""
+
+class Stage:
+    """One node of the pipeline graph.
+
+    `run(inputs)` gets {dependency name: its output paths}. A stage with fixed
+    `outputs` writes those files; one without returns the path(s) it wrote
+    (finalize's files depend on the settings) and cannot be adopted, so only
+    the last stage should leave them out. `params` are the settings
+    it depends on, and `code` is the functions, classes and patterns it runs.
+    `always` stages rerun every time (incremental crawls re-list the site).
+    The key covers `run` and `code` together with all the module code they
+    reach (code_closure), so `code` only needs what `run` does not name itself.
+    """
+
+    def __init__(self, name, run, inputs=(), outputs=(), params=None, code=(), always=False):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params or {}
+        self.code = list(code)
+        self.always = always
+
+    def key(self, input_digests):
+        payload = {"params": self.params, "code": code_fingerprint([self.run] + self.code),
+                   "inputs": input_digests}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+class StageGraph:
+    """Run Stages in dependency order, skipping those whose key and outputs are unchanged.
+
+    Ready stages run on a thread pool of `workers`, so independent branches
+    overlap. Each finished stage is written to the manifest straight away, so
+    an interrupted run keeps everything done so far. Outputs that exist but
+    were never recorded are adopted the first time, as the old file-exists
+    checks did; pass the stage name in `force` to redo it.
+    """
+
+    def __init__(self, stages, manifest_path=None, workers=None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.manifest_path = manifest_path or os.path.join(OUTPUT_DIR, STAGE_MANIFEST)
+        self.workers = workers or STAGE_WORKERS
+        self.lock = threading.Lock()
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as fh:
+                self.manifest = json.load(fh).get("stages", {})
+
+    def _save(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"stages": self.manifest}, fh, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _output_digests(self, paths, recorded=None):
+        """{path: digest} for `paths`, or None if any is missing."""
+        recorded = recorded or {}
+        if not all(os.path.exists(path) for path in paths):
+            return None
+        return {path: file_digest(path, recorded.get(path)) for path in paths}
+
+    def _record(self, name, key, paths):
+        entry = {"key": key, "outputs": self._output_digests(paths) or {},
+                 "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        with self.lock:
+            self.manifest[name] = entry
+            self._save()
+
+    def outputs(self, name):
+        return list(self.manifest.get(name, {}).get("outputs", {}))
+
+    def _input_digests(self, stage):
+        return {dep: {path: digest["sha256"] for path, digest in self.manifest[dep]["outputs"].items()}
+                for dep in stage.inputs}
+
+    def is_current(self, stage, key):
+        entry = self.manifest.get(stage.name)
+        if entry is None or entry["key"] != key:
+            return False
+        current = self._output_digests(list(entry["outputs"]), entry["outputs"])
+        if current is None:
+            return False
+        same = all(current[path]["sha256"] == old["sha256"] for path, old in entry["outputs"].items())
+        if same:
+            with self.lock:
+                self.manifest[stage.name]["outputs"] = current   # refreshed mtimes spare a re-hash next time
+        return same
+
+    def _adopt(self, name):
+        """Record the existing outputs of stage `name` (not being run) for the stages after it.
+
+        Returns False if they do not exist. The key is only known when every
+        stage it reads can be adopted too; otherwise it is left unset, so the
+        next full run redoes the stage.
+        """
+        if name in self.manifest:
+            return True
+        stage = self.stages[name]
+        if not stage.outputs or not all(os.path.exists(path) for path in stage.outputs):
+            return False
+        known = all([self._adopt(dep) for dep in stage.inputs])
+        print(f"[STAGES] {name}: adopting existing {', '.join(stage.outputs)}")
+        self._record(name, stage.key(self._input_digests(stage)) if known else None, stage.outputs)
+        return True
+
+    def mark_done(self, names):
+        """Record the current outputs of `names` as up to date (their files were produced elsewhere)."""
+        for name in names:
+            stage = self.stages[name]
+            self._record(name, stage.key(self._input_digests(stage)), stage.outputs)
+
+    def _run_stage(self, stage, force):
+        key = stage.key(self._input_digests(stage))
+        if stage.name not in force and not stage.always:
+            if self.is_current(stage, key):
+                print(f"[STAGES] {stage.name}: up to date, skipping")
+                return False
+            if (stage.name not in self.manifest and stage.outputs
+                    and all(os.path.exists(path) for path in stage.outputs)):
+                print(f"[STAGES] {stage.name}: adopting existing {', '.join(stage.outputs)} "
+                      f"(pass --rerun {stage.name} to redo it)")
+                self._record(stage.name, key, stage.outputs)
+                return False
+        print(f"[STAGES] {stage.name}: running")
+        inputs = {dep: self.outputs(dep) for dep in stage.inputs}
+        with METRICS.run(stage.name):
+            result = stage.run(inputs)
+        paths = stage.outputs or ([result] if isinstance(result, str) else list(result))
+        self._record(stage.name, key, paths)
+        return True
+
+    def run(self, force=(), only=None):
+        """Run every stage that is out of date. Returns the names of the stages that ran.
+
+        With `only`, just those stages are considered; the stages they read
+        are taken as they are on disk, even if out of date.
+        """
+        force = set(force)
+        unknown = (force | set(only or ())) - set(self.stages)
+        if unknown:
+            raise StageGraphError(f"unknown stage(s) {sorted(unknown)}; stages are {list(self.stages)}")
+        done, ran, running = set(), [], {}
+        if only is not None:
+            done = set(self.stages) - set(only)
+            for name in only:
+                for dep in self.stages[name].inputs:
+                    if dep in done and not self._adopt(dep):
+                        raise StageGraphError(f"stage {dep} has no output yet; run it (or the whole pipeline) first")
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while len(done) < len(self.stages):
+                for stage in self.stages.values():
+                    if (stage.name not in done and stage.name not in running.values()
+                            and all(dep in done for dep in stage.inputs)):
+                        running[pool.submit(self._run_stage, stage, force)] = stage.name
+                if not running:
+                    raise StageGraphError("stage graph has a cycle or an unknown input")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        for other in running:
+                            other.cancel()
+                        raise future.exception()
+                    done.add(name)
+                    if future.result():
+                        ran.append(name)
+        return ran
+
+def save_fresher_final(source):
+    """Drop Posting_Time, Qualification, Employment_Type from the fresher rows (to mimic original)."""
     fresher_final_path = os.path.join(OUTPUT_DIR, "jobs_freshers_final.csv")
-    df_freshers.to_csv(fresher_final_path, index=False)
+    with CsvSink(fresher_final_path) as sink:
+        for df_freshers in iter_frames(source):
+            sink.write(df_freshers.drop(columns=["Posting_Time", "Qualification", "Employment_Type"],
+                                        errors="ignore"))
     print(f"[MAIN] Saved fresher final CSV to {fresher_final_path}")
+    return fresher_final_path
+
+def build_stage_graph():
+    """The scraping pipeline as a StageGraph, using the current settings."""
+    out = lambda name: os.path.join(OUTPUT_DIR, name)
+    # (incremental runs always re-list and re-check details; only new postings are fetched)
+    crawl = dict(always=INCREMENTAL)
+    # Stage keys cover the code each run reaches (code_closure) plus the parser
+    # backend, since lxml/selectolax can parse sloppy markup differently.
+    parser = parser_backend()
+    stages = [
+        # Fresher chain (mobile site)
+        Stage("fresher_listing", lambda inputs: scrape_fresher_listing_pages(FRESHER_PAGES),
+              outputs=[out("timesjobs_job_urls.csv")],
+              params={"pages": FRESHER_PAGES, "url": FRESHER_SEARCH_URL, "stop_after": LISTING_STOP_AFTER,
+                      "probe": LISTING_PROBE, "parser": parser}, **crawl),
+        Stage("fresher_details",
+              lambda inputs: scrape_fresher_details(listing_csv=inputs["fresher_listing"][0],
+                                                    limit=FRESHER_DETAIL_LIMIT, refresh=REFRESH),
+              inputs=["fresher_listing"], outputs=[out("timesjobs_job_details.csv")],
+              params={"limit": FRESHER_DETAIL_LIMIT, "parser": parser}, **crawl),
+        Stage("postprocess", lambda inputs: postprocess_freshers(inputs["fresher_details"][0]),
+              inputs=["fresher_details"], outputs=[out("jobs_freshers.csv")], params={"parser": parser}),
+        Stage("extract", lambda inputs: extract_job_info_from_description(inputs["postprocess"][0]),
+              inputs=["postprocess"], outputs=[out("jobs_freshers_parsed.csv")]),
+        Stage("fresher_final", lambda inputs: save_fresher_final(inputs["extract"][0]),
+              inputs=["extract"], outputs=[out("jobs_freshers_final.csv")]),
+        # IT chain (desktop site)
+        Stage("it_listing", lambda inputs: get_it_job_urls(IT_SEARCH_URL, num_pages=IT_PAGES),
+              outputs=[out("timesjobs_ITjob_URL.csv")],
+              params={"pages": IT_PAGES, "url": IT_SEARCH_URL, "stop_after": LISTING_STOP_AFTER,
+                      "probe": LISTING_PROBE, "parser": parser}, **crawl),
+        Stage("it_details",
+              lambda inputs: scrape_it_job_details(it_urls_csv=inputs["it_listing"][0], refresh=REFRESH),
+              inputs=["it_listing"], outputs=[out("timesjobs_ITjobs.csv")], params={"parser": parser}, **crawl),
+        # Final concatenation & save (columnar dataset, optional Excel export)
+        Stage("finalize", lambda inputs: finalize_outputs(inputs["fresher_final"][0], inputs["it_details"][0]),
+              inputs=["fresher_final", "it_details"],
+              params={"format": OUTPUT_FORMAT, "excel": EXPORT_EXCEL, "normalize": NORMALIZE_FIELDS,
+                      "near_duplicates": [NEAR_DUPLICATES, DROP_NEAR_DUPLICATES, NEAR_DUP_THRESHOLD,
+                                          MINHASH_PERMUTATIONS, LSH_BANDS, SHINGLE_SIZE, DEDUP_FIELDS],
+                      "skills_index": SKILLS_INDEX_FILE, "categorical": CATEGORICAL_COLUMNS,
+                      "classify": CLASSIFY_FIELDS}),
+    ]
+    return StageGraph(stages)
+
+def finalize_outputs(fresher_csv, it_csv):
+    """finalize_and_save plus the list of every file it wrote (for the stage manifest)."""
+    out_path = finalize_and_save(fresher_csv, it_csv)
+    paths = [out_path]
+    for extra in ([SKILLS_INDEX_FILE] if SKILLS_INDEX_FILE else []) + (
+            ["Timesjobs_data.xlsx"] if EXPORT_EXCEL and not out_path.endswith(".xlsx") else []):
+        path = os.path.join(OUTPUT_DIR, extra)
+        if os.path.exists(path):
+            paths.append(path)
+    return paths
 
-    # 6) Scrape IT job listing pages (200 pages) - unless the file exists
-    it_listing_file = os.path.join(OUTPUT_DIR, "timesjobs_ITjob_URL.csv")
-    if not os.path.exists(it_listing_file):
-        base_it_url = ("https://www.timesjobs.com/candidate/job-search.html?"
-                       "searchType=personalizedSearch&from=submit&txtKeywords=software+engineer&txtLocation=")
-        get_it_job_urls(base_it_url, num_pages=IT_PAGES)
-    else:
-        print(f"[MAIN] Found existing IT listing file {it_listing_file}, skipping IT listing scrape.")
-
-    # 7) Scrape IT job details (from saved IT listing CSV)
-    it_details_file = os.path.join(OUTPUT_DIR, "timesjobs_ITjobs.csv")
-    if not os.path.exists(it_details_file):
-        df_it = scrape_it_job_details(it_urls_csv=it_listing_file)
-    else:
-        print(f"[MAIN] Found existing IT details file {it_details_file}, loading it.")
-        df_it = pd.read_csv(it_details_file)
-
-    # 8) Final concatenation & save to Excel
-    finalize_and_save(df_freshers, df_it)
-
-    print("[MAIN] All done.")
+# --- main flow ---
+def run_all_stages(only=None):
+    # Stages hand each other CSV paths; each reruns only when its inputs, settings or code changed.
+    graph = build_stage_graph()
+    if only:
+        # One stage (or a few) on the files already on disk; nothing upstream is re-crawled.
+        ran = graph.run(force=set(only) | set(RERUN_STAGES), only=only)
+        print(f"[MAIN] Done ({', '.join(ran)}).")
+        return
+    if QUEUE_WORKERS:
+        # Listing and detail scraping run on the work queue; its CSVs become those stages' outputs.
+        # The queue always crawls everything: it does not consult the frontier or send validators.
+        if INCREMENTAL or REFRESH:
+            raise ValueError("incremental / refresh crawls are not supported in queue mode (--workers)")
+        with METRICS.run("queue_crawl"):
+            run_queue_crawl(QUEUE_WORKERS, QUEUE_PATH)
+        graph.mark_done(["fresher_listing", "fresher_details", "it_listing", "it_details"])
+    ran = graph.run(force=RERUN_STAGES)
+    print(f"[MAIN] All done ({len(ran)} of {len(graph.stages)} stages ran).")
+
+def main(only=None):
+    # The run report is written even when a stage fails, so the failed run can be compared too.
+    if METRICS_PORT:
+        METRICS.serve(METRICS_PORT, METRICS_HOST)
+    try:
+        run_all_stages(only)
+    finally:
+        METRICS.write_report()
+
+# --- Command line ---
+# With no command the whole pipeline runs as before. A command runs only its
+# stage(s), always, reading what earlier stages left in OUTPUT_DIR.
+STAGE_COMMANDS = {
+    "list-fresher": (["fresher_listing"], "crawl the fresher search pages into timesjobs_job_urls.csv"),
+    "details-fresher": (["fresher_details"], "scrape fresher details into timesjobs_job_details.csv"),
+    "postprocess": (["postprocess"], "fill missing fresher Qualification / Job_Title"),
+    "extract": (["extract", "fresher_final"], "extract Skills / Description, then save jobs_freshers_final.csv"),
+    "list-it": (["it_listing"], "crawl the IT search pages into timesjobs_ITjob_URL.csv"),
+    "details-it": (["it_details"], "scrape IT details into timesjobs_ITjobs.csv"),
+    "finalize": (["finalize"], "combine, normalize, classify and dedup into the final dataset"),
+}
+
+def add_settings_arguments(parser, suppress=False):
+    """Flags that override the module settings, on the main parser and on every command.
+
+    Commands get SUPPRESS defaults, so a flag given after the command overrides
+    the one given before it and an absent flag leaves it alone.
+    """
+    default = (lambda value: argparse.SUPPRESS) if suppress else (lambda value: value)
+    parser.add_argument("--output-dir", metavar="DIR", default=default(OUTPUT_DIR),
+                        help="folder for every CSV, journal, cache and the final dataset")
+    parser.add_argument("--fresher-pages", type=int, metavar="N", default=default(FRESHER_PAGES),
+                        help="most fresher search pages to crawl")
+    parser.add_argument("--it-pages", type=int, metavar="N", default=default(IT_PAGES),
+                        help="most IT search pages to crawl")
+    parser.add_argument("--detail-limit", type=int, metavar="N", default=default(FRESHER_DETAIL_LIMIT),
+                        help="fresher postings to scrape details for")
+    parser.add_argument("--replay", action="store_true", default=default(False),
+                        help="serve every request from the HTML cache (no network)")
+    parser.add_argument("--no-cache", action="store_true", default=default(False),
+                        help="do not store fetched pages in the HTML cache")
+    parser.add_argument("--incremental", action="store_true", default=default(False),
+                        help="re-run listings and only scrape postings not scraped in an earlier run")
+    parser.add_argument("--refresh", action="store_true", default=default(False),
+                        help="re-check previously scraped postings with conditional GETs (implies --incremental)")
+    parser.add_argument("--output-format", choices=["parquet", "arrow", "excel"], default=default(OUTPUT_FORMAT),
+                        help="format of the final combined dataset")
+    parser.add_argument("--excel", action="store_true", default=default(False),
+                        help="also export the columnar dataset to Timesjobs_data.xlsx")
+    parser.add_argument("--parser", choices=["auto", "lxml", "html.parser", "selectolax"],
+                        default=default(PARSER_BACKEND), help="HTML parser backend")
+    parser.add_argument("--prometheus-file", metavar="FILE", default=default(PROMETHEUS_FILE),
+                        help="also write the run metrics as Prometheus text to FILE (under the output folder)")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT", default=default(METRICS_PORT),
+                        help="serve Prometheus metrics on PORT while the run is going")
+    parser.add_argument("--metrics-host", metavar="HOST", default=default(METRICS_HOST),
+                        help="interface for --metrics-port (default 127.0.0.1; 0.0.0.0 for every interface)")
+    parser.add_argument("--probe-pages", action="store_true", default=default(False),
+                        help="find the last listing page by probing, then fetch all listing pages concurrently")
+    parser.add_argument("--rerun", action="append", metavar="STAGE", default=default(list(RERUN_STAGES)),
+                        help="redo STAGE even if its inputs are unchanged (repeatable), e.g. --rerun it_details")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scrape TimesJobs fresher and IT postings.")
+    add_settings_arguments(parser)
+    parser.add_argument("--workers", type=int, metavar="N", default=QUEUE_WORKERS,
+                        help="crawl listings and details with N worker processes sharing a work queue "
+                             "(a full crawl; not with --incremental / --refresh)")
+    parser.add_argument("--queue", metavar="PATH", default=QUEUE_PATH,
+                        help="work-queue SQLite file (on a shared disk to add workers on other machines)")
+    parser.add_argument("--worker-only", action="store_true",
+                        help="only work the queue given by --queue (another machine seeds and merges it)")
+    parser.add_argument("--benchmark-extract", type=int, metavar="ROWS", nargs="?", const=150000,
+                        help="benchmark Skills/Description extraction on ROWS synthetic descriptions and exit")
+    parser.add_argument("--benchmark-dedup", type=int, metavar="ROWS", nargs="?", const=150000,
+                        help="benchmark near-duplicate detection on ROWS synthetic postings and exit")
+    parser.add_argument("--benchmark-classify", type=int, metavar="ROWS", nargs="?", const=150000,
+                        help="benchmark Industry/title/skill binning on ROWS synthetic rows and exit")
+    parser.add_argument("--check-parser-parity", action="store_true",
+                        help="compare --parser against the reference parser on every cached page and exit")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", title="commands",
+                                     description="run one stage on the files already in the output folder "
+                                                 "(default: the whole pipeline)")
+    for command, (_, help_text) in STAGE_COMMANDS.items():
+        add_settings_arguments(commands.add_parser(command, help=help_text, description=help_text), suppress=True)
+    args = parser.parse_args()
+    OUTPUT_DIR = args.output_dir
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    FRESHER_PAGES = args.fresher_pages
+    IT_PAGES = args.it_pages
+    FRESHER_DETAIL_LIMIT = args.detail_limit
+    REPLAY = args.replay
+    INCREMENTAL = args.incremental or args.refresh
+    REFRESH = args.refresh
+    OUTPUT_FORMAT = args.output_format
+    EXPORT_EXCEL = args.excel
+    PARSER_BACKEND = args.parser
+    PROMETHEUS_FILE = args.prometheus_file
+    METRICS_PORT = args.metrics_port
+    METRICS_HOST = args.metrics_host
+    RERUN_STAGES = args.rerun
+    LISTING_PROBE = args.probe_pages or LISTING_PROBE
+    QUEUE_WORKERS = args.workers
+    QUEUE_PATH = args.queue
+    if QUEUE_WORKERS and INCREMENTAL and not args.command:
+        parser.error("--incremental / --refresh cannot be combined with --workers (queue mode always crawls everything)")
+    if args.no_cache:
+        HTML_CACHE_DIR = None
+    if args.benchmark_extract:
+        sys.exit(0 if benchmark_description_extraction(args.benchmark_extract)["identical"] else 1)
+    if args.benchmark_dedup:
+        benchmark_near_duplicates(args.benchmark_dedup)
+        sys.exit(0)
+    if args.benchmark_classify:
+        sys.exit(0 if benchmark_keyword_classifier(args.benchmark_classify)["identical"] else 1)
+    if args.check_parser_parity:
+        mismatches = check_parser_parity()
+        sys.exit(0 if mismatches == 0 else 1)
+    if args.worker_only:
+        worker = f"{socket.gethostname()}-{os.getpid()}"
+        try:
+            with METRICS.run("queue_crawl"):
+                run_queue_worker(QUEUE_PATH, worker)
+        finally:
+            METRICS.write_report(os.path.join(OUTPUT_DIR, f"run_report.{worker}.json"))
+        sys.exit(0)
+    try:
+        main(STAGE_COMMANDS[args.command][0] if args.command else None)
+    except StageGraphError as e:
+        sys.exit(f"[MAIN] {e}")